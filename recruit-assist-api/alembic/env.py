@@ -12,7 +12,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 # Import app models and database
 from app.database import Base, get_database_url
-from app.db_models import Candidate, CandidateProfile, JobPosting
+from app.db_models import Candidate, CandidateProfile, JobPosting, POSTGRESQL_INDEXES
 
 # This is the Alembic Config object
 config = context.config
@@ -28,12 +28,18 @@ if config.config_file_name is not None:
 target_metadata = Base.metadata
 
 
+def include_object(object, name, type_, reflected, compare_to):
+    """Skip the PostgreSQL-only indexes app.database.ensure_schema creates, so autogenerate doesn't drop them."""
+    return not (type_ == "index" and reflected and name in POSTGRESQL_INDEXES)
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -52,7 +58,7 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata, include_object=include_object
         )
 
         with context.begin_transaction():
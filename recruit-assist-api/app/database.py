@@ -7,7 +7,8 @@ Uses SQLAlchemy ORM with PostgreSQL.
 from __future__ import annotations
 import logging
 from typing import Generator
-from sqlalchemy import create_engine, MetaData
+from sqlalchemy import create_engine, event, inspect, text, MetaData
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 logger = logging.getLogger(__name__)
@@ -15,14 +16,29 @@ logger = logging.getLogger(__name__)
 # Database URL - will be set from settings at runtime
 def get_database_url() -> str:
     """Get database URL from settings."""
-    from app.settings import settings
-    return settings.database_url
+    from app.settings import get_settings
+    return get_settings().database_url
+
+
+def get_query_cache_size() -> int:
+    """Get the compiled statement cache size from settings."""
+    from app.settings import get_settings
+    return get_settings().db_query_cache_size
 
 
 def get_debug_mode() -> bool:
     """Get debug mode from settings."""
-    from app.settings import settings
-    return settings.debug
+    from app.settings import get_settings
+    return get_settings().debug
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Use WAL journaling on SQLite: readers don't block the writer, and with
+    synchronous=NORMAL a commit no longer fsyncs the database file."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
 
 
 # Create engine with connection pooling (lazy initialization)
@@ -43,8 +59,10 @@ def get_engine():
             engine = create_engine(
                 db_url,
                 connect_args=connect_args,
+                query_cache_size=get_query_cache_size(),
                 echo=get_debug_mode(),
             )
+            event.listen(engine, "connect", _set_sqlite_pragmas)
         else:
             # PostgreSQL configuration
             engine = create_engine(
@@ -52,6 +70,12 @@ def get_engine():
                 pool_pre_ping=True,  # Verify connections before using
                 pool_size=10,  # Connection pool size
                 max_overflow=20,  # Max overflow connections
+                # Hand out the most recently used connection first: it has warm
+                # server-side caches, and surplus ones idle out instead of rotating
+                pool_use_lifo=True,
+                # Compiled SQL is cached per statement shape; sized so the services'
+                # fixed query set (lookups, listings, upserts) never evicts
+                query_cache_size=get_query_cache_size(),
                 echo=get_debug_mode(),  # Log SQL queries in debug mode
             )
     return engine
@@ -87,11 +111,44 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def ensure_schema(conn) -> None:
+    """
+    Create indexes (and PostgreSQL extras) missing from existing tables. Safe to run repeatedly.
+    
+    create_all and the autogenerated Alembic migration only create indexes along
+    with a new table, so databases created by an older version never get indexes
+    added to the models later, including the unique indexes the upserts use as
+    ON CONFLICT targets. A unique index can't be built while duplicate rows exist.
+    """
+    from app.db_models import JSONB_PROFILE_COLUMNS, POSTGRESQL_INDEXES
+    
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+    
+    if conn.dialect.name != "postgresql":
+        return
+    
+    conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    # Profile JSON columns predating JSONB must be converted before they can be GIN-indexed
+    columns = {c["name"]: c["type"] for c in inspect(conn).get_columns("candidate_profiles")}
+    for column in JSONB_PROFILE_COLUMNS:
+        if not isinstance(columns[column], JSONB):
+            conn.execute(text(
+                f"ALTER TABLE candidate_profiles ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb"
+            ))
+    for statement in POSTGRESQL_INDEXES.values():
+        conn.execute(text(statement))
+
+
 def init_db() -> None:
     """Initialize database by creating all tables."""
     logger.info("Initializing database...")
     eng = get_engine()
-    Base.metadata.create_all(bind=eng)
+    # One connection and transaction for the whole schema
+    with eng.begin() as conn:
+        Base.metadata.create_all(bind=conn)
+        ensure_schema(conn)
     logger.info("Database initialized successfully")
 
 
@@ -8,16 +8,53 @@ Defines database tables for:
 """
 
 from __future__ import annotations
+import enum
 import uuid
 import json
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, Text, JSON, ForeignKey, Index
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, Text, JSON, ForeignKey, Index, Enum, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import relationship, declarative_base
+from sqlalchemy.sql.expression import FunctionElement
 from app.database import Base
 
 
+class utcnow(FunctionElement):
+    """Database-side current UTC time as a naive timestamp, matching datetime.utcnow() values."""
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow, "postgresql")
+def _pg_utcnow(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+
+# Concatenated text searched by the job listing endpoint. Shared verbatim between the
+# trigram index below and the query filter so Postgres can match the index expression.
+JOB_POSTING_SEARCH_EXPR = "title || ' ' || coalesce(client, '') || ' ' || coalesce(department, '')"
+
+# JSON stored as JSONB on PostgreSQL, so the column can be GIN-indexed for containment (@>) queries
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
+
+class ProfileStatus(str, enum.Enum):
+    """Lifecycle status of a candidate profile."""
+    ACTIVE = "active"
+    SHORTLISTED = "shortlisted"
+    REJECTED = "rejected"
+    HIRED = "hired"
+    ARCHIVED = "archived"
+
+
 class TimestampMixin:
     """Mixin for created_at and updated_at timestamps."""
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
@@ -131,7 +168,7 @@ class CandidateProfile(Base, TimestampMixin):
     interview_transcript = Column(Text, nullable=True)
     
     # Interview insights (stored as JSON)
-    interview_data = Column(JSON, nullable=True)  # {motivation, target_comp, location_prefs, top_skills, risks, etc.}
+    interview_data = Column(JSONDocument, nullable=True)  # {motivation, target_comp, location_prefs, top_skills, risks, etc.}
     
     # Booking data
     booking_link = Column(String(500), nullable=True)  # Calendar booking link
@@ -155,14 +192,20 @@ class CandidateProfile(Base, TimestampMixin):
     # Match data (if linked to a job posting)
     job_posting_id = Column(UUID(as_uuid=True), ForeignKey("job_postings.id", ondelete="SET NULL"), nullable=True, index=True)
     match_score = Column(Float, nullable=True)  # 0.0 to 1.0
-    match_details = Column(JSON, nullable=True)  # {skills_match, experience_match, location_match, etc.}
+    match_details = Column(JSONDocument, nullable=True)  # {skills_match, experience_match, location_match, etc.}
     
     # Status
-    status = Column(String(50), default="active", nullable=False, index=True)  # active, shortlisted, rejected, hired, archived
+    status = Column(
+        Enum(ProfileStatus, name="profile_status", values_callable=lambda statuses: [s.value for s in statuses]),
+        default=ProfileStatus.ACTIVE,
+        nullable=False,
+        index=True
+    )
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # Stamped by the database on every UPDATE (ORM and bulk), so service code never sets it
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=utcnow(), nullable=False)
     
     # Relationships
     candidate = relationship("Candidate", back_populates="profiles")
@@ -174,6 +217,17 @@ class CandidateProfile(Base, TimestampMixin):
         Index("idx_profile_job", "job_posting_id"),
         Index("idx_profile_status", "status"),
         Index("idx_profile_match_score", "match_score"),
+        # One profile per candidate/job; also the conflict target for bulk match upserts
+        Index("idx_profile_candidate_job", "candidate_id", "job_posting_id", unique=True),
+        # Non-archived profiles per candidate, newest first, returned in index order without a sort.
+        # The per-job listing index needs NULLS LAST and is in POSTGRESQL_INDEXES below.
+        Index(
+            "idx_profile_candidate_created",
+            "candidate_id",
+            text("created_at DESC"),
+            postgresql_where=text("status <> 'archived'"),
+            sqlite_where=text("status <> 'archived'"),
+        ),
     )
     
     def __repr__(self) -> str:
@@ -241,8 +295,45 @@ class JobPosting(Base, TimestampMixin):
         Index("idx_job_location", "primary_location_country", "primary_location_city"),
         Index("idx_job_status", "status"),
         Index("idx_job_urgency", "hiring_urgency"),
+        Index("idx_job_created_id", "created_at", "id"),  # Keyset pagination
+        # At most one active posting per client/title; also the conflict target for upserts
+        Index(
+            "idx_job_active_client_title",
+            "client",
+            "title",
+            unique=True,
+            postgresql_where=text("status = 'active'"),
+            sqlite_where=text("status = 'active'"),
+        ),
     )
     
     def __repr__(self) -> str:
         return f"<JobPosting(id={self.id}, title={self.title}, client={self.client})>"
 
+
+# JSON columns stored as JSONB on PostgreSQL and GIN-indexed for containment (@>) lookups
+JSONB_PROFILE_COLUMNS = ("match_details", "interview_data")
+
+# PostgreSQL-only indexes the model metadata can't express, keyed by name. Each statement is
+# idempotent; app.database.ensure_schema runs them for new databases and existing ones alike.
+POSTGRESQL_INDEXES = {
+    # Non-archived profiles per job, best match first (get_profiles_by_job's ORDER BY and keyset).
+    # SQLite can't index NULLS LAST.
+    "idx_profile_job_match_score": (
+        "CREATE INDEX IF NOT EXISTS idx_profile_job_match_score ON candidate_profiles "
+        "(job_posting_id, match_score DESC NULLS LAST, id DESC) WHERE status <> 'archived'"
+    ),
+    # Trigram GIN index backing ILIKE '%term%' search on job postings (needs the pg_trgm extension)
+    "idx_job_search_trgm": (
+        "CREATE INDEX IF NOT EXISTS idx_job_search_trgm ON job_postings "
+        f"USING gin (({JOB_POSTING_SEARCH_EXPR}) gin_trgm_ops)"
+    ),
+    # jsonb_path_ops is smaller than the default operator class and supports @>, the only operator needed here
+    **{
+        f"idx_profile_{column}_gin": (
+            f"CREATE INDEX IF NOT EXISTS idx_profile_{column}_gin ON candidate_profiles "
+            f"USING gin ({column} jsonb_path_ops)"
+        )
+        for column in JSONB_PROFILE_COLUMNS
+    },
+}
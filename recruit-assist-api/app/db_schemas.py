@@ -9,6 +9,7 @@ from datetime import datetime
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, EmailStr, Field, ConfigDict
 from uuid import UUID
+from app.db_models import ProfileStatus
 from app.models import CandidateCVNormalized, JobDescriptionNormalized
 
 
@@ -96,7 +97,7 @@ class CandidateProfileUpdate(BaseModel):
     endorsement_fit_score: Optional[float] = None
     match_score: Optional[float] = None
     match_details: Optional[Dict[str, Any]] = None
-    status: Optional[str] = None
+    status: Optional[ProfileStatus] = None
 
 
 class CandidateProfileResponse(CandidateProfileBase):
@@ -106,7 +107,7 @@ class CandidateProfileResponse(CandidateProfileBase):
     match_score: Optional[float] = None
     endorsement_recommendation: Optional[str] = None
     endorsement_fit_score: Optional[float] = None
-    status: str
+    status: ProfileStatus
     created_at: datetime
     updated_at: datetime
     
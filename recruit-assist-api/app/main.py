@@ -1,5 +1,8 @@
 from __future__ import annotations
 import logging
+import logging.handlers
+import queue
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -11,21 +14,59 @@ from app.exceptions import (
     RecruitAssistException, ParseError, ValidationError, LLMError, FileError,
     handle_parse_error, handle_validation_error, handle_llm_error, handle_file_error
 )
+from app.services import matching_service
+from app.services.linkedin_service import linkedin_service
 
-# Configure logging for intent classification review
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging for intent classification review.
+# While the app is running, records go through a queue so handler I/O happens
+# on the listener thread, not in request handlers or webhook workers. Outside
+# the lifespan (imports from tests and tools) they go straight to the stream.
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_log_stream_handler])
+
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_log_queue_handler.setFormatter(logging.Formatter('%(message)s'))  # final formatting is done by the listener
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream_handler)
 
 logger = logging.getLogger(__name__)
 
 
+def _start_log_listener() -> None:
+    """Route root logging through the queue and start its listener thread."""
+    _log_listener.start()
+    root = logging.getLogger()
+    root.removeHandler(_log_stream_handler)
+    root.addHandler(_log_queue_handler)
+
+
+def _stop_log_listener() -> None:
+    """Log straight to the stream again, then drain the queue and stop the listener."""
+    root = logging.getLogger()
+    root.removeHandler(_log_queue_handler)
+    root.addHandler(_log_stream_handler)
+    _log_listener.stop()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start and stop shared resources (log listener, pooled HTTP clients, background workers)."""
+    _start_log_listener()
+    linkedin_service.start_webhook_workers()
+    yield
+    await linkedin_service.stop_webhook_workers()
+    await linkedin_service.aclose()
+    matching_service.shutdown_process_pool()
+    _stop_log_listener()
+
+
 def create_app() -> FastAPI:
     app = FastAPI(
         title="Recruit Assist API",
         version="0.1.0",
-        description="Skeleton API for CV ingest, JD normalization, and endorsement generation."
+        description="Skeleton API for CV ingest, JD normalization, and endorsement generation.",
+        lifespan=lifespan,
     )
 
     app.add_middleware(
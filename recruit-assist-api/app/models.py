@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import List, Optional, Literal
+import functools
+import string
+from typing import Callable, List, Optional, Literal
 from pydantic import BaseModel, Field, AnyUrl, EmailStr
 from datetime import date, datetime
 
@@ -154,6 +156,34 @@ class EndorsementOut(BaseModel):
 
 # ---------- Tone Profile ----------
 
+@functools.lru_cache(maxsize=256)
+def compile_template(template: str) -> Callable[..., str]:
+    """
+    Parse a str.format template once into a render function.
+    
+    Plain {name} fields are rendered by joining the literal chunks with the
+    looked-up values; templates using format specs, conversions or attribute
+    and index access fall back to str.format. Either way the result matches
+    template.format(**values).
+    """
+    parts = list(string.Formatter().parse(template))
+    if any(spec or conversion or (name is not None and not name.isidentifier())
+           for _, name, spec, conversion in parts):
+        return template.format
+
+    chunks = tuple((literal, name) for literal, name, _, _ in parts)
+
+    def render(**values: object) -> str:
+        out = []
+        for literal, name in chunks:
+            out.append(literal)
+            if name is not None:
+                out.append(str(values[name]))
+        return "".join(out)
+
+    return render
+
+
 class ToneProfile(BaseModel):
     persona_name: str = "Jean from Bershaw"
     company: str = "Bershaw"
@@ -180,3 +210,7 @@ class ToneProfile(BaseModel):
         "polite_ack": "Thanks for the quick reply, {first_name}."
     })
 
+    def render(self, template_key: str, **values: object) -> str:
+        """Render one of the templates; parsed templates are cached by their text."""
+        return compile_template(self.templates[template_key])(**values)
+
@@ -1,6 +1,6 @@
 from __future__ import annotations
 import logging
-from fastapi import APIRouter, UploadFile, File, Query, Depends
+from fastapi import APIRouter, UploadFile, File, Query, Depends, Response
 from sqlalchemy.orm import Session
 from app.models import CandidateCVNormalized
 from app.database import get_db
@@ -20,6 +20,7 @@ ALLOWED_EXTENSIONS = {".pdf", ".docx", ".doc", ".txt"}
 
 @router.post("/cv", response_model=CandidateCVNormalized)
 async def ingest_cv(
+    response: Response,
     file: UploadFile = File(...),
     use_llm: bool = Query(False, description="Use LLM-based extraction (requires OPENAI_API_KEY)"),
     save_to_db: bool = Query(False, description="Save parsed CV to database"),
@@ -32,6 +33,8 @@ async def ingest_cv(
     - Default: Uses stub parser (returns mock data for demo)
     - With ?use_llm=true: Uses LLM-based extraction from actual CV content
       (requires OPENAI_API_KEY to be set in environment)
+    - With ?save_to_db=true: Saves the candidate to database and returns its
+      ID in the `X-Candidate-Id` response header
     
     **File Requirements:**
     - Maximum size: 10MB
@@ -77,6 +80,7 @@ async def ingest_cv(
                 try:
                     candidate = create_candidate(db, cv_data, consent_granted=consent_granted)
                     logger.info(f"Saved candidate to database: {candidate.id} ({candidate.full_name})")
+                    response.headers["X-Candidate-Id"] = str(candidate.id)
                 except Exception as e:
                     logger.error(f"Failed to save candidate to database: {e}", exc_info=e)
                     # Don't fail the request if database save fails
@@ -8,8 +8,9 @@ from __future__ import annotations
 import logging
 from typing import Optional, List
 from uuid import UUID
-from fastapi import APIRouter, Depends, Query, HTTPException, status, Body
+from fastapi import APIRouter, Depends, Query, HTTPException, status, Body, Response
 from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
 
 from app.database import get_db
 from app.db_schemas import JobPostingResponse, JobPostingDetail, JobPostingCreate, JobPostingUpdate
@@ -17,9 +18,12 @@ from app.services.job_posting_service import (
     get_job_posting,
     get_job_postings,
     create_job_posting,
+    create_job_postings_bulk,
     update_job_posting,
     delete_job_posting,
-    job_posting_db_to_response
+    job_posting_db_to_response,
+    encode_job_cursor,
+    decode_job_cursor,
 )
 
 logger = logging.getLogger(__name__)
@@ -30,6 +34,7 @@ router = APIRouter(prefix="/jobs", tags=["jobs"])
 @router.post("/", response_model=JobPostingDetail, status_code=status.HTTP_201_CREATED)
 async def create_job(
     job_data: JobPostingCreate = Body(...),
+    upsert: bool = Query(False, description="Update the existing active posting with the same client and title"),
     db: Session = Depends(get_db)
 ) -> JobPostingDetail:
     """
@@ -40,16 +45,25 @@ async def create_job(
     
     **Returns:**
     - Created job posting with all details
+    - `409 Conflict` if an active posting with the same client and title exists (unless `upsert=true`)
     """
     try:
         job_posting = create_job_posting(
             db=db,
             jd=job_data.jd_data,
-            original_text=None  # Can be added to JobPostingCreate schema if needed
+            original_text=None,  # Can be added to JobPostingCreate schema if needed
+            upsert=upsert,
         )
         
         return job_posting_db_to_response(job_posting, detailed=True)
     
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="An active job posting with this client and title already exists"
+        )
+    
     except Exception as e:
         logger.error(f"Error creating job posting: {e}", exc_info=e)
         raise HTTPException(
@@ -58,10 +72,51 @@ async def create_job(
         )
 
 
+@router.post("/bulk", status_code=status.HTTP_201_CREATED)
+async def create_jobs_bulk(
+    jobs_data: List[JobPostingCreate] = Body(...),
+    upsert: bool = Query(False, description="Update existing active postings with the same client and title"),
+    db: Session = Depends(get_db)
+) -> dict:
+    """
+    Create multiple job postings from normalized JD data in one batch.
+    
+    **Input:**
+    - List of objects with `jd_data`: JobDescriptionNormalized (required)
+    
+    **Returns:**
+    - IDs of the created job postings, in input order
+    """
+    try:
+        job_ids = create_job_postings_bulk(db=db, jds=[j.jd_data for j in jobs_data], upsert=upsert)
+        
+        return {
+            "success": True,
+            "created": len(job_ids),
+            "job_ids": [str(job_id) for job_id in job_ids]
+        }
+    
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="One or more active job postings with the same client and title already exist"
+        )
+    
+    except Exception as e:
+        logger.error(f"Error creating job postings in bulk: {e}", exc_info=e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create job postings: {str(e)}"
+        )
+
+
 @router.get("/", response_model=List[JobPostingResponse])
 async def list_jobs(
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
     search: Optional[str] = Query(None, description="Search term (searches title, client, department)"),
     status: Optional[str] = Query(None, description="Filter by status (active, closed, filled, archived)"),
     client: Optional[str] = Query(None, description="Filter by client name"),
@@ -82,12 +137,20 @@ async def list_jobs(
     **Pagination:**
     - `skip`: Number of records to skip (default: 0)
     - `limit`: Maximum number of records (default: 100, max: 1000)
+    - `cursor`: Keyset cursor for the next page (preferred over `skip` for deep pages).
+      A full page sets the `X-Next-Cursor` response header.
     """
+    try:
+        keyset = decode_job_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
     try:
         jobs = get_job_postings(
             db=db,
             skip=skip,
             limit=limit,
+            cursor=keyset,
             search=search,
             status=status,
             client=client,
@@ -95,6 +158,9 @@ async def list_jobs(
             hiring_urgency=hiring_urgency,
         )
         
+        if len(jobs) == limit:
+            response.headers["X-Next-Cursor"] = encode_job_cursor(jobs[-1])
+        
         return [job_posting_db_to_response(j, detailed=False) for j in jobs]
     
     except Exception as e:
@@ -174,6 +240,13 @@ async def update_job_detail(
     except HTTPException:
         raise
     
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="An active job posting with this client and title already exists"
+        )
+    
     except Exception as e:
         logger.error(f"Error updating job posting: {e}", exc_info=e)
         raise HTTPException(
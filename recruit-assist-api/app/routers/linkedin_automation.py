@@ -8,7 +8,7 @@ Note: LinkedIn has strict automation policies - use with caution.
 from __future__ import annotations
 import logging
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Body
+from fastapi import APIRouter, Depends, HTTPException, status, Body, Header, Request
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
 
@@ -68,7 +68,7 @@ async def send_connection_request(
                 detail="LinkedIn API not enabled or configured. Please set up LinkedIn API credentials."
             )
         
-        result = linkedin_service.send_connection_request(
+        result = await linkedin_service.send_connection_request(
             recipient_urn=request.recipient_urn,
             message=request.message,
             note=request.note
@@ -125,7 +125,7 @@ async def send_message(
                 detail="LinkedIn API not enabled or configured. Please set up LinkedIn API credentials."
             )
         
-        result = linkedin_service.send_message(
+        result = await linkedin_service.send_message(
             recipient_urn=request.recipient_urn,
             message_text=request.message_text,
             subject=request.subject
@@ -154,38 +154,52 @@ async def send_message(
         )
 
 
-@router.post("/webhook")
+@router.post("/webhook", status_code=status.HTTP_202_ACCEPTED)
 async def handle_linkedin_webhook(
+    request: Request,
     payload: WebhookPayload = Body(...),
+    x_li_signature: Optional[str] = Header(None, alias="X-LI-Signature"),
     db: Session = Depends(get_db)
 ) -> dict:
     """
-    Handle incoming LinkedIn webhook events.
+    Accept incoming LinkedIn webhook events for background processing.
     
     **Events:**
     - `MESSAGE_RECEIVED` - Incoming message
     - `CONNECTION_ACCEPTED` - Connection accepted
     - `MESSAGE_READ` - Message read receipt
     
+    Events are queued and acknowledged immediately with `202 Accepted`; reply
+    routing runs in background workers. Returns `503` when the queue is full so
+    LinkedIn redelivers the event later.
+    
+    When `LINKEDIN_WEBHOOK_SECRET` is set, the `X-LI-Signature` header must be
+    the hex HMAC-SHA256 of the raw body, otherwise `401` is returned.
+    
     **Note:** Requires webhook configuration in LinkedIn developer portal.
     """
-    try:
-        result = linkedin_service.handle_webhook(payload.data)
-        
-        logger.info(f"Processed LinkedIn webhook: {payload.event_type}")
-        
-        return {
-            "success": True,
-            "event_type": payload.event_type,
-            "result": result
-        }
+    if linkedin_service.webhook_signing_enabled:
+        raw_body = await request.body()
+        if not linkedin_service.verify_webhook_signature(raw_body, x_li_signature):
+            logger.warning("Rejected LinkedIn webhook with invalid signature")
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid webhook signature"
+            )
     
-    except Exception as e:
-        logger.error(f"Error handling LinkedIn webhook: {e}", exc_info=e)
+    if not linkedin_service.enqueue_webhook(payload.data):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to handle webhook: {str(e)}"
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Webhook queue unavailable, please retry later"
         )
+    
+    logger.info("Queued LinkedIn webhook: %s", payload.event_type)
+    
+    return {
+        "success": True,
+        "event_type": payload.event_type,
+        "result": {"status": "queued"}
+    }
 
 
 @router.get("/message/{message_id}/status")
@@ -201,7 +215,7 @@ async def get_message_status(
                 detail="LinkedIn API not enabled or configured."
             )
         
-        status_result = linkedin_service.track_message_status(message_id)
+        status_result = await linkedin_service.track_message_status(message_id)
         
         return {
             "success": True,
@@ -245,7 +259,7 @@ async def extract_profile_data(
                 detail="LinkedIn API not enabled or configured."
             )
         
-        profile_data = linkedin_service.get_profile_data(profile_url)
+        profile_data = await linkedin_service.get_profile_data(profile_url)
         
         if not profile_data:
             raise HTTPException(
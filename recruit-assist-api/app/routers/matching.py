@@ -10,12 +10,13 @@ from typing import List, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, Query, HTTPException, status, Body
 from sqlalchemy.orm import Session
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from app.database import get_db
 from app.db_models import Candidate, JobPosting, CandidateProfile
 from app.services.matching_service import (
     match_candidate_to_job,
+    match_candidates_bulk,
     calculate_match_score,
     match_all_candidates_to_job,
     match_candidate_to_all_jobs
@@ -104,6 +105,56 @@ async def create_match(
         )
 
 
+class BulkMatchRequest(BaseModel):
+    """Schema for bulk match request."""
+    candidate_ids: List[UUID] = Field(..., min_length=1, max_length=1000)
+
+
+@router.post("/jobs/{job_id}/candidates/match", response_model=dict)
+async def create_bulk_match(
+    job_id: UUID,
+    request: BulkMatchRequest = Body(...),
+    db: Session = Depends(get_db)
+) -> dict:
+    """
+    Match many candidates to a job posting and create/update their profiles.
+    
+    All profiles are written in one transaction, instead of one `POST /match`
+    call (and commit) per candidate. Unknown candidate IDs are skipped.
+    
+    **Returns:**
+    - Match score and percentage per matched candidate, in request order
+    """
+    try:
+        results = match_candidates_bulk(db, request.candidate_ids, job_id)
+        return {
+            "success": True,
+            "job_id": str(job_id),
+            "matched": len(results),
+            "matches": [
+                {
+                    "candidate_id": str(candidate_id),
+                    "match_score": round(match_score, 3),
+                    "match_percentage": round(match_score * 100, 1),
+                }
+                for candidate_id, match_score, _ in results
+            ],
+        }
+    
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    
+    except Exception as e:
+        logger.error(f"Error bulk matching candidates to job: {e}", exc_info=e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to match candidates to job: {str(e)}"
+        )
+
+
 @router.get("/jobs/{job_id}/candidates", response_model=List[MatchResult])
 async def get_job_candidates(
     job_id: UUID,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 import logging
-from fastapi import APIRouter, Query, Depends
+from fastapi import APIRouter, Query, Depends, Response
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field, field_validator, model_validator
 from typing import Optional
@@ -49,6 +49,7 @@ class JDNormalizeIn(BaseModel):
 @router.post("/jd", response_model=JobDescriptionNormalized)
 async def normalize_jd_endpoint(
     payload: JDNormalizeIn,
+    response: Response,
     use_llm: bool = Query(False, description="Use LLM-based extraction (requires OPENAI_API_KEY)"),
     save_to_db: bool = Query(False, description="Save normalized JD to database"),
     db: Session = Depends(get_db)
@@ -60,6 +61,8 @@ async def normalize_jd_endpoint(
     - With ?use_llm=true: Uses LLM-based extraction from actual JD text
       (requires OPENAI_API_KEY to be set in environment)
     - With ?save_to_db=true: Saves normalized JD to database as a job posting
+      (updating the active posting with the same client and title, if any)
+      and returns its ID in the `X-Job-Id` response header
     
     **Input Validation:**
     - Text length: Maximum 100KB
@@ -110,12 +113,15 @@ async def normalize_jd_endpoint(
                     currency=payload.currency or "GBP"
                 )
             
-            # Save to database if requested
+            # Save to database if requested; re-normalizing a JD for the same client
+            # and title updates that active posting instead of hitting its unique index
             if save_to_db:
                 try:
-                    job_posting = create_job_posting(db, jd_data, original_text=payload.text)
+                    job_posting = create_job_posting(db, jd_data, original_text=payload.text, upsert=True)
                     logger.info(f"Saved job posting to database: {job_posting.id} ({job_posting.title} at {job_posting.client})")
+                    response.headers["X-Job-Id"] = str(job_posting.id)
                 except Exception as e:
+                    db.rollback()
                     logger.error(f"Failed to save job posting to database: {e}", exc_info=e)
                     # Don't fail the request if database save fails
                     # Return the normalized JD data anyway
@@ -10,11 +10,13 @@ import logging
 from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
-from fastapi import APIRouter, Depends, Query, HTTPException, status, Body
+from fastapi import APIRouter, Depends, Query, HTTPException, Response, status, Body
 from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
 from pydantic import BaseModel, Field
 
 from app.database import get_db
+from app.db_models import ProfileStatus
 from app.db_schemas import (
     CandidateProfileCreate,
     CandidateProfileUpdate,
@@ -27,6 +29,8 @@ from app.services.profile_service import (
     get_profiles_by_candidate,
     get_profiles_by_job,
     get_profile_by_candidate_and_job,
+    encode_profile_cursor,
+    decode_profile_cursor,
     update_profile,
     update_profile_endorsement,
     update_profile_interview,
@@ -80,6 +84,7 @@ async def create_profile_endpoint(
     
     **Returns:**
     - Created profile with all details
+    - 409 if a profile for the same candidate and job posting already exists
     """
     try:
         profile = create_profile(db, profile_data)
@@ -91,6 +96,13 @@ async def create_profile_endpoint(
             detail=str(e)
         )
     
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A profile for this candidate and job posting already exists"
+        )
+    
     except Exception as e:
         logger.error(f"Error creating profile: {e}", exc_info=e)
         raise HTTPException(
@@ -103,7 +115,7 @@ async def create_profile_endpoint(
 async def list_profiles(
     candidate_id: Optional[UUID] = Query(None, description="Filter by candidate ID"),
     job_id: Optional[UUID] = Query(None, description="Filter by job posting ID"),
-    status: Optional[str] = Query(None, description="Filter by status (active, shortlisted, rejected, hired, archived)"),
+    status: Optional[ProfileStatus] = Query(None, description="Filter by status (active, shortlisted, rejected, hired, archived)"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records"),
     db: Session = Depends(get_db)
@@ -186,7 +198,7 @@ async def get_profile_endpoint(
 @router.get("/candidates/{candidate_id}/profiles", response_model=List[CandidateProfileResponse])
 async def get_candidate_profiles(
     candidate_id: UUID,
-    status: Optional[str] = Query(None, description="Filter by status"),
+    status: Optional[ProfileStatus] = Query(None, description="Filter by status"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     db: Session = Depends(get_db)
@@ -212,19 +224,34 @@ async def get_candidate_profiles(
 @router.get("/jobs/{job_id}/profiles", response_model=List[CandidateProfileResponse])
 async def get_job_profiles(
     job_id: UUID,
-    status: Optional[str] = Query(None, description="Filter by status"),
+    response: Response,
+    status: Optional[ProfileStatus] = Query(None, description="Filter by status"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
     db: Session = Depends(get_db)
 ) -> List[CandidateProfileResponse]:
     """
     Get all profiles for a job posting.
     
+    **Pagination:**
+    - `cursor`: Keyset cursor for the next page (preferred over `skip` for deep pages).
+      A full page sets the `X-Next-Cursor` response header.
+    
     **Returns:**
     - List of profiles sorted by match_score (best matches first)
     """
     try:
-        profiles = get_profiles_by_job(db, job_id, status=status, skip=skip, limit=limit)
+        keyset = decode_profile_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    try:
+        profiles = get_profiles_by_job(db, job_id, status=status, skip=skip, limit=limit, cursor=keyset)
+        
+        if len(profiles) == limit:
+            response.headers["X-Next-Cursor"] = encode_profile_cursor(profiles[-1])
+        
         return [profile_db_to_response(p, detailed=False) for p in profiles]
     
     except Exception as e:
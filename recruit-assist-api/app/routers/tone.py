@@ -4,6 +4,7 @@ from app.models import ToneProfile
 
 router = APIRouter(prefix="/tone", tags=["tone"])
 _TONE = ToneProfile()  # replace with persistent storage later
+VERSION = 0  # bumped on every update so readers can cache _TONE
 
 @router.get("/profile", response_model=ToneProfile)
 async def get_tone() -> ToneProfile:
@@ -11,6 +12,7 @@ async def get_tone() -> ToneProfile:
 
 @router.post("/profile", response_model=ToneProfile)
 async def set_tone(profile: ToneProfile) -> ToneProfile:
-    global _TONE
+    global _TONE, VERSION
     _TONE = profile
+    VERSION += 1
     return _TONE
@@ -19,35 +19,34 @@ def _load_prompt_template() -> str:
         return "Generate a concise candidate endorsement based on the CV, JD, and interview data provided."
 
 
-def _check(requirement: str, cv: CandidateCVNormalized) -> Tuple[str, str]:
+# (original name, lowercased name) pairs for a CV's skills and its experience technologies
+_Terms = List[Tuple[str, str]]
+
+
+def _cv_terms(cv: CandidateCVNormalized) -> Tuple[_Terms, _Terms]:
+    """Lowercase the CV's skill and technology names once, for checking every requirement."""
+    skills = [(s.name, s.name.lower()) for s in cv.skills]
+    techs = [(t, t.lower()) for exp in cv.experience for t in (exp.technologies or [])]
+    return skills, techs
+
+
+def _check(requirement: str, terms: Tuple[_Terms, _Terms]) -> Tuple[str, str]:
     """Return tuple (mark, evidence) where mark in {'✔','△','✖'} and short evidence."""
+    skills, techs = terms
     req_lower = requirement.lower()
-    evidence = ""
 
     # Naive signal: skills + technologies strings (bidirectional matching)
-    skill_hits = [s.name for s in cv.skills if s.name and (s.name.lower() in req_lower or req_lower in s.name.lower())]
-    tech_hits = []
-    for exp in cv.experience:
-        for t in (exp.technologies or []):
-            if t.lower() in req_lower or req_lower in t.lower():
-                tech_hits.append(t)
-
-    if skill_hits or tech_hits:
-        evidence = f"{', '.join(skill_hits + tech_hits)}"
-        return "✔", evidence
+    hits = [name for name, lower in skills if name and (lower in req_lower or req_lower in lower)]
+    hits += [name for name, lower in techs if lower in req_lower or req_lower in lower]
+    if hits:
+        return "✔", ", ".join(hits)
 
     # partial: if any token overlaps (bidirectional)
     tokens = [w for w in req_lower.replace("(", " ").replace(")", " ").replace("/", " ").replace("&", " ").split() if len(w) > 2]
-    skill_token_hits = [s.name for s in cv.skills if any(tok in s.name.lower() or s.name.lower() in tok for tok in tokens)]
-    tech_token_hits = []
-    for exp in cv.experience:
-        for t in (exp.technologies or []):
-            if any(tok in t.lower() or t.lower() in tok for tok in tokens):
-                tech_token_hits.append(t)
-    
-    if skill_token_hits or tech_token_hits:
-        evidence = f"{', '.join(skill_token_hits + tech_token_hits)}"
-        return "△", evidence
+    hits = [name for name, lower in skills if any(tok in lower or lower in tok for tok in tokens)]
+    hits += [name for name, lower in techs if any(tok in lower or lower in tok for tok in tokens)]
+    if hits:
+        return "△", ", ".join(hits)
 
     return "✖", ""
 
@@ -91,15 +90,16 @@ def _write_endorsement_rule_based(
     loc_pref = interview.location_prefs or (cv.candidate.location.remote_preference if cv.candidate.location and cv.candidate.location.remote_preference else "Unknown")
 
     # Fit checks
+    terms = _cv_terms(cv)
     lines: List[str] = []
     must_have_marks: List[str] = []
     for req in jd.requirements.must_haves[:4]:
-        mark, ev = _check(req.name, cv)
+        mark, ev = _check(req.name, terms)
         must_have_marks.append(mark)
         ev_txt = f' (evidence: "{ev}")' if ev else ""
         lines.append(f"- {req.name}: {mark} — {('meets' if mark=='✔' else 'partial' if mark=='△' else 'missing')}{ev_txt}")
     for req in jd.requirements.nice_to_haves[:2]:
-        mark, ev = _check(req.name, cv)
+        mark, ev = _check(req.name, terms)
         ev_txt = f' (evidence: "{ev}")' if ev else ""
         lines.append(f"- {req.name}: {mark} — {('meets' if mark=='✔' else 'partial' if mark=='△' else 'missing')}{ev_txt}")
 
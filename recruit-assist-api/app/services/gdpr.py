@@ -11,9 +11,15 @@ Handles:
 """
 
 from __future__ import annotations
+import atexit
 import json
 import hashlib
-from datetime import datetime, timedelta
+import queue
+import sys
+import threading
+import time
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any, List
 from pathlib import Path
 import logging
@@ -23,6 +29,99 @@ logger = logging.getLogger(__name__)
 # Default retention period: 2 years (730 days) - GDPR allows "reasonable" retention
 DEFAULT_RETENTION_DAYS = 730
 
+# Audit log buffering: entries are flushed as one JSONL batch every interval,
+# or sooner once the buffer passes the threshold
+AUDIT_FLUSH_INTERVAL_SECONDS = 0.1
+AUDIT_FLUSH_THRESHOLD = 1024
+
+
+def _format_ts(ns: int) -> str:
+    """Format an epoch-nanosecond timestamp as a naive UTC ISO 8601 string."""
+    return datetime.fromtimestamp(ns / 1_000_000_000, tz=timezone.utc).replace(tzinfo=None).isoformat()
+
+
+@dataclass(slots=True, frozen=True)
+class AuditEntry:
+    """A single GDPR audit log entry (ts_ns is epoch nanoseconds, formatted on export)."""
+    ts_ns: int
+    action: str
+    cv_id: Optional[str] = None
+    user_id: Optional[str] = None
+    details: Dict[str, Any] = field(default_factory=dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Export the entry with its timestamp formatted as ISO 8601."""
+        data = asdict(self)
+        data["timestamp"] = _format_ts(data.pop("ts_ns"))
+        return data
+
+
+class AuditLogBuffer:
+    """
+    In-memory buffer of audit entries drained by a background thread.
+    
+    Avoids formatting and emitting a log record per audit event on the request
+    path; the flusher writes each batch as a single JSONL log record. The queue
+    is unbounded: an audit trail must not drop entries when the flusher falls behind.
+    """
+    
+    def __init__(
+        self,
+        flush_interval: float = AUDIT_FLUSH_INTERVAL_SECONDS,
+        flush_threshold: int = AUDIT_FLUSH_THRESHOLD,
+    ):
+        self._entries: queue.SimpleQueue[AuditEntry] = queue.SimpleQueue()
+        self._flush_interval = flush_interval
+        self._flush_threshold = flush_threshold
+        self._wakeup = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+    
+    def append(self, entry: AuditEntry) -> None:
+        """Queue an entry, starting the flusher thread on first use."""
+        if self._thread is None:
+            self._start()
+        self._entries.put(entry)
+        if self._entries.qsize() >= self._flush_threshold:
+            self._wakeup.set()
+    
+    def flush(self) -> int:
+        """Emit all queued entries as one log record. Returns the number flushed."""
+        batch = []
+        with self._lock:
+            try:
+                while True:
+                    batch.append(self._entries.get_nowait())
+            except queue.Empty:
+                pass
+        if batch:
+            logger.info(
+                "GDPR audit log batch (%d entries)\n%s",
+                len(batch),
+                "\n".join(json.dumps(entry.to_dict(), default=str) for entry in batch),
+            )
+        return len(batch)
+    
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="gdpr-audit-flusher", daemon=True)
+            self._thread.start()
+        atexit.register(self.flush)
+    
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait(self._flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:  # Never let the flusher thread die
+                logger.exception("GDPR audit log flush failed")
+
+
+audit_buffer = AuditLogBuffer()
+
 
 class GDPRCompliance:
     """
@@ -89,10 +188,12 @@ class GDPRCompliance:
         cv_id: Optional[str] = None,
         user_id: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+    ) -> AuditEntry:
         """
         Create an audit log entry for GDPR compliance.
         
+        Entries are buffered and written in batches by the audit flusher thread.
+        
         Actions:
         - 'upload': CV uploaded
         - 'access': CV data accessed
@@ -102,15 +203,15 @@ class GDPRCompliance:
         - 'consent_given': Consent recorded
         - 'consent_withdrawn': Consent withdrawn
         """
-        log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "action": action,
-            "cv_id": cv_id,
-            "user_id": user_id,
-            "details": details or {},
-        }
+        log_entry = AuditEntry(
+            ts_ns=time.time_ns(),
+            action=sys.intern(action),
+            cv_id=cv_id,
+            user_id=user_id,
+            details=details or {},
+        )
         
-        logger.info(f"GDPR audit log: {action}", extra=log_entry)
+        audit_buffer.append(log_entry)
         return log_entry
     
     def create_consent_record(
@@ -129,14 +230,15 @@ class GDPRCompliance:
         - 'data_sharing': Sharing with third parties
         - 'marketing': Marketing communications
         """
+        now = datetime.utcnow()
         return {
             "email": email,
             "email_hash": self.hash_personal_data(email),
             "consent_type": consent_type,
             "granted": granted,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now.isoformat(),
             "source": source,
-            "expiry_date": (datetime.utcnow() + timedelta(days=self.retention_days)).isoformat() if granted else None,
+            "expiry_date": (now + timedelta(days=self.retention_days)).isoformat() if granted else None,
         }
     
     def validate_consent(self, consent_record: Dict[str, Any]) -> bool:
@@ -2,6 +2,36 @@ from __future__ import annotations
 from typing import Optional
 from app.models import JobDescriptionNormalized, JobCore, Requirements, RequirementItem, PrimaryLocation, SalaryBand
 
+# Demo defaults, validated once at import. Returned JDs share the RequirementItem
+# instances with these templates, so treat them as read-only.
+_DEMO_MUST_HAVES = (
+    RequirementItem(name="Node.js & TypeScript", weight=0.25),
+    RequirementItem(name="AWS (Lambda/ECS/RDS)", weight=0.25),
+    RequirementItem(name="SQL & data modelling", weight=0.15)
+)
+_DEMO_NICE_TO_HAVES = (RequirementItem(name="Kafka/event-driven", weight=0.05), RequirementItem(name="Kubernetes", weight=0.05))
+
+_DEMO_REQUIREMENTS = Requirements(
+    must_haves=list(_DEMO_MUST_HAVES),
+    nice_to_haves=list(_DEMO_NICE_TO_HAVES),
+    years_experience_min=5
+)
+
+_DEMO_JOB = JobCore(
+    title="Senior Backend Engineer",
+    client="RetailTech Ltd",
+    department="Engineering",
+    location_policy="hybrid",
+    onsite_days_per_week=2,
+    primary_location=PrimaryLocation(city="Manchester", country="UK"),
+    salary_band=SalaryBand(min=85000, max=95000, currency="GBP", period="year"),
+    visa_sponsorship="case_by_case",
+    hiring_urgency="this_quarter",
+)
+
+_DEMO_JD = JobDescriptionNormalized(job=_DEMO_JOB, requirements=_DEMO_REQUIREMENTS, role_notes="Normalized from free text JD.")
+
+
 # Very light heuristic normaliser from free text
 def normalize_jd(
     text: Optional[str] = None,
@@ -15,17 +45,20 @@ def normalize_jd(
     salary_max: Optional[float] = None,
     currency: Optional[str] = "GBP",
 ) -> JobDescriptionNormalized:
-    # Fallbacks for demo
-    title = title or "Senior Backend Engineer"
-    client = client or "RetailTech Ltd"
-    location_policy = location_policy or "hybrid"
+    # Fresh lists per call so callers can't grow the shared template
+    reqs = _DEMO_REQUIREMENTS.model_copy(update={
+        "must_haves": list(_DEMO_MUST_HAVES),
+        "nice_to_haves": list(_DEMO_NICE_TO_HAVES),
+    })
 
-    musts = [
-        RequirementItem(name="Node.js & TypeScript", weight=0.25),
-        RequirementItem(name="AWS (Lambda/ECS/RDS)", weight=0.25),
-        RequirementItem(name="SQL & data modelling", weight=0.15)
-    ]
-    nices = [RequirementItem(name="Kafka/event-driven", weight=0.05), RequirementItem(name="Kubernetes", weight=0.05)]
+    if not any((title, client, location_policy, city, country, salary_min, salary_max)) and currency == "GBP":
+        # Pure demo path: copy the prebuilt template instead of re-validating it
+        return _DEMO_JD.model_copy(update={"job": _DEMO_JOB.model_copy(), "requirements": reqs})
+
+    # Fallbacks for demo
+    title = title or _DEMO_JOB.title
+    client = client or _DEMO_JOB.client
+    location_policy = location_policy or _DEMO_JOB.location_policy
 
     job = JobCore(
         title=title,
@@ -39,11 +72,4 @@ def normalize_jd(
         hiring_urgency="this_quarter",
     )
 
-    reqs = Requirements(
-        must_haves=musts,
-        nice_to_haves=nices,
-        years_experience_min=5
-    )
-
-    return JobDescriptionNormalized(job=job, requirements=reqs, role_notes="Normalized from free text JD.")
-
+    return _DEMO_JD.model_copy(update={"job": job, "requirements": reqs})
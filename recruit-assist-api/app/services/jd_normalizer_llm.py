@@ -31,6 +31,37 @@ For salary, extract numeric values and currency. If only one figure is given, us
 For requirements, identify key skills, technologies, and qualifications. Assign weights based on emphasis in the text.
 Output valid JSON matching the JobDescriptionNormalized schema."""
 
+# Output schema appended to the system prompt so the prompt prefix is identical on every
+# call (lets OpenAI prompt caching reuse it); only the JD text and hints vary per request.
+JD_NORMALIZER_SCHEMA_SUFFIX = (
+    "Extract and return a valid JSON object matching this structure:\n"
+    '{\n'
+    '  "job": {\n'
+    '    "title": "string (required)",\n'
+    '    "client": "string (required)",\n'
+    '    "department": "string or null",\n'
+    '    "location_policy": "onsite" | "hybrid" | "remote",\n'
+    '    "onsite_days_per_week": number (0-5) or null,\n'
+    '    "primary_location": {"city": "string or null", "region": "string or null", "country": "string or null"} or null,\n'
+    '    "salary_band": {"min": number or null, "max": number or null, "currency": "string (3 chars)", "period": "year" | "month"} or null,\n'
+    '    "visa_sponsorship": "available" | "not_available" | "case_by_case" or null,\n'
+    '    "clearance_required": "string or null",\n'
+    '    "hiring_urgency": "asap" | "this_quarter" | "next_quarter" or null\n'
+    '  },\n'
+    '  "requirements": {\n'
+    '    "must_haves": [{"name": "string", "weight": number (0.1-1.0), "evidence_hint": "string or null"}],\n'
+    '    "nice_to_haves": [{"name": "string", "weight": number (0.1-1.0), "evidence_hint": "string or null"}],\n'
+    '    "years_experience_min": number or null,\n'
+    '    "education_required": "string or null"\n'
+    '  },\n'
+    '  "interview_process": [{"stage_name": "string", "duration_minutes": number or null, "participants": ["string"] or null, "assessment_focus": "string or null"}] or null,\n'
+    '  "role_notes": "string or null"\n'
+    '}\n'
+    "\nReturn only valid JSON, no markdown formatting or explanation."
+)
+
+JD_NORMALIZER_SYSTEM_PROMPT = JD_NORMALIZER_SYSTEM + "\n\n" + JD_NORMALIZER_SCHEMA_SUFFIX
+
 
 def normalize_jd_llm(
     text: Optional[str] = None,
@@ -94,33 +125,6 @@ def normalize_jd_llm(
     if hints:
         user_prompt_parts.append("\nStructured hints (use these values if provided):\n" + "\n".join(hints))
     
-    user_prompt_parts.append(
-        "\nExtract and return a valid JSON object matching this structure:\n"
-        '{\n'
-        '  "job": {\n'
-        '    "title": "string (required)",\n'
-        '    "client": "string (required)",\n'
-        '    "department": "string or null",\n'
-        '    "location_policy": "onsite" | "hybrid" | "remote",\n'
-        '    "onsite_days_per_week": number (0-5) or null,\n'
-        '    "primary_location": {"city": "string or null", "region": "string or null", "country": "string or null"} or null,\n'
-        '    "salary_band": {"min": number or null, "max": number or null, "currency": "string (3 chars)", "period": "year" | "month"} or null,\n'
-        '    "visa_sponsorship": "available" | "not_available" | "case_by_case" or null,\n'
-        '    "clearance_required": "string or null",\n'
-        '    "hiring_urgency": "asap" | "this_quarter" | "next_quarter" or null\n'
-        '  },\n'
-        '  "requirements": {\n'
-        '    "must_haves": [{"name": "string", "weight": number (0.1-1.0), "evidence_hint": "string or null"}],\n'
-        '    "nice_to_haves": [{"name": "string", "weight": number (0.1-1.0), "evidence_hint": "string or null"}],\n'
-        '    "years_experience_min": number or null,\n'
-        '    "education_required": "string or null"\n'
-        '  },\n'
-        '  "interview_process": [{"stage_name": "string", "duration_minutes": number or null, "participants": ["string"] or null, "assessment_focus": "string or null"}] or null,\n'
-        '  "role_notes": "string or null"\n'
-        '}\n'
-        "\nReturn only valid JSON, no markdown formatting or explanation."
-    )
-    
     user_prompt = "\n".join(user_prompt_parts)
 
     try:
@@ -128,28 +132,18 @@ def normalize_jd_llm(
         resp = client_openai.chat.completions.create(
             model=settings.openai_model_long,  # Use long model for better extraction quality
             messages=[
-                {"role": "system", "content": JD_NORMALIZER_SYSTEM},
+                {"role": "system", "content": JD_NORMALIZER_SYSTEM_PROMPT},
                 {"role": "user", "content": user_prompt},
             ],
             response_format={"type": "json_object"},  # Force JSON output
             temperature=0.1,  # Low temperature for consistent, factual extraction
             max_tokens=2000,  # Enough for structured JD data
+            seed=42,  # Reproducible extraction for identical inputs
+            extra_body={"prompt_cache_key": "jd-normalizer"},  # Route repeat prefixes to the same cache
         )
         
-        # Extract JSON from response
-        content = resp.choices[0].message.content.strip()
-        
-        # Remove markdown code blocks if present
-        if content.startswith("```json"):
-            content = content[7:]
-        if content.startswith("```"):
-            content = content[3:]
-        if content.endswith("```"):
-            content = content[:-3]
-        content = content.strip()
-        
-        # Parse JSON
-        jd_data = json.loads(content)
+        # JSON mode guarantees a bare JSON object, so parse the content as-is
+        jd_data = json.loads(resp.choices[0].message.content)
         
         # Validate and create Pydantic model
         return JobDescriptionNormalized.model_validate(jd_data)
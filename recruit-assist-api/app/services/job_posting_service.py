@@ -5,73 +5,104 @@ Converts between Pydantic models (API) and SQLAlchemy models (database).
 """
 
 from __future__ import annotations
+import base64
 import logging
-from typing import Optional, List
+from typing import Optional, List, Tuple, Dict, Any, Sequence
 from datetime import datetime
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import or_, and_, literal_column, String, tuple_, insert, update, text
+from sqlalchemy.dialects import postgresql, sqlite
 from uuid import UUID
 
 from app.models import JobDescriptionNormalized
-from app.db_models import JobPosting
+from app.db_models import JobPosting, JOB_POSTING_SEARCH_EXPR
 from app.db_schemas import JobPostingResponse, JobPostingDetail
 
 logger = logging.getLogger(__name__)
 
+# Rendered literally (no bound parameters) so it matches the trigram index expression
+_SEARCH_TEXT = literal_column(JOB_POSTING_SEARCH_EXPR, type_=String)
 
-def jd_to_job_posting_db(jd: JobDescriptionNormalized, original_text: Optional[str] = None) -> JobPosting:
+# Columns needed by the non-detailed JobPostingResponse; listing queries skip the
+# large JSON/text columns (requirements, interview_process, original_text, role_notes)
+_LISTING_COLUMNS = (
+    JobPosting.id,
+    JobPosting.title,
+    JobPosting.client,
+    JobPosting.department,
+    JobPosting.location_policy,
+    JobPosting.primary_location_city,
+    JobPosting.primary_location_country,
+    JobPosting.salary_band_min,
+    JobPosting.salary_band_max,
+    JobPosting.salary_currency,
+    JobPosting.hiring_urgency,
+    JobPosting.status,
+    JobPosting.created_at,
+    JobPosting.updated_at,
+)
+
+# Dialect-specific INSERT constructs that support ON CONFLICT upserts
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+# Columns update_job_posting may set; unknown keys in an update dict are ignored
+_UPDATABLE_FIELDS = frozenset(c.key for c in JobPosting.__table__.columns) - {"id", "created_at"}
+
+
+def _s(value: Any) -> Optional[str]:
+    """str() an optional Literal value, passing None through."""
+    return None if value is None else str(value)
+
+
+def jd_to_job_posting_values(jd: JobDescriptionNormalized, original_text: Optional[str] = None) -> Dict[str, Any]:
     """
-    Convert JobDescriptionNormalized (Pydantic) to JobPosting (SQLAlchemy).
+    Convert JobDescriptionNormalized (Pydantic) to JobPosting column values.
     
     Args:
         jd: Normalized JD data
         original_text: Original job description text (if provided)
     
     Returns:
-        JobPosting database model
+        Dict of JobPosting column values, usable with JobPosting(**values) or a Core insert
     """
     job_data = jd.job
-    requirements_data = jd.requirements
     
-    # Extract primary location
-    primary_location = job_data.primary_location if job_data.primary_location else None
+    # Dump the whole JD in one serializer pass instead of per-item model_dump calls
+    dumped = jd.model_dump(exclude_none=True)
+    requirements_data = dumped["requirements"]
     
-    # Extract salary band
-    salary_band = job_data.salary_band if job_data.salary_band else None
+    # Optional sub-models; getattr(None, attr, None) below yields None when absent
+    primary_location = job_data.primary_location
+    salary_band = job_data.salary_band
     
     # Convert requirements to JSON
     requirements_json = {
-        "must_haves": [req.model_dump(exclude_none=True) for req in requirements_data.must_haves],
-        "nice_to_haves": [req.model_dump(exclude_none=True) for req in requirements_data.nice_to_haves],
-        "years_experience_min": requirements_data.years_experience_min,
-        "education_required": requirements_data.education_required,
+        "must_haves": requirements_data["must_haves"],
+        "nice_to_haves": requirements_data.get("nice_to_haves", []),
+        "years_experience_min": requirements_data.get("years_experience_min"),
+        "education_required": requirements_data.get("education_required"),
     }
     
     # Convert interview process to JSON
-    interview_process_json = None
-    if jd.interview_process:
-        interview_process_json = [stage.model_dump(exclude_none=True) for stage in jd.interview_process]
-    
-    # Extract location policy (Literal type, so just use as string)
-    location_policy_value = str(job_data.location_policy) if job_data.location_policy else None
+    interview_process_json = dumped.get("interview_process") or None
     
-    return JobPosting(
+    return dict(
         title=job_data.title,
         client=job_data.client,
         department=job_data.department,
-        location_policy=location_policy_value,
+        location_policy=_s(job_data.location_policy),
         onsite_days_per_week=job_data.onsite_days_per_week,
-        primary_location_city=primary_location.city if primary_location else None,
-        primary_location_region=primary_location.region if primary_location else None,
-        primary_location_country=primary_location.country if primary_location else None,
-        salary_band_min=salary_band.min if salary_band else None,
-        salary_band_max=salary_band.max if salary_band else None,
-        salary_currency=salary_band.currency if salary_band else None,
-        salary_period=str(salary_band.period) if salary_band and salary_band.period else None,
+        primary_location_city=getattr(primary_location, "city", None),
+        primary_location_region=getattr(primary_location, "region", None),
+        primary_location_country=getattr(primary_location, "country", None),
+        salary_band_min=getattr(salary_band, "min", None),
+        salary_band_max=getattr(salary_band, "max", None),
+        salary_currency=getattr(salary_band, "currency", None),
+        salary_period=_s(getattr(salary_band, "period", None)),
         requirements=requirements_json,
-        visa_sponsorship=str(job_data.visa_sponsorship) if job_data.visa_sponsorship else None,
+        visa_sponsorship=_s(job_data.visa_sponsorship),
         clearance_required=job_data.clearance_required,
-        hiring_urgency=str(job_data.hiring_urgency) if job_data.hiring_urgency else None,
+        hiring_urgency=_s(job_data.hiring_urgency),
         interview_process=interview_process_json,
         role_notes=jd.role_notes,
         original_text=original_text,
@@ -81,6 +112,20 @@ def jd_to_job_posting_db(jd: JobDescriptionNormalized, original_text: Optional[s
     )
 
 
+def jd_to_job_posting_db(jd: JobDescriptionNormalized, original_text: Optional[str] = None) -> JobPosting:
+    """
+    Convert JobDescriptionNormalized (Pydantic) to JobPosting (SQLAlchemy).
+    
+    Args:
+        jd: Normalized JD data
+        original_text: Original job description text (if provided)
+    
+    Returns:
+        JobPosting database model
+    """
+    return JobPosting(**jd_to_job_posting_values(jd, original_text=original_text))
+
+
 def job_posting_db_to_response(job: JobPosting, detailed: bool = False) -> JobPostingResponse | JobPostingDetail:
     """
     Convert JobPosting (SQLAlchemy) to JobPostingResponse or JobPostingDetail (Pydantic).
@@ -136,7 +181,63 @@ def job_posting_db_to_response(job: JobPosting, detailed: bool = False) -> JobPo
         )
 
 
-def create_job_posting(db: Session, jd: JobDescriptionNormalized, original_text: Optional[str] = None) -> JobPosting:
+def create_job_postings_bulk(
+    db: Session,
+    jds: Sequence[JobDescriptionNormalized],
+    original_texts: Optional[Sequence[Optional[str]]] = None,
+    upsert: bool = False,
+) -> List[UUID]:
+    """
+    Create job postings from a batch of normalized JDs in a single INSERT and commit.
+    
+    Active postings are unique per (client, title). Without upsert a duplicate raises
+    IntegrityError; with upsert the existing active posting is updated in place via
+    ON CONFLICT on that partial index (PostgreSQL/SQLite), so callers don't need a
+    SELECT-before-INSERT duplicate check. A single batch must not repeat a
+    (client, title) pair when upserting.
+    
+    Args:
+        db: Database session
+        jds: Normalized JD data
+        original_texts: Original job description texts, aligned with jds (optional)
+        upsert: Update the existing active posting on a (client, title) conflict
+    
+    Returns:
+        IDs of the created (or updated) job postings, in input order
+    """
+    if not jds:
+        return []
+    
+    texts = original_texts if original_texts is not None else [None] * len(jds)
+    payloads = [jd_to_job_posting_values(jd, original_text=text) for jd, text in zip(jds, texts)]
+    
+    if upsert:
+        stmt = _UPSERT_INSERTS[db.get_bind().dialect.name](JobPosting)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[JobPosting.client, JobPosting.title],
+            index_where=text("status = 'active'"),
+            set_={
+                **{key: stmt.excluded[key] for key in payloads[0] if key not in ("client", "title", "status")},
+                "updated_at": datetime.utcnow(),
+            },
+        )
+    else:
+        stmt = insert(JobPosting)
+    
+    result = db.execute(stmt.returning(JobPosting.id, sort_by_parameter_order=True), payloads)
+    job_ids = list(result.scalars())
+    db.commit()
+    
+    logger.info(f"Created {len(job_ids)} job postings")
+    return job_ids
+
+
+def create_job_posting(
+    db: Session,
+    jd: JobDescriptionNormalized,
+    original_text: Optional[str] = None,
+    upsert: bool = False,
+) -> JobPosting:
     """
     Create a new job posting from normalized JD data.
     
@@ -144,15 +245,14 @@ def create_job_posting(db: Session, jd: JobDescriptionNormalized, original_text:
         db: Database session
         jd: Normalized JD data
         original_text: Original job description text (if provided)
+        upsert: Update the existing active posting for the same client/title instead
+            of failing on the unique index
     
     Returns:
-        Created JobPosting database model
+        Created (or updated) JobPosting database model
     """
-    job_posting = jd_to_job_posting_db(jd, original_text=original_text)
-    
-    db.add(job_posting)
-    db.commit()
-    db.refresh(job_posting)
+    job_id = create_job_postings_bulk(db, [jd], [original_text], upsert=upsert)[0]
+    job_posting = db.get(JobPosting, job_id)
     
     logger.info(f"Created job posting: {job_posting.id} ({job_posting.title} at {job_posting.client})")
     return job_posting
@@ -163,10 +263,31 @@ def get_job_posting(db: Session, job_id: UUID) -> Optional[JobPosting]:
     return db.query(JobPosting).filter(JobPosting.id == job_id).first()
 
 
+def encode_job_cursor(job: JobPosting) -> str:
+    """Encode a job posting's (created_at, id) position as an opaque pagination cursor."""
+    raw = f"{job.created_at.isoformat()}|{job.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_job_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by encode_job_cursor.
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        created_at, job_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(job_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
 def get_job_postings(
     db: Session,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[Tuple[datetime, UUID]] = None,
     search: Optional[str] = None,
     status: Optional[str] = None,
     client: Optional[str] = None,
@@ -180,26 +301,23 @@ def get_job_postings(
         db: Database session
         skip: Number of records to skip
         limit: Maximum number of records to return
-        search: Search term (searches title, client)
+        cursor: (created_at, id) of the last row of the previous page; when set,
+            keyset pagination is used and skip is ignored
+        search: Search term (searches title, client, department)
         status: Filter by status (active, closed, filled, archived)
         client: Filter by client name
         location_country: Filter by country
         hiring_urgency: Filter by hiring urgency
     
     Returns:
-        List of JobPosting database models
+        List of JobPosting database models (only listing columns are loaded;
+        use get_job_posting for the full record)
     """
-    query = db.query(JobPosting)
+    query = db.query(JobPosting).options(load_only(*_LISTING_COLUMNS))
     
     # Apply filters
     if search:
-        query = query.filter(
-            or_(
-                JobPosting.title.ilike(f"%{search}%"),
-                JobPosting.client.ilike(f"%{search}%"),
-                JobPosting.department.ilike(f"%{search}%"),
-            )
-        )
+        query = query.filter(_SEARCH_TEXT.ilike(f"%{search}%"))
     
     if status:
         query = query.filter(JobPosting.status == status)
@@ -216,8 +334,13 @@ def get_job_postings(
     # Filter out archived jobs by default
     query = query.filter(JobPosting.status != "archived")
     
-    # Order by created_at descending (newest first)
-    query = query.order_by(JobPosting.created_at.desc())
+    # Order by created_at descending (newest first), id as tie-breaker for stable pages
+    query = query.order_by(JobPosting.created_at.desc(), JobPosting.id.desc())
+    
+    if cursor is not None:
+        # Keyset pagination: seek past the cursor instead of scanning skipped rows
+        query = query.filter(tuple_(JobPosting.created_at, JobPosting.id) < cursor)
+        return query.limit(limit).all()
     
     return query.offset(skip).limit(limit).all()
 
@@ -227,20 +350,21 @@ def update_job_posting(
     job_id: UUID,
     updates: dict
 ) -> Optional[JobPosting]:
-    """Update a job posting."""
-    job = get_job_posting(db, job_id)
+    """Update a job posting with a single UPDATE ... RETURNING statement."""
+    values = {
+        key: value
+        for key, value in updates.items()
+        if value is not None and key in _UPDATABLE_FIELDS
+    }
+    values["updated_at"] = datetime.utcnow()
+    
+    stmt = update(JobPosting).where(JobPosting.id == job_id).values(**values).returning(JobPosting)
+    job = db.execute(stmt).scalar_one_or_none()
     if not job:
+        db.rollback()
         return None
     
-    # Update fields
-    for key, value in updates.items():
-        if hasattr(job, key) and value is not None:
-            setattr(job, key, value)
-    
-    job.updated_at = datetime.utcnow()
-    
     db.commit()
-    db.refresh(job)
     
     logger.info(f"Updated job posting: {job_id}")
     return job
@@ -257,16 +381,16 @@ def delete_job_posting(db: Session, job_id: UUID) -> bool:
     Returns:
         True if deleted, False if not found
     """
-    job = get_job_posting(db, job_id)
-    if not job:
-        return False
-    
-    # Soft delete (set status to 'archived')
-    job.status = "archived"
-    job.updated_at = datetime.utcnow()
-    
+    # Soft delete (set status to 'archived') in a single UPDATE
+    result = db.execute(
+        update(JobPosting)
+        .where(JobPosting.id == job_id)
+        .values(status="archived", updated_at=datetime.utcnow())
+    )
     db.commit()
     
+    if result.rowcount == 0:
+        return False
+    
     logger.info(f"Archived job posting: {job_id}")
     return True
-
@@ -6,13 +6,200 @@ Note: LinkedIn has strict automation policies - use with caution.
 """
 
 from __future__ import annotations
+import asyncio
+import hashlib
+import hmac
 import logging
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+import random
+import secrets
+import time
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Tuple, Callable, Awaitable, Union, ClassVar, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from uuid import UUID
 
+import httpx
+
+from app.models import ToneProfile
+from app.services.cache import TTLCache
+from app.services.reply_router import classify, next_message
+# Module import (not `from ... import _TONE`): set_tone rebinds the global
+from app.routers import tone
+
 logger = logging.getLogger(__name__)
 
+LINKEDIN_API_BASE_URL = "https://api.linkedin.com"
+
+# Shared keep-alive pool so bulk outreach reuses connections instead of
+# paying a TCP/TLS handshake per message
+LINKEDIN_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=64, max_connections=128, keepalive_expiry=30)
+LINKEDIN_HTTP_TIMEOUT = httpx.Timeout(10.0)
+
+# Profile fields rarely change within a campaign cycle
+PROFILE_CACHE_TTL_SECONDS = 3 * 3600
+PROFILE_CACHE_MAX_SIZE = 10_000
+
+INVITATIONS_PATH = "/v2/invitations"
+MESSAGES_PATH = "/v2/messages"
+
+
+# Retries for transient LinkedIn failures (timeouts, 429, 5xx): full-jitter exponential backoff
+MAX_SEND_ATTEMPTS = 5
+RETRY_BACKOFF_INITIAL_SECONDS = 0.5
+RETRY_BACKOFF_MAX_SECONDS = 30.0
+
+# Outbound message coalescing: sends arriving within the window go out as one batch request
+MESSAGE_BATCH_INTERVAL_SECONDS = 0.02
+MESSAGE_BATCH_MAX_SIZE = 25
+
+
+@dataclass(slots=True, frozen=True)
+class LinkedInEvent:
+    """Webhook event parsed once from the payload dict; handlers read attributes."""
+    event_type: Optional[str] = None
+    sender_urn: Optional[str] = None
+    message_text: Optional[str] = None
+    connection_urn: Optional[str] = None
+    message_id: Optional[str] = None
+    read_at: Optional[str] = None
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LinkedInEvent":
+        get = data.get
+        return cls(
+            event_type=get("event_type"),
+            sender_urn=get("sender_urn"),
+            message_text=get("message_text"),
+            connection_urn=get("connection_urn"),
+            message_id=get("message_id"),
+            read_at=get("read_at"),
+        )
+
+
+class LinkedInAPIError(Exception):
+    """Raised when LinkedIn rejects an individual element of a batch request."""
+    pass
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff for the given (1-based) attempt."""
+    return random.uniform(0, min(RETRY_BACKOFF_MAX_SECONDS, RETRY_BACKOFF_INITIAL_SECONDS * 2 ** (attempt - 1)))
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Seconds from a numeric Retry-After header, if present."""
+    retry_after = response.headers.get("Retry-After")
+    if not retry_after:
+        return None
+    try:
+        return float(retry_after)
+    except ValueError:
+        return None
+
+
+class TokenBucket:
+    """
+    Async token-bucket rate limiter.
+    
+    Callers await acquire() before each request, so sends are spaced at `rate`
+    per second up front instead of being rejected with 429s and retried.
+    """
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate  # tokens per second
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+    
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            self._refill()
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+    
+    def drain(self) -> None:
+        """Drop any remaining tokens (server reported the quota is exhausted)."""
+        self._refill()
+        self.tokens = min(self.tokens, 0.0)
+    
+    def pause(self, seconds: float) -> None:
+        """Block new acquisitions for roughly `seconds` (e.g. from a Retry-After header)."""
+        self.drain()
+        self.tokens -= seconds * self.rate
+
+
+class SendBatcher:
+    """
+    DataLoader-style coalescer for outbound sends.
+    
+    submit() queues a payload and returns its result once the batch it joined is
+    sent. A batch is flushed after `flush_interval` seconds or as soon as it
+    reaches `max_batch_size`, so concurrent sends share one HTTP round trip.
+    """
+    
+    def __init__(
+        self,
+        send_batch: Callable[[List[Dict[str, Any]]], Awaitable[List[Union[Any, Exception]]]],
+        flush_interval: float = MESSAGE_BATCH_INTERVAL_SECONDS,
+        max_batch_size: int = MESSAGE_BATCH_MAX_SIZE,
+    ):
+        self._send_batch = send_batch
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+        self._pending: List[Tuple[asyncio.Future, Dict[str, Any]]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_tasks: set[asyncio.Task] = set()
+    
+    async def submit(self, payload: Dict[str, Any]) -> Any:
+        """Queue a payload for the next batch and wait for its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((future, payload))
+        
+        if len(self._pending) >= self.max_batch_size:
+            self._flush_now()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.flush_interval, self._flush_now)
+        
+        return await future
+    
+    def _flush_now(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._flush(batch))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+    
+    async def _flush(self, batch: List[Tuple[asyncio.Future, Dict[str, Any]]]) -> None:
+        try:
+            results = await self._send_batch([payload for _, payload in batch])
+        except Exception as e:
+            for future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (future, _), result in zip(batch, results):
+            if future.done():  # Caller was cancelled
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
 
 class LinkedInService:
     """
@@ -27,6 +214,20 @@ class LinkedInService:
     Note: LinkedIn API access requires approval and has strict rate limits.
     """
     
+    # Webhook event type -> handler method name
+    _HANDLERS: ClassVar[Dict[str, str]] = {
+        "MESSAGE_RECEIVED": "_handle_incoming_message",
+        "CONNECTION_ACCEPTED": "_handle_connection_accepted",
+        "MESSAGE_READ": "_handle_message_read",
+    }
+    
+    # Static webhook responses, shared read-only rather than rebuilt per event
+    _IGNORED_BASE: ClassVar[Mapping[str, Any]] = MappingProxyType({"status": "ignored"})
+    _CONN_ACCEPTED_RESPONSE: ClassVar[Mapping[str, Any]] = MappingProxyType({
+        "status": "processed",
+        "action": "send_followup"
+    })
+    
     def __init__(self):
         # Load API keys from settings
         from app.settings import settings
@@ -36,8 +237,214 @@ class LinkedInService:
         
         # Store settings for use in methods
         self.settings = settings
+        
+        # HMAC state keyed with the webhook secret; copied per request so the key
+        # schedule is computed once
+        self._webhook_hmac = (
+            hmac.new(settings.linkedin_webhook_secret.encode(), digestmod=hashlib.sha256)
+            if settings.linkedin_webhook_secret else None
+        )
+        
+        # Pooled async HTTP client, created on first use
+        self._client: Optional[httpx.AsyncClient] = None
+        
+        # Proactive rate limiting: one bucket per endpoint (separate LinkedIn quotas)
+        # plus a cap on in-flight requests
+        self._buckets: Dict[str, TokenBucket] = {
+            INVITATIONS_PATH: TokenBucket(
+                rate=settings.linkedin_invitations_per_minute / 60,
+                capacity=max(1.0, settings.linkedin_invitations_per_minute / 6),
+            ),
+            MESSAGES_PATH: TokenBucket(
+                rate=settings.linkedin_messages_per_minute / 60,
+                capacity=max(1.0, settings.linkedin_messages_per_minute / 6),
+            ),
+        }
+        self._send_semaphore = asyncio.Semaphore(settings.linkedin_max_concurrent_requests)
+        
+        # Webhook events are queued and processed by background workers so the
+        # webhook request is acknowledged without waiting on reply routing
+        self._event_queue: Optional[asyncio.Queue[LinkedInEvent]] = None
+        self._workers: List[asyncio.Task] = []
+        
+        # Profile lookups: TTL cache plus in-flight futures so concurrent misses
+        # for the same URL share one LinkedIn request
+        self._profile_cache: TTLCache[Dict[str, Any]] = TTLCache(
+            maxsize=PROFILE_CACHE_MAX_SIZE, ttl=PROFILE_CACHE_TTL_SECONDS
+        )
+        self._profile_inflight: Dict[str, asyncio.Future] = {}
+        
+        self.max_send_attempts = MAX_SEND_ATTEMPTS
+        
+        # Concurrent send_message calls are coalesced into batch requests
+        self._message_batcher = SendBatcher(self._send_message_batch)
+        
+        # (tone.VERSION, profile) snapshot; reloaded only when the tone is updated
+        self._tone_cache: Tuple[int, Optional[ToneProfile]] = (-1, None)
+        
+        # Bound webhook handlers, resolved once
+        self._dispatch: Dict[str, Callable[[LinkedInEvent], Awaitable[Mapping[str, Any]]]] = {
+            event_type: getattr(self, method_name) for event_type, method_name in self._HANDLERS.items()
+        }
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the pooled LinkedIn HTTP client."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=LINKEDIN_API_BASE_URL,
+                http2=True,
+                limits=LINKEDIN_HTTP_LIMITS,
+                timeout=LINKEDIN_HTTP_TIMEOUT,
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "X-Restli-Protocol-Version": "2.0.0",
+                },
+            )
+        return self._client
     
-    def send_connection_request(
+    async def _post(
+        self,
+        path: str,
+        payload: Dict[str, Any],
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        tokens: int = 1,
+    ) -> httpx.Response:
+        """
+        POST to the LinkedIn API (rate limited) and raise on HTTP errors.
+        
+        Timeouts, 429s and 5xx responses are retried up to `max_send_attempts`
+        times, honouring Retry-After and otherwise backing off with jitter.
+        `tokens` is the number of rate-limit tokens each attempt consumes
+        (one per element for batch requests).
+        """
+        bucket = self._buckets.get(path)
+        attempt = 0
+        while True:
+            attempt += 1
+            if bucket is not None:
+                for _ in range(tokens):
+                    await bucket.acquire()
+            
+            try:
+                async with self._send_semaphore:
+                    response = await self._get_client().post(path, json=payload, headers=headers)
+            except httpx.TimeoutException as e:
+                if attempt >= self.max_send_attempts:
+                    raise
+                logger.warning("LinkedIn %s timed out (attempt %d): %s", path, attempt, e)
+                await asyncio.sleep(_backoff_delay(attempt))
+                continue
+            
+            if bucket is not None:
+                self._update_rate_limit(bucket, response)
+            
+            retryable = response.status_code == 429 or response.status_code >= 500
+            if not retryable or attempt >= self.max_send_attempts:
+                response.raise_for_status()
+                return response
+            
+            logger.warning("LinkedIn %s returned %d (attempt %d); retrying", path, response.status_code, attempt)
+            if response.status_code == 429 and bucket is not None:
+                # The bucket is paused for Retry-After, so the next acquire() waits it out
+                continue
+            await asyncio.sleep(_retry_after_seconds(response) or _backoff_delay(attempt))
+    
+    @staticmethod
+    def _update_rate_limit(bucket: TokenBucket, response: httpx.Response) -> None:
+        """Feed LinkedIn's rate-limit headers back into the endpoint's bucket."""
+        retry_after = response.headers.get("Retry-After")
+        if response.status_code == 429 or retry_after:
+            try:
+                bucket.pause(float(retry_after) if retry_after else 60.0)
+            except ValueError:
+                bucket.pause(60.0)
+            return
+        
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining is not None and remaining.strip() == "0":
+            bucket.drain()
+    
+    def start_webhook_workers(self) -> None:
+        """Create the webhook queue and start its worker tasks (called on app startup)."""
+        if self._workers:
+            return
+        self._event_queue = asyncio.Queue(maxsize=self.settings.linkedin_webhook_queue_size)
+        self._workers = [
+            asyncio.create_task(self._consume_webhooks(), name=f"linkedin-webhook-worker-{i}")
+            for i in range(self.settings.linkedin_webhook_workers)
+        ]
+    
+    async def stop_webhook_workers(self) -> None:
+        """Let queued webhook events finish, then stop the workers."""
+        if self._event_queue is not None:
+            await self._event_queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._event_queue = None
+    
+    async def _consume_webhooks(self) -> None:
+        """Worker loop: process queued webhook events one at a time."""
+        assert self._event_queue is not None
+        while True:
+            webhook_data = await self._event_queue.get()
+            try:
+                await self.handle_webhook(webhook_data)
+            except Exception as e:
+                logger.error("Error processing queued LinkedIn webhook: %s", e, exc_info=e)
+            finally:
+                self._event_queue.task_done()
+    
+    @property
+    def webhook_signing_enabled(self) -> bool:
+        return self._webhook_hmac is not None
+    
+    def verify_webhook_signature(self, raw_body: bytes, signature: Optional[str]) -> bool:
+        """
+        Check LinkedIn's X-LI-Signature (hex HMAC-SHA256 of the raw body).
+        
+        Uses a constant-time comparison. Returns False for a missing or malformed
+        signature, or if no webhook secret is configured.
+        """
+        if self._webhook_hmac is None or not signature:
+            return False
+        try:
+            provided = bytes.fromhex(signature)
+        except ValueError:
+            return False
+        mac = self._webhook_hmac.copy()
+        mac.update(raw_body)
+        return hmac.compare_digest(mac.digest(), provided)
+    
+    def enqueue_webhook(self, webhook_data: Dict[str, Any]) -> bool:
+        """
+        Queue a webhook event for background processing.
+        
+        Returns:
+            True if queued, False if the queue is full or workers are not running
+            (the caller should reject the delivery so LinkedIn retries it)
+        """
+        if self._event_queue is None:
+            logger.warning("LinkedIn webhook workers not running; rejecting event")
+            return False
+        # Parse once here; workers and handlers only see the typed event
+        event = LinkedInEvent.from_dict(webhook_data)
+        try:
+            self._event_queue.put_nowait(event)
+        except asyncio.QueueFull:
+            logger.warning("LinkedIn webhook queue full; rejecting event: %s", event.event_type)
+            return False
+        return True
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client (called on app shutdown)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    async def send_connection_request(
         self,
         recipient_urn: str,  # LinkedIn URN (e.g., "urn:li:person:abc123")
         message: str,
@@ -59,25 +466,26 @@ class LinkedInService:
         if not self.linkedin_api_enabled:
             raise RuntimeError("LinkedIn API not enabled or configured")
         
-        # Placeholder implementation
-        # In production, integrate with LinkedIn API:
+        # LinkedIn Invitations API:
         # https://learn.microsoft.com/en-us/linkedin/
+        logger.info("Sending LinkedIn connection request to %s", recipient_urn)
         
-        request_id = f"linkedin_req_{datetime.utcnow().timestamp()}"
-        
-        logger.info(f"Sending LinkedIn connection request to {recipient_urn}")
+        response = await self._post(INVITATIONS_PATH, {
+            "invitee": recipient_urn,
+            "message": note or message,
+        })
         
-        # In production, call LinkedIn API:
-        # POST https://api.linkedin.com/v2/invitation
+        # LinkedIn returns the created entity ID in the x-restli-id header
+        request_id = response.headers.get("x-restli-id") or f"linkedin_req_{time.time_ns()}_{secrets.token_hex(4)}"
     
         return {
             "request_id": request_id,
             "recipient_urn": recipient_urn,
             "status": "sent",
-            "sent_at": datetime.utcnow().isoformat()
+            "sent_at": datetime.now(timezone.utc).isoformat(timespec="milliseconds")
         }
     
-    def send_message(
+    async def send_message(
         self,
         recipient_urn: str,
         message_text: str,
@@ -99,35 +507,107 @@ class LinkedInService:
         if not self.linkedin_api_enabled:
             raise RuntimeError("LinkedIn API not enabled or configured")
         
-        # Placeholder implementation
-        # In production, integrate with LinkedIn Messaging API:
+        # LinkedIn Messaging API:
         # https://learn.microsoft.com/en-us/linkedin/consumer/integrations/self-serve/messaging
+        logger.info("Sending LinkedIn message to %s", recipient_urn)
         
-        message_id = f"linkedin_msg_{datetime.utcnow().timestamp()}"
+        payload: Dict[str, Any] = {"recipients": [recipient_urn], "body": message_text}
+        if subject:
+            payload["subject"] = subject
+        message_id = await self._message_batcher.submit(payload)
         
-        logger.info(f"Sending LinkedIn message to {recipient_urn}")
-        
-        # In production, call LinkedIn Messaging API
+        message_id = message_id or f"linkedin_msg_{time.time_ns()}_{secrets.token_hex(4)}"
         
         return {
             "message_id": message_id,
             "recipient_urn": recipient_urn,
             "status": "sent",
-            "sent_at": datetime.utcnow().isoformat()
+            "sent_at": datetime.now(timezone.utc).isoformat(timespec="milliseconds")
         }
     
-    def get_profile_data(
+    async def _send_message_batch(self, payloads: List[Dict[str, Any]]) -> List[Union[Optional[str], Exception]]:
+        """
+        Send queued messages, returning each created message ID (or the error for it).
+        
+        A single message is a plain POST; several are sent in one Rest.li
+        BATCH_CREATE request.
+        """
+        if len(payloads) == 1:
+            response = await self._post(MESSAGES_PATH, payloads[0])
+            return [response.headers.get("x-restli-id")]
+        
+        response = await self._post(
+            MESSAGES_PATH,
+            {"elements": payloads},
+            headers={"X-RestLi-Method": "BATCH_CREATE"},
+            tokens=len(payloads),
+        )
+        elements = response.json().get("elements", [])
+        
+        results: List[Union[Optional[str], Exception]] = []
+        for i in range(len(payloads)):
+            element = elements[i] if i < len(elements) else {}
+            element_status = element.get("status", 201)
+            if element_status >= 400:
+                results.append(LinkedInAPIError(f"LinkedIn rejected message ({element_status}): {element.get('error')}"))
+            else:
+                results.append(element.get("id"))
+        return results
+    
+    async def get_profile_data(
         self,
         profile_url: str
     ) -> Optional[Dict[str, Any]]:
         """
         Extract profile data from LinkedIn URL.
         
+        Results are cached per profile URL for PROFILE_CACHE_TTL_SECONDS, and
+        concurrent lookups of the same URL share a single fetch.
+        
         Args:
             profile_url: LinkedIn profile URL
         
         Returns:
             Dict with profile data or None
+        """
+        cached = self._profile_cache.get(profile_url)
+        if cached is not None:
+            return cached
+        
+        inflight = self._profile_inflight.get(profile_url)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._profile_inflight[profile_url] = future
+        try:
+            profile_data = await self._fetch_profile_data(profile_url)
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an exception with no other waiters isn't logged as unhandled
+            future.exception()
+            raise
+        else:
+            future.set_result(profile_data)
+            if profile_data is not None:
+                self._profile_cache.set(profile_url, profile_data)
+            return profile_data
+        finally:
+            del self._profile_inflight[profile_url]
+    
+    async def get_profile_data_by_urn(
+        self,
+        member_urn: str
+    ) -> Optional[Dict[str, Any]]:
+        """Look up profile data for a member URN (e.g. a webhook sender), sharing the profile cache."""
+        return await self.get_profile_data(member_urn)
+    
+    async def _fetch_profile_data(
+        self,
+        profile_url: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetch profile data from LinkedIn (uncached).
         
         Note: LinkedIn API has limited profile access.
         Consider using web scraping (with proper permissions) as alternative.
@@ -137,11 +617,11 @@ class LinkedInService:
         # 1. Use LinkedIn API (requires member permissions)
         # 2. Use web scraping (requires candidate consent)
         
-        logger.info(f"Extracting profile data from {profile_url}")
+        logger.info("Extracting profile data from %s", profile_url)
         
         return None
     
-    def track_message_status(
+    async def track_message_status(
         self,
         message_id: str
     ) -> Dict[str, Any]:
@@ -165,58 +645,49 @@ class LinkedInService:
             "replied_at": None
         }
     
-    def handle_webhook(
+    async def handle_webhook(
         self,
-        webhook_data: Dict[str, Any]
-    ) -> Dict[str, Any]:
+        webhook_data: Union[LinkedInEvent, Dict[str, Any]]
+    ) -> Mapping[str, Any]:
         """
         Handle incoming LinkedIn webhook events.
         
         Args:
-            webhook_data: Webhook payload from LinkedIn
+            webhook_data: Parsed event, or the raw webhook payload from LinkedIn
         
         Returns:
-            Dict with processing status
+            Mapping with processing status (may be a shared read-only response)
         
         Note: Requires webhook configuration in LinkedIn developer portal.
         """
-        event_type = webhook_data.get("event_type")
-        
-        logger.info(f"Handling LinkedIn webhook: {event_type}")
-        
-        if event_type == "MESSAGE_RECEIVED":
-            # Handle incoming message
-            return self._handle_incoming_message(webhook_data)
-        elif event_type == "CONNECTION_ACCEPTED":
-            # Handle connection acceptance
-            return self._handle_connection_accepted(webhook_data)
-        elif event_type == "MESSAGE_READ":
-            # Handle message read receipt
-            return self._handle_message_read(webhook_data)
-        else:
-            logger.warning(f"Unknown webhook event type: {event_type}")
-            return {"status": "ignored", "event_type": event_type}
+        event = webhook_data if isinstance(webhook_data, LinkedInEvent) else LinkedInEvent.from_dict(webhook_data)
+        event_type = event.event_type
+        
+        logger.info("Handling LinkedIn webhook: %s", event_type)
+        
+        handler = self._dispatch.get(event_type)
+        if handler is None:
+            logger.warning("Unknown webhook event type: %s", event_type)
+            return {**self._IGNORED_BASE, "event_type": event_type}
+        return await handler(event)
     
-    def _handle_incoming_message(
+    async def _handle_incoming_message(
         self,
-        webhook_data: Dict[str, Any]
+        event: LinkedInEvent
     ) -> Dict[str, Any]:
         """Handle incoming message from LinkedIn webhook."""
-        # Extract message data
-        sender_urn = webhook_data.get("sender_urn")
-        message_text = webhook_data.get("message_text")
-        
-        # Route message using reply_router service
-        from app.services.reply_router import classify, next_message
-        from app.routers.tone import _TONE
+        sender_urn = event.sender_urn
+        message_text = event.message_text
         
+        # Look up the sender while the reply is classified
+        profile_task = asyncio.create_task(self.get_profile_data_by_urn(sender_urn)) if sender_urn else None
         intent = classify(message_text)
+        profile = await profile_task if profile_task is not None else None
         
-        # Generate response
-        # Note: Would need to look up candidate name from sender_urn
-        response = next_message(intent, "Candidate", jd_link_available=True, tone=_TONE)
+        first_name = (profile or {}).get("first_name") or "Candidate"
+        response = next_message(intent, first_name, jd_link_available=True, tone=self._current_tone())
         
-        logger.info(f"Routed incoming message: intent={intent}")
+        logger.info("Routed incoming message: intent=%s", intent)
         
         return {
             "status": "processed",
@@ -224,37 +695,37 @@ class LinkedInService:
             "response": response
         }
     
-    def _handle_connection_accepted(
+    def _current_tone(self) -> ToneProfile:
+        """Return the tone profile, reloading the cached snapshot only after an update."""
+        version, cached = self._tone_cache
+        if version != tone.VERSION or cached is None:
+            cached = tone._TONE
+            self._tone_cache = (tone.VERSION, cached)
+        return cached
+    
+    async def _handle_connection_accepted(
         self,
-        webhook_data: Dict[str, Any]
-    ) -> Dict[str, Any]:
+        event: LinkedInEvent
+    ) -> Mapping[str, Any]:
         """Handle connection acceptance from LinkedIn webhook."""
-        connection_urn = webhook_data.get("connection_urn")
-        
-        logger.info(f"Connection accepted: {connection_urn}")
+        logger.info("Connection accepted: %s", event.connection_urn)
         
         # Trigger follow-up message
         # In production, automatically send follow-up via send_message
         
-        return {
-            "status": "processed",
-            "action": "send_followup"
-        }
+        return self._CONN_ACCEPTED_RESPONSE
     
-    def _handle_message_read(
+    async def _handle_message_read(
         self,
-        webhook_data: Dict[str, Any]
+        event: LinkedInEvent
     ) -> Dict[str, Any]:
         """Handle message read receipt from LinkedIn webhook."""
-        message_id = webhook_data.get("message_id")
-        read_at = webhook_data.get("read_at")
-        
-        logger.info(f"Message read: {message_id} at {read_at}")
+        logger.info("Message read: %s at %s", event.message_id, event.read_at)
         
         return {
             "status": "processed",
-            "message_id": message_id,
-            "read_at": read_at
+            "message_id": event.message_id,
+            "read_at": event.read_at
         }
 
 
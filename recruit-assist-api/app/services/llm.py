@@ -1,25 +1,85 @@
 from __future__ import annotations
-from openai import OpenAI
+import functools
+from typing import Any, Callable, Dict
+import httpx
+from openai import OpenAI, AsyncOpenAI
 from openai import APITimeoutError, APIError
 from app.settings import settings
 from app.exceptions import LLMError
 
-def get_openai() -> OpenAI:
+# Connection pool shared by every LLM call in the process; requests are multiplexed
+# over HTTP/2 connections where the server supports it
+OPENAI_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60)
+
+
+def _client_kwargs() -> Dict[str, Any]:
     """
-    Get configured OpenAI client with timeout settings.
+    Endpoint and credentials for the OpenAI clients.
     
-    Raises:
-        RuntimeError: If OPENAI_API_KEY is not configured
+    With USE_LOCAL_LLM the clients target the local OpenAI-compatible server,
+    which does not need a real API key.
     """
+    if settings.use_local_llm:
+        return {"api_key": settings.openai_api_key or "local", "base_url": settings.local_llm_base_url}
     if not settings.openai_api_key:
         raise RuntimeError("OPENAI_API_KEY not configured")
+    return {"api_key": settings.openai_api_key}
+
+
+@functools.lru_cache(maxsize=1)
+def get_openai() -> OpenAI:
+    """
+    Get the process-wide OpenAI client with timeout and pool settings.
+    
+    The client (and its keep-alive connection pool) is created once and reused.
+    
+    Raises:
+        RuntimeError: If OPENAI_API_KEY is not configured and USE_LOCAL_LLM is off
+    """
     return OpenAI(
-        api_key=settings.openai_api_key,
+        **_client_kwargs(),
+        timeout=settings.openai_timeout,
+        max_retries=2,
+        http_client=httpx.Client(http2=True, limits=OPENAI_HTTP_LIMITS, timeout=settings.openai_timeout),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def get_async_openai() -> AsyncOpenAI:
+    """
+    Get the process-wide AsyncOpenAI client for concurrent call sites.
+    
+    Raises:
+        RuntimeError: If OPENAI_API_KEY is not configured and USE_LOCAL_LLM is off
+    """
+    return AsyncOpenAI(
+        **_client_kwargs(),
         timeout=settings.openai_timeout,
-        max_retries=2
+        max_retries=2,
+        http_client=httpx.AsyncClient(http2=True, limits=OPENAI_HTTP_LIMITS, timeout=settings.openai_timeout),
     )
 
 
+_TIMEOUT_DETAIL = "The LLM API call exceeded the timeout limit. Please try again with a simpler request or increase OPENAI_TIMEOUT."
+_API_ERROR_DETAIL = "The LLM API returned an error. Please check your API key and try again."
+_UNEXPECTED_ERROR_DETAIL = "An unexpected error occurred during LLM API call."
+
+
+def _build_timeout_error(error: Exception, operation: str) -> LLMError:
+    return LLMError(f"{operation} timed out after {settings.openai_timeout} seconds", detail=_TIMEOUT_DETAIL)
+
+
+def _build_api_error(error: Exception, operation: str) -> LLMError:
+    return LLMError(f"{operation} failed: {str(error)}", detail=_API_ERROR_DETAIL)
+
+
+# Keyed by exception class; APITimeoutError subclasses APIError, so MRO order picks the most specific
+_ERROR_BUILDERS: Dict[type, Callable[[Exception, str], LLMError]] = {
+    APITimeoutError: _build_timeout_error,
+    APIError: _build_api_error,
+}
+
+
 def handle_llm_timeout_error(error: Exception, operation: str = "LLM operation") -> LLMError:
     """
     Convert timeout errors to LLMError with helpful messages.
@@ -31,18 +91,8 @@ def handle_llm_timeout_error(error: Exception, operation: str = "LLM operation")
     Returns:
         LLMError with appropriate message
     """
-    if isinstance(error, APITimeoutError):
-        return LLMError(
-            f"{operation} timed out after {settings.openai_timeout} seconds",
-            detail="The LLM API call exceeded the timeout limit. Please try again with a simpler request or increase OPENAI_TIMEOUT."
-        )
-    elif isinstance(error, APIError):
-        return LLMError(
-            f"{operation} failed: {str(error)}",
-            detail="The LLM API returned an error. Please check your API key and try again."
-        )
-    else:
-        return LLMError(
-            f"{operation} failed: {str(error)}",
-            detail="An unexpected error occurred during LLM API call."
-        )
+    for cls in type(error).__mro__:
+        builder = _ERROR_BUILDERS.get(cls)
+        if builder is not None:
+            return builder(error, operation)
+    return LLMError(f"{operation} failed: {str(error)}", detail=_UNEXPECTED_ERROR_DETAIL)
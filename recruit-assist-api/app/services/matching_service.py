@@ -10,18 +10,66 @@ Scores candidates against job postings based on multiple factors:
 """
 
 from __future__ import annotations
+import heapq
+import itertools
 import logging
-from typing import Dict, List, Tuple, Optional, Any
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, List, Tuple, Optional, Any, TypeVar
 from datetime import datetime
+from sqlalchemy import String, case, cast, func
 from sqlalchemy.orm import Session
 from uuid import UUID
 
-from app.db_models import Candidate, JobPosting, CandidateProfile
+from app.db_models import Candidate, JobPosting, CandidateProfile, ProfileStatus, utcnow
+from app.services.cache import TTLCache
 from app.services.candidate_service import get_candidate
-from app.services.job_posting_service import get_job_posting
+from app.services.job_posting_service import _UPSERT_INSERTS, get_job_posting
+from app.services.skill_index import SkillIndex, build_skill_vocab, normalize_skill_name, skill_bits
+from app.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Columns read by calculate_match_score; batch matching loads only these
+_CANDIDATE_MATCH_COLUMNS = (
+    Candidate.id,
+    Candidate.skills,
+    Candidate.experience,
+    Candidate.location_country,
+    Candidate.location_city,
+    Candidate.remote_preference,
+    Candidate.right_to_work,
+    Candidate.target_compensation,
+)
+_JOB_MATCH_COLUMNS = (
+    JobPosting.id,
+    JobPosting.requirements,
+    JobPosting.primary_location_country,
+    JobPosting.primary_location_city,
+    JobPosting.location_policy,
+    JobPosting.salary_band_min,
+    JobPosting.salary_band_max,
+    JobPosting.salary_currency,
+)
+
+# Batches of at least PARALLEL_MATCH_MIN_ROWS candidates are scored in chunks of
+# this size on PARALLEL_MATCH_WORKERS worker processes (off by default: for the
+# usual limit * 10 window, pickling rows to workers costs more than scoring them)
+PARALLEL_MATCH_CHUNK_SIZE = 500
+
+# Scores from match_candidate_to_job, keyed by record versions (see _cached_match_score)
+MATCH_CACHE_TTL_SECONDS = 24 * 3600
+MATCH_CACHE_MAX_SIZE = 10_000
+_match_cache: TTLCache[Tuple[float, Dict[str, Any]]] = TTLCache(
+    maxsize=MATCH_CACHE_MAX_SIZE, ttl=MATCH_CACHE_TTL_SECONDS
+)
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
 # Matching weights (must sum to 1.0)
 WEIGHTS = {
     "skills_must_have": 0.35,  # Most important - must-have skills
@@ -33,121 +81,67 @@ WEIGHTS = {
 }
 
 
-def _normalize_skill_name(skill_name: str) -> str:
-    """Normalize skill name for comparison (lowercase, strip, handle variations)."""
-    # Remove common variations
-    normalized = skill_name.lower().strip()
-    # Handle common aliases (can be expanded)
-    aliases = {
-        "node": "node.js",
-        "nodejs": "node.js",
-        "js": "javascript",
-        "reactjs": "react",
-        "vuejs": "vue",
-        "postgres": "postgresql",
-        "aws": "amazon web services",
-    }
-    for alias, canonical in aliases.items():
-        if alias in normalized:
-            normalized = normalized.replace(alias, canonical)
-    return normalized
-
-
 def _check_skill_match(requirement: str, candidate_skills: List[str], candidate_technologies: List[str]) -> Tuple[float, str]:
     """
     Check if a requirement matches candidate skills.
     
+    Prefer building one SkillIndex per candidate when matching several
+    requirements; this helper re-normalises the candidate's skills each call.
+    
     Returns:
         Tuple of (match_score, evidence)
         - match_score: 1.0 (exact match), 0.5 (partial match), 0.0 (no match)
         - evidence: String with matched skill/technology
     """
-    req_lower = _normalize_skill_name(requirement)
-    req_tokens = set(req_lower.split())
-    
-    # Check for exact match in skills
-    for skill in candidate_skills:
-        skill_normalized = _normalize_skill_name(skill)
-        if req_lower in skill_normalized or skill_normalized in req_lower:
-            return 1.0, skill
-    
-    # Check for token overlap (partial match)
-    for skill in candidate_skills:
-        skill_normalized = _normalize_skill_name(skill)
-        skill_tokens = set(skill_normalized.split())
-        overlap = req_tokens.intersection(skill_tokens)
-        if overlap and len(overlap) >= len(req_tokens) * 0.5:  # At least 50% token overlap
-            return 0.5, skill
-    
-    # Check technologies from experience
-    for tech in candidate_technologies:
-        tech_normalized = _normalize_skill_name(tech)
-        if req_lower in tech_normalized or tech_normalized in req_lower:
-            return 1.0, tech
-        
-        tech_tokens = set(tech_normalized.split())
-        overlap = req_tokens.intersection(tech_tokens)
-        if overlap and len(overlap) >= len(req_tokens) * 0.5:
-            return 0.5, tech
-    
-    return 0.0, ""
+    return SkillIndex(candidate_skills, candidate_technologies).match(requirement)
 
 
-def calculate_skills_score(
-    must_haves: List[Dict[str, Any]],
-    nice_to_haves: List[Dict[str, Any]],
-    candidate_skills: List[str],
-    candidate_technologies: List[str]
-) -> Tuple[float, Dict[str, Any]]:
-    """
-    Calculate skills match score (0.0 to 1.0).
-    
-    Args:
-        must_haves: List of must-have requirements (with name and weight)
-        nice_to_haves: List of nice-to-have requirements (with name and weight)
-        candidate_skills: List of candidate skill names
-        candidate_technologies: List of technologies from experience
-    
-    Returns:
-        Tuple of (score, details)
-    """
-    must_have_score = 0.0
-    must_have_matches = []
-    must_have_total_weight = sum(req.get("weight", 0.5) for req in must_haves)
-    
-    if must_have_total_weight > 0:
-        for req in must_haves:
-            req_name = req.get("name", "")
-            req_weight = req.get("weight", 0.5)
-            match_score, evidence = _check_skill_match(req_name, candidate_skills, candidate_technologies)
+# Requirements as ((name, weight), ...) with weights defaulted
+WeightedRequirements = Tuple[Tuple[str, float], ...]
+
+
+def _weighted_requirements(
+    requirements: List[Dict[str, Any]],
+    default_weight: float
+) -> Tuple[WeightedRequirements, float]:
+    """Read each requirement's name and weight once; return them with the total weight."""
+    weighted = tuple((req.get("name", ""), req.get("weight", default_weight)) for req in requirements)
+    return weighted, sum(weight for _, weight in weighted)
+
+
+def _score_requirements(
+    weighted: WeightedRequirements,
+    total_weight: float,
+    skill_index: SkillIndex
+) -> Tuple[float, List[Dict[str, Any]]]:
+    """Weighted share (0.0 to 1.0) of requirements the candidate matches, plus the matches."""
+    score = 0.0
+    matches = []
+    if total_weight > 0:
+        for req_name, req_weight in weighted:
+            match_score, evidence = skill_index.match(req_name)
             
             if match_score > 0:
-                must_have_score += (match_score * req_weight) / must_have_total_weight
-                must_have_matches.append({
+                score += (match_score * req_weight) / total_weight
+                matches.append({
                     "requirement": req_name,
                     "match_score": match_score,
                     "evidence": evidence,
                     "weight": req_weight
                 })
     
-    nice_have_score = 0.0
-    nice_have_matches = []
-    nice_have_total_weight = sum(req.get("weight", 0.3) for req in nice_to_haves)
-    
-    if nice_have_total_weight > 0:
-        for req in nice_to_haves:
-            req_name = req.get("name", "")
-            req_weight = req.get("weight", 0.3)
-            match_score, evidence = _check_skill_match(req_name, candidate_skills, candidate_technologies)
-            
-            if match_score > 0:
-                nice_have_score += (match_score * req_weight) / nice_have_total_weight
-                nice_have_matches.append({
-                    "requirement": req_name,
-                    "match_score": match_score,
-                    "evidence": evidence,
-                    "weight": req_weight
-                })
+    return score, matches
+
+
+def _skills_score(
+    must_haves: WeightedRequirements,
+    must_have_total_weight: float,
+    nice_to_haves: WeightedRequirements,
+    nice_have_total_weight: float,
+    skill_index: SkillIndex
+) -> Tuple[Dict[str, float], Dict[str, Any]]:
+    must_have_score, must_have_matches = _score_requirements(must_haves, must_have_total_weight, skill_index)
+    nice_have_score, nice_have_matches = _score_requirements(nice_to_haves, nice_have_total_weight, skill_index)
     
     # Return separate scores (will be combined in overall score calculation)
     return {
@@ -163,9 +157,50 @@ def calculate_skills_score(
     }
 
 
+def calculate_skills_score(
+    must_haves: List[Dict[str, Any]],
+    nice_to_haves: List[Dict[str, Any]],
+    candidate_skills: List[str],
+    candidate_technologies: List[str]
+) -> Tuple[float, Dict[str, Any]]:
+    """
+    Calculate skills match score (0.0 to 1.0).
+    
+    Args:
+        must_haves: List of must-have requirements (with name and weight)
+        nice_to_haves: List of nice-to-have requirements (with name and weight)
+        candidate_skills: List of candidate skill names
+        candidate_technologies: List of technologies from experience
+    
+    Returns:
+        Tuple of (score, details)
+    """
+    # Normalise the candidate's skills once for all requirements
+    skill_index = SkillIndex(candidate_skills, candidate_technologies)
+    
+    return _skills_score(
+        *_weighted_requirements(must_haves, 0.5),
+        *_weighted_requirements(nice_to_haves, 0.3),
+        skill_index
+    )
+
+
+def _month_index(date_str: str) -> int:
+    """Absolute month number (year * 12 + month) of a 'YYYY' or 'YYYY-MM[-DD]' date."""
+    parts = date_str.split('-', 2)
+    return int(parts[0]) * 12 + (int(parts[1]) if len(parts) > 1 else 1)
+
+
+def current_month_index() -> int:
+    """Absolute month number for the current UTC month."""
+    now = datetime.utcnow()
+    return now.year * 12 + now.month
+
+
 def calculate_experience_score(
     required_years: Optional[int],
-    candidate_experience: List[Dict[str, Any]]
+    candidate_experience: List[Dict[str, Any]],
+    now_month: Optional[int] = None
 ) -> Tuple[float, Dict[str, Any]]:
     """
     Calculate experience match score based on years of experience.
@@ -173,6 +208,8 @@ def calculate_experience_score(
     Args:
         required_years: Minimum years required (from JD)
         candidate_experience: List of experience items from CV
+        now_month: current_month_index() for current roles; pass it in when
+            scoring a batch so the clock is read once
     
     Returns:
         Tuple of (score, details)
@@ -181,30 +218,25 @@ def calculate_experience_score(
         return 1.0, {"years_required": 0, "years_actual": 0, "score": 1.0}
     
     # Calculate total years from experience
-    total_years = 0.0
+    total_months = 0
     for exp in candidate_experience:
         start_date = exp.get("start_date")
         end_date = exp.get("end_date")
         
         if start_date:
             try:
-                start_year = int(start_date.split('-')[0])
-                start_month = int(start_date.split('-')[1]) if len(start_date.split('-')) > 1 else 1
-                
+                start_month = _month_index(start_date)
                 if end_date:
-                    end_year = int(end_date.split('-')[0])
-                    end_month = int(end_date.split('-')[1]) if len(end_date.split('-')) > 1 else 1
+                    end_month = _month_index(end_date)
                 else:
                     # Current role
-                    now = datetime.utcnow()
-                    end_year = now.year
-                    end_month = now.month
-                
-                # Calculate months
-                months = (end_year - start_year) * 12 + (end_month - start_month)
-                total_years += months / 12.0
+                    if now_month is None:
+                        now_month = current_month_index()
+                    end_month = now_month
+                total_months += end_month - start_month
             except (ValueError, IndexError):
                 pass
+    total_years = total_months / 12.0
     
     # Score based on meeting/exceeding requirement
     if total_years >= required_years:
@@ -247,6 +279,29 @@ def calculate_location_score(
     Returns:
         Tuple of (score, details)
     """
+    return _location_score(
+        job_location_country,
+        job_location_country.upper() if job_location_country else None,
+        job_location_city.upper() if job_location_city else None,
+        job_location_policy.lower() if job_location_policy else None,
+        candidate_location_country,
+        candidate_location_city,
+        candidate_remote_pref,
+        candidate_right_to_work
+    )
+
+
+def _location_score(
+    job_location_country: Optional[str],
+    job_country_upper: Optional[str],
+    job_city_upper: Optional[str],
+    job_policy: Optional[str],
+    candidate_location_country: Optional[str],
+    candidate_location_city: Optional[str],
+    candidate_remote_pref: Optional[str],
+    candidate_right_to_work: Optional[List[str]]
+) -> Tuple[float, Dict[str, Any]]:
+    """calculate_location_score with the job's fields already case-normalised."""
     score = 0.0
     details = {
         "location_match": False,
@@ -259,25 +314,24 @@ def calculate_location_score(
         if job_location_country in candidate_right_to_work:
             details["right_to_work"] = True
             score += 0.3  # 30% of location score
-        elif any(country.upper() == job_location_country.upper() for country in candidate_right_to_work):
+        elif any(country.upper() == job_country_upper for country in candidate_right_to_work):
             details["right_to_work"] = True
             score += 0.3
     
     # Check country match
     if job_location_country and candidate_location_country:
-        if job_location_country.upper() == candidate_location_country.upper():
+        if job_country_upper == candidate_location_country.upper():
             details["location_match"] = True
             score += 0.4  # 40% of location score
             
             # Bonus for city match
-            if job_location_city and candidate_location_city:
-                if job_location_city.upper() == candidate_location_city.upper():
+            if job_city_upper and candidate_location_city:
+                if job_city_upper == candidate_location_city.upper():
                     score += 0.2  # Additional 20% for city match
     
     # Check remote preference compatibility
-    if job_location_policy and candidate_remote_pref:
-        job_policy = job_location_policy.lower()
-        candidate_pref = candidate_remote_pref.lower() if candidate_remote_pref else ""
+    if job_policy and candidate_remote_pref:
+        candidate_pref = candidate_remote_pref.lower()
         
         # Remote jobs work for anyone
         if job_policy == "remote":
@@ -356,51 +410,262 @@ def calculate_salary_score(
         return 0.7, {"score": 0.7, "reason": "Target below job range (acceptable)"}
 
 
+def _salary_scorer(
+    job_salary_min: Optional[float],
+    job_salary_max: Optional[float],
+    job_salary_currency: Optional[str]
+) -> Callable[[Optional[float], Optional[float], Optional[str]], float]:
+    """
+    Score-only calculate_salary_score with the job's side computed once.
+    
+    The job's currency, average and range size are fixed per job, and no
+    details dict is built. Jobs without a minimum or maximum use
+    calculate_salary_score itself, so edge cases behave exactly as before.
+    """
+    if not job_salary_min or job_salary_max is None:
+        return lambda target_min, target_max, target_currency: calculate_salary_score(
+            job_salary_min, job_salary_max, job_salary_currency, target_min, target_max, target_currency
+        )[0]
+    
+    job_currency_upper = job_salary_currency.upper() if job_salary_currency else None
+    job_avg = (job_salary_min + (job_salary_max or job_salary_min)) / 2
+    job_max_or_inf = job_salary_max or float('inf')
+    job_range_size = (job_salary_max or job_salary_min) - job_salary_min
+    
+    def score(target_min: Optional[float], target_max: Optional[float], target_currency: Optional[str]) -> float:
+        if not target_min:
+            return 0.5
+        if job_currency_upper and target_currency and target_currency.upper() != job_currency_upper:
+            return 0.3
+        if target_min >= job_salary_min and (not target_max or target_max <= job_salary_max):
+            return 1.0
+        if target_min <= job_salary_max and (not target_max or target_max >= job_salary_min):
+            overlap_size = min(target_max or float('inf'), job_max_or_inf) - max(target_min, job_salary_min)
+            overlap_ratio = overlap_size / job_range_size if job_range_size > 0 else 0
+            return 0.5 + (overlap_ratio * 0.5)
+        candidate_avg = (target_min + (target_max or target_min)) / 2
+        if candidate_avg > job_avg:
+            return max(0.0, 0.5 - min(1.0, (candidate_avg - job_avg) / job_avg))
+        return 0.7
+    
+    return score
+
+
+@dataclass(slots=True, frozen=True)
+class JobMatchContext:
+    """Job fields pre-processed once, then reused for every candidate scored against the job."""
+    must_haves: WeightedRequirements
+    must_have_total_weight: float
+    nice_to_haves: WeightedRequirements
+    nice_have_total_weight: float
+    required_years: Optional[int]
+    location_country: Optional[str]
+    location_country_upper: Optional[str]
+    location_city_upper: Optional[str]
+    location_policy_lower: Optional[str]
+    salary_min: Optional[float]
+    salary_max: Optional[float]
+    salary_currency: Optional[str]
+    now_month: int  # current_month_index() when the context was prepared
+
+
+def prepare_job_ctx(job: JobPosting) -> JobMatchContext:
+    """Pre-process a job posting (model or row) for scoring candidates against it."""
+    requirements = job.requirements or {}
+    must_haves, must_have_total_weight = _weighted_requirements(requirements.get("must_haves", []), 0.5)
+    nice_to_haves, nice_have_total_weight = _weighted_requirements(requirements.get("nice_to_haves", []), 0.3)
+    country = job.primary_location_country
+    city = job.primary_location_city
+    policy = job.location_policy
+    
+    return JobMatchContext(
+        must_haves=must_haves,
+        must_have_total_weight=must_have_total_weight,
+        nice_to_haves=nice_to_haves,
+        nice_have_total_weight=nice_have_total_weight,
+        required_years=requirements.get("years_experience_min"),
+        location_country=country,
+        location_country_upper=country.upper() if country else None,
+        location_city_upper=city.upper() if city else None,
+        location_policy_lower=policy.lower() if policy else None,
+        salary_min=job.salary_band_min,
+        salary_max=job.salary_band_max,
+        salary_currency=job.salary_currency,
+        now_month=current_month_index(),
+    )
+
+
+def _candidate_skill_index(candidate: Candidate) -> SkillIndex:
+    """SkillIndex over a candidate's skills and the technologies from their experience."""
+    candidate_skills = [skill.get("name", "") for skill in (candidate.skills or []) if skill.get("name")]
+    # Unique technologies in first-seen order (dict keys give O(1) de-duplication)
+    candidate_technologies = list(dict.fromkeys(
+        tech
+        for exp in (candidate.experience or [])
+        for tech in (exp.get("technologies") or [])
+        if tech
+    ))
+    return SkillIndex(candidate_skills, candidate_technologies)
+
+
+def _requirement_bits(
+    weighted: WeightedRequirements,
+    vocab: Dict[str, int]
+) -> Tuple[Tuple[str, float, int], ...]:
+    """Attach each requirement's bit in the job's skill vocab (see skill_index.skill_bits)."""
+    return tuple((name, weight, 1 << vocab[normalize_skill_name(name)]) for name, weight in weighted)
+
+
+def _score_requirements_by_bits(
+    weighted_bits: Tuple[Tuple[str, float, int], ...],
+    total_weight: float,
+    candidate_bits: int,
+    get_index: Callable[[], SkillIndex]
+) -> float:
+    """
+    Score-only _score_requirements that skips the SkillIndex for exact skill hits.
+    
+    A candidate skill with the requirement's canonical ID is always an exact
+    (1.0) match, so only requirements without that bit need SkillIndex.match.
+    """
+    score = 0.0
+    if total_weight > 0:
+        for req_name, req_weight, req_bit in weighted_bits:
+            match_score = 1.0 if candidate_bits & req_bit else get_index().match(req_name)[0]
+            if match_score > 0:
+                score += (match_score * req_weight) / total_weight
+    return score
+
+
+def compile_scorer(ctx: JobMatchContext) -> Callable[[Candidate], float]:
+    """
+    Build a score-only function specialised to one job.
+    
+    Weights are bound as locals, and components the job cannot vary are
+    resolved once: no skill requirements gives 0.0 skill scores without
+    indexing the candidate, no minimum years gives 1.0 experience, and no job
+    salary gives the neutral 0.5. Requirements the candidate lists by canonical
+    name are matched with a bitset test, and the candidate's SkillIndex is only
+    built when some requirement needs fuzzy matching. Returns the same score as
+    score_candidate_with_ctx.
+    """
+    w_must = WEIGHTS["skills_must_have"]
+    w_nice = WEIGHTS["skills_nice_have"]
+    w_experience = WEIGHTS["experience"]
+    w_location = WEIGHTS["location"]
+    w_salary = WEIGHTS["salary"]
+    w_right_to_work = WEIGHTS["right_to_work"]
+    
+    # Bits only for the job's own skills; other candidate skills set no bit
+    vocab = build_skill_vocab(name for name, _ in itertools.chain(ctx.must_haves, ctx.nice_to_haves))
+    must_haves, must_have_total = _requirement_bits(ctx.must_haves, vocab), ctx.must_have_total_weight
+    nice_to_haves, nice_have_total = _requirement_bits(ctx.nice_to_haves, vocab), ctx.nice_have_total_weight
+    has_skills = must_have_total > 0 or nice_have_total > 0
+    required_years, now_month = ctx.required_years, ctx.now_month
+    location_args = (ctx.location_country, ctx.location_country_upper, ctx.location_city_upper, ctx.location_policy_lower)
+    salary_min = ctx.salary_min
+    salary_score_of = _salary_scorer(ctx.salary_min, ctx.salary_max, ctx.salary_currency)
+    
+    def score(candidate: Candidate) -> float:
+        if has_skills:
+            candidate_bits = skill_bits((skill.get("name") for skill in (candidate.skills or []) if skill.get("name")), vocab)
+            skill_index = None
+            
+            def get_index() -> SkillIndex:
+                nonlocal skill_index
+                if skill_index is None:
+                    skill_index = _candidate_skill_index(candidate)
+                return skill_index
+            
+            must_have_score = _score_requirements_by_bits(must_haves, must_have_total, candidate_bits, get_index)
+            nice_have_score = _score_requirements_by_bits(nice_to_haves, nice_have_total, candidate_bits, get_index)
+        else:
+            must_have_score = nice_have_score = 0.0
+        
+        if required_years:
+            experience_score = calculate_experience_score(required_years, candidate.experience or [], now_month)[0]
+        else:
+            experience_score = 1.0
+        
+        location_score, location_details = _location_score(
+            *location_args,
+            candidate.location_country,
+            candidate.location_city,
+            candidate.remote_preference,
+            candidate.right_to_work
+        )
+        
+        if salary_min:
+            target_comp = candidate.target_compensation or {}
+            salary_score = salary_score_of(
+                target_comp.get("base_min"),
+                target_comp.get("base_max"),
+                target_comp.get("currency")
+            )
+        else:
+            salary_score = 0.5
+        
+        right_to_work_score = 1.0 if location_details["right_to_work"] else 0.0
+        
+        return (
+            must_have_score * w_must +
+            nice_have_score * w_nice +
+            experience_score * w_experience +
+            location_score * w_location +
+            salary_score * w_salary +
+            right_to_work_score * w_right_to_work
+        )
+    
+    return score
+
+
 def calculate_match_score(
     candidate: Candidate,
-    job: JobPosting
-) -> Tuple[float, Dict[str, Any]]:
+    job: JobPosting,
+    include_details: bool = True
+) -> Tuple[float, Optional[Dict[str, Any]]]:
     """
     Calculate overall match score between candidate and job posting.
     
     Args:
-        candidate: Candidate database model
-        job: Job posting database model
+        candidate: Candidate database model (or a row with the same scored columns)
+        job: Job posting database model (or a row with the same scored columns)
+        include_details: Build the match_details breakdown (skip when only ranking)
     
     Returns:
         Tuple of (overall_score, match_details)
         - overall_score: 0.0 to 1.0
-        - match_details: Dict with breakdown by category
+        - match_details: Dict with breakdown by category (None if include_details is False)
     """
-    # Extract candidate skills and technologies
-    candidate_skills = [skill.get("name", "") for skill in (candidate.skills or []) if skill.get("name")]
-    candidate_technologies = []
-    for exp in (candidate.experience or []):
-        for tech in (exp.get("technologies") or []):
-            if tech and tech not in candidate_technologies:
-                candidate_technologies.append(tech)
-    
-    # Extract requirements
-    requirements = job.requirements or {}
-    must_haves = requirements.get("must_haves", [])
-    nice_to_haves = requirements.get("nice_to_haves", [])
-    required_years = requirements.get("years_experience_min")
-    
+    return score_candidate_with_ctx(candidate, prepare_job_ctx(job), include_details)
+
+
+def score_candidate_with_ctx(
+    candidate: Candidate,
+    ctx: JobMatchContext,
+    include_details: bool = True
+) -> Tuple[float, Optional[Dict[str, Any]]]:
+    """calculate_match_score against a prepared job context (see prepare_job_ctx)."""
     # Calculate component scores
-    skills_scores, skills_details = calculate_skills_score(
-        must_haves, nice_to_haves, candidate_skills, candidate_technologies
+    skills_scores, skills_details = _skills_score(
+        ctx.must_haves,
+        ctx.must_have_total_weight,
+        ctx.nice_to_haves,
+        ctx.nice_have_total_weight,
+        _candidate_skill_index(candidate)
     )
     must_have_skills_score = skills_scores["must_have_score"]
     nice_have_skills_score = skills_scores["nice_have_score"]
     
     experience_score, experience_details = calculate_experience_score(
-        required_years, candidate.experience or []
+        ctx.required_years, candidate.experience or [], ctx.now_month
     )
     
-    location_score, location_details = calculate_location_score(
-        job.primary_location_country,
-        job.primary_location_city,
-        job.location_policy,
+    location_score, location_details = _location_score(
+        ctx.location_country,
+        ctx.location_country_upper,
+        ctx.location_city_upper,
+        ctx.location_policy_lower,
         candidate.location_country,
         candidate.location_city,
         candidate.remote_preference,
@@ -410,9 +675,9 @@ def calculate_match_score(
     # Extract salary info
     target_comp = candidate.target_compensation or {}
     salary_score, salary_details = calculate_salary_score(
-        job.salary_band_min,
-        job.salary_band_max,
-        job.salary_currency,
+        ctx.salary_min,
+        ctx.salary_max,
+        ctx.salary_currency,
         target_comp.get("base_min"),
         target_comp.get("base_max"),
         target_comp.get("currency")
@@ -430,6 +695,9 @@ def calculate_match_score(
         right_to_work_score * WEIGHTS["right_to_work"]
     )
     
+    if not include_details:
+        return overall_score, None
+    
     # Build match details
     match_details = {
         "overall_score": round(overall_score, 3),
@@ -451,11 +719,181 @@ def calculate_match_score(
     return overall_score, match_details
 
 
+T = TypeVar("T")
+
+
+def _top_matches(
+    items: Iterable[T],
+    score_item: Callable[[T], float],
+    min_score: float,
+    limit: int,
+    kind: str
+) -> List[Tuple[float, T]]:
+    """
+    Score items and return the `limit` best (score, item) pairs, highest first.
+    
+    Uses a bounded heap selection rather than sorting every scored item; ties
+    keep their original order, as with a stable sort.
+    """
+    scored = []
+    for item in items:
+        try:
+            match_score = score_item(item)
+        except Exception as e:
+            logger.warning(f"Error calculating match for {kind} {item.id}: {e}")
+            continue
+        if match_score >= min_score:
+            scored.append((match_score, item))
+    
+    return heapq.nlargest(limit, scored, key=itemgetter(0))
+
+
+def _get_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Shared worker pool for parallel candidate scoring, created on first use.
+    
+    Workers are spawned rather than forked: the server process already runs
+    threads (log listener, audit flusher, HTTP clients) that a fork would copy
+    mid-operation.
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """Stop the scoring worker processes, if any were started (called on app shutdown)."""
+    global _process_pool
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(cancel_futures=True)
+
+
+def _score_candidate_chunk(
+    rows: Iterable[Any],
+    ctx: JobMatchContext,
+    min_score: float,
+    limit: int
+) -> List[Tuple[float, Any]]:
+    """Top `limit` (score, row) pairs of a batch or chunk of candidate rows (in-process or in a worker process)."""
+    return _top_matches(
+        rows,
+        compile_scorer(ctx),
+        min_score,
+        limit,
+        "candidate"
+    )
+
+
+def _rank_candidates(
+    candidate_rows: Iterable[Any],
+    ctx: JobMatchContext,
+    min_score: float,
+    limit: int
+) -> List[Tuple[float, Any]]:
+    """
+    Top `limit` (score, row) pairs for a job, highest first.
+    
+    Batches are scored in-process unless PARALLEL_MATCH_WORKERS is set and the
+    batch has at least PARALLEL_MATCH_MIN_ROWS rows. Those are sent chunk by
+    chunk to the process pool as rows arrive, and the per-chunk top lists are
+    merged; chunks are merged in fetch order, so ties keep the same order as
+    in-process ranking.
+    """
+    settings = get_settings()
+    if settings.parallel_match_workers <= 0:
+        return _score_candidate_chunk(candidate_rows, ctx, min_score, limit)
+    
+    rows = iter(candidate_rows)
+    head = list(itertools.islice(rows, settings.parallel_match_min_rows))
+    if len(head) < settings.parallel_match_min_rows:
+        return _score_candidate_chunk(head, ctx, min_score, limit)
+    
+    pool = _get_process_pool(settings.parallel_match_workers)
+    futures = [
+        pool.submit(_score_candidate_chunk, head[i:i + PARALLEL_MATCH_CHUNK_SIZE], ctx, min_score, limit)
+        for i in range(0, len(head), PARALLEL_MATCH_CHUNK_SIZE)
+    ]
+    while chunk := list(itertools.islice(rows, PARALLEL_MATCH_CHUNK_SIZE)):
+        futures.append(pool.submit(_score_candidate_chunk, chunk, ctx, min_score, limit))
+    
+    return heapq.nlargest(
+        limit,
+        itertools.chain.from_iterable(future.result() for future in futures),
+        key=itemgetter(0)
+    )
+
+
+# Candidate remote preferences compatible with each job location policy (as in _location_score)
+_COMPATIBLE_REMOTE_PREFS = {
+    "remote": None,  # any stated preference
+    "hybrid": ("remote", "hybrid"),
+    "onsite": ("onsite", "hybrid"),
+}
+
+
+def _coarse_candidate_score(ctx: JobMatchContext):
+    """
+    SQL expression approximating a candidate's location and right-to-work score.
+    
+    Used to order the candidate query so the rows scored in Python are the most
+    promising ones rather than an arbitrary slice. Returns None when the job
+    has nothing to order by.
+    """
+    terms = []
+    if ctx.location_country:
+        # right_to_work is a JSON array of country codes; match the quoted code in its text form,
+        # with LIKE wildcards (% and _) in the job's value escaped
+        right_to_work = cast(Candidate.right_to_work, String).icontains(f'"{ctx.location_country}"', autoescape=True)
+        terms.append(case((right_to_work, WEIGHTS["location"] * 0.3 + WEIGHTS["right_to_work"]), else_=0.0))
+        terms.append(case(
+            (func.upper(Candidate.location_country) == ctx.location_country_upper, WEIGHTS["location"] * 0.4),
+            else_=0.0,
+        ))
+    if ctx.location_policy_lower in _COMPATIBLE_REMOTE_PREFS:
+        prefs = _COMPATIBLE_REMOTE_PREFS[ctx.location_policy_lower]
+        pref = func.lower(Candidate.remote_preference)
+        compatible = Candidate.remote_preference != "" if prefs is None else pref.in_(prefs)
+        terms.append(case((compatible, WEIGHTS["location"] * 0.3), else_=0.0))
+    return sum(terms[1:], terms[0]) if terms else None
+
+
+def _load_by_ids(db: Session, model: Any, ids: List[UUID]) -> Dict[UUID, Any]:
+    """Load full ORM objects for the given IDs in one query."""
+    if not ids:
+        return {}
+    return {obj.id: obj for obj in db.query(model).filter(model.id.in_(ids)).all()}
+
+
+def _cached_match_score(candidate: Candidate, job: JobPosting) -> Tuple[float, Dict[str, Any]]:
+    """
+    calculate_match_score memoised on (candidate, job) versions.
+    
+    Both records bump updated_at on every change, so the key only hits while
+    neither has been edited; the current month is part of the key because
+    experience for ongoing roles grows with it. Cached details are shared
+    between callers and must be treated as read-only.
+    """
+    key = (candidate.id, candidate.updated_at, job.id, job.updated_at, current_month_index())
+    cached = _match_cache.get(key)
+    if cached is None:
+        cached = calculate_match_score(candidate, job)
+        _match_cache.set(key, cached)
+    return cached
+
+
 def match_candidate_to_job(
     db: Session,
     candidate_id: UUID,
     job_id: UUID,
-    create_profile: bool = True
+    create_profile: bool = True,
+    defer_commit: bool = False
 ) -> Tuple[float, Dict[str, Any], Optional[CandidateProfile]]:
     """
     Match a candidate to a job posting and optionally create/update a profile.
@@ -465,6 +903,7 @@ def match_candidate_to_job(
         candidate_id: Candidate ID
         job_id: Job posting ID
         create_profile: Whether to create/update CandidateProfile
+        defer_commit: Only flush the profile, leaving the commit to the caller
     
     Returns:
         Tuple of (match_score, match_details, profile)
@@ -477,8 +916,8 @@ def match_candidate_to_job(
     if not job:
         raise ValueError(f"Job posting not found: {job_id}")
     
-    # Calculate match score
-    match_score, match_details = calculate_match_score(candidate, job)
+    # Calculate match score (reused while neither record has changed)
+    match_score, match_details = _cached_match_score(candidate, job)
     
     # Create or update profile if requested
     profile = None
@@ -493,7 +932,6 @@ def match_candidate_to_job(
             # Update existing profile
             existing_profile.match_score = match_score
             existing_profile.match_details = match_details
-            existing_profile.updated_at = datetime.utcnow()
             profile = existing_profile
         else:
             # Create new profile
@@ -505,18 +943,86 @@ def match_candidate_to_job(
                 role_title=job.title,
                 match_score=match_score,
                 match_details=match_details,
-                status="active"
+                status=ProfileStatus.ACTIVE
             )
             db.add(profile)
         
-        db.commit()
-        db.refresh(profile)
+        if defer_commit:
+            db.flush()
+        else:
+            db.commit()
+            db.refresh(profile)
     
     logger.info(f"Matched candidate {candidate_id} to job {job_id}: score={match_score:.3f}")
     
     return match_score, match_details, profile
 
 
+def match_candidates_bulk(
+    db: Session,
+    candidate_ids: Iterable[UUID],
+    job_id: UUID
+) -> List[Tuple[UUID, float, Dict[str, Any]]]:
+    """
+    Match many candidates to one job and upsert their profiles in one transaction.
+    
+    Profiles are written with a single INSERT ... ON CONFLICT (candidate_id,
+    job_posting_id) DO UPDATE, so existing profiles only get their match score
+    and details refreshed. Unknown candidate IDs are skipped.
+    
+    Args:
+        db: Database session
+        candidate_ids: Candidate IDs
+        job_id: Job posting ID
+    
+    Returns:
+        List of tuples (candidate_id, match_score, match_details) in input order
+    """
+    job = get_job_posting(db, job_id)
+    if not job:
+        raise ValueError(f"Job posting not found: {job_id}")
+    
+    ids = list(dict.fromkeys(candidate_ids))
+    candidates = _load_by_ids(db, Candidate, ids)
+    ctx = prepare_job_ctx(job)
+    
+    results = []
+    payloads = []
+    for candidate_id in ids:
+        candidate = candidates.get(candidate_id)
+        if candidate is None:
+            logger.warning(f"Skipping unknown candidate {candidate_id} in bulk match")
+            continue
+        match_score, match_details = score_candidate_with_ctx(candidate, ctx)
+        results.append((candidate_id, match_score, match_details))
+        payloads.append({
+            "candidate_id": candidate_id,
+            "job_posting_id": job_id,
+            "profile_name": f"{candidate.full_name} - {job.title} at {job.client}",
+            "company_name": job.client,
+            "role_title": job.title,
+            "match_score": match_score,
+            "match_details": match_details,
+            "status": ProfileStatus.ACTIVE,
+        })
+    
+    if payloads:
+        stmt = _UPSERT_INSERTS[db.get_bind().dialect.name](CandidateProfile)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CandidateProfile.candidate_id, CandidateProfile.job_posting_id],
+            set_={
+                "match_score": stmt.excluded.match_score,
+                "match_details": stmt.excluded.match_details,
+                "updated_at": utcnow(),
+            },
+        )
+        db.execute(stmt, payloads)
+        db.commit()
+    
+    logger.info(f"Bulk matched {len(results)} candidates to job {job_id}")
+    return results
+
+
 def match_all_candidates_to_job(
     db: Session,
     job_id: UUID,
@@ -539,27 +1045,30 @@ def match_all_candidates_to_job(
     if not job:
         raise ValueError(f"Job posting not found: {job_id}")
     
-    # Get all active candidates
-    candidates = db.query(Candidate).filter(
-        Candidate.status == "active"
-    ).limit(limit * 10).all()  # Get more candidates than limit to account for filtering
+    try:
+        ctx = prepare_job_ctx(job)
+    except Exception as e:
+        logger.warning(f"Error preparing job {job_id} for matching: {e}")
+        return []
     
-    # Calculate matches
-    matches = []
-    for candidate in candidates:
-        try:
-            match_score, match_details = calculate_match_score(candidate, job)
-            if match_score >= min_score:
-                matches.append((candidate, match_score, match_details))
-        except Exception as e:
-            logger.warning(f"Error calculating match for candidate {candidate.id}: {e}")
-            continue
+    # Get active candidates as lightweight rows holding only the scored columns,
+    # best location/right-to-work fit first so the window holds the likeliest matches
+    query = db.query(*_CANDIDATE_MATCH_COLUMNS).filter(Candidate.status == "active")
+    coarse_score = _coarse_candidate_score(ctx)
+    if coarse_score is not None:
+        query = query.order_by(coarse_score.desc(), Candidate.id)
+    candidate_rows = query.limit(limit * 10).yield_per(500)  # Get more candidates than limit to account for filtering
     
-    # Sort by match score (highest first)
-    matches.sort(key=lambda x: x[1], reverse=True)
+    # Rank on scores alone, then build match details only for the results returned
+    top = _rank_candidates(candidate_rows, ctx, min_score, limit)
     
-    # Limit results
-    return matches[:limit]
+    # Load full Candidate objects for the survivors only
+    candidates = _load_by_ids(db, Candidate, [row.id for _, row in top])
+    return [
+        (candidates[row.id], match_score, score_candidate_with_ctx(row, ctx)[1])
+        for match_score, row in top
+        if row.id in candidates
+    ]
 
 
 def match_candidate_to_all_jobs(
@@ -584,25 +1093,25 @@ def match_candidate_to_all_jobs(
     if not candidate:
         raise ValueError(f"Candidate not found: {candidate_id}")
     
-    # Get all active job postings
-    jobs = db.query(JobPosting).filter(
+    # Get all active job postings as lightweight rows holding only the scored columns
+    job_rows = db.query(*_JOB_MATCH_COLUMNS).filter(
         JobPosting.status == "active"
-    ).limit(limit * 10).all()  # Get more jobs than limit to account for filtering
+    ).limit(limit * 10).yield_per(500)  # Get more jobs than limit to account for filtering
     
-    # Calculate matches
-    matches = []
-    for job in jobs:
-        try:
-            match_score, match_details = calculate_match_score(candidate, job)
-            if match_score >= min_score:
-                matches.append((job, match_score, match_details))
-        except Exception as e:
-            logger.warning(f"Error calculating match for job {job.id}: {e}")
-            continue
-    
-    # Sort by match score (highest first)
-    matches.sort(key=lambda x: x[1], reverse=True)
+    # Rank on scores alone, then build match details only for the results returned
+    top = _top_matches(
+        job_rows,
+        lambda row: calculate_match_score(candidate, row, include_details=False)[0],
+        min_score,
+        limit,
+        "job"
+    )
     
-    # Limit results
-    return matches[:limit]
+    # Load full JobPosting objects for the survivors only
+    jobs = _load_by_ids(db, JobPosting, [row.id for _, row in top])
+    return [
+        (jobs[row.id], match_score, calculate_match_score(candidate, row)[1])
+        for match_score, row in top
+        if row.id in jobs
+    ]
 
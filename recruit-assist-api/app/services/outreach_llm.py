@@ -1,5 +1,7 @@
 from __future__ import annotations
-from app.services.llm import get_openai
+import asyncio
+from typing import Any, Dict, List, Mapping, Sequence
+from app.services.llm import get_openai, get_async_openai
 from app.settings import settings
 from app.models import ToneProfile
 
@@ -7,9 +9,12 @@ SYSTEM = """Write ultra-concise LinkedIn messages in Jean's voice for Bershaw.
 Style markers: Warm, succinct, professional; 1-sentence client value prop; direct ask for CV; UK spelling; no emojis.
 Do not invent details not provided. Output plain text only."""
 
-def draft_connect_llm(tp: ToneProfile, *, first_name: str, role_title: str, location: str, work_mode: str) -> str:
-    """Generate a personalized initial connection note using LLM while maintaining tone profile style."""
-    client = get_openai()
+# Upper bound on concurrent OpenAI requests from draft_connect_llm_batch
+BATCH_MAX_CONCURRENCY = 20
+
+
+def _connect_request(tp: ToneProfile, *, first_name: str, role_title: str, location: str, work_mode: str) -> Dict[str, Any]:
+    """Chat completion arguments for an initial connection note."""
     user = (
         f"Compose an initial connection note.\n"
         f"first_name={first_name}\n"
@@ -19,7 +24,7 @@ def draft_connect_llm(tp: ToneProfile, *, first_name: str, role_title: str, loca
         f"work_mode={work_mode}\n"
         f'Must include the phrase "Are you currently exploring?" and a clear request for the CV.'
     )
-    r = client.chat.completions.create(
+    return dict(
         model=settings.openai_model_short,
         messages=[
             {"role": "system", "content": SYSTEM},
@@ -28,4 +33,34 @@ def draft_connect_llm(tp: ToneProfile, *, first_name: str, role_title: str, loca
         temperature=0.7,  # Slightly higher for natural language, but still controlled
         max_tokens=300,  # Enough for a concise LinkedIn message
     )
+
+
+def draft_connect_llm(tp: ToneProfile, *, first_name: str, role_title: str, location: str, work_mode: str) -> str:
+    """Generate a personalized initial connection note using LLM while maintaining tone profile style."""
+    client = get_openai()
+    r = client.chat.completions.create(
+        **_connect_request(tp, first_name=first_name, role_title=role_title, location=location, work_mode=work_mode)
+    )
     return r.choices[0].message.content.strip()
+
+
+async def draft_connect_llm_batch(tp: ToneProfile, specs: Sequence[Mapping[str, str]]) -> List[str]:
+    """
+    Generate connection notes for many recipients concurrently.
+    
+    Args:
+        tp: Tone profile
+        specs: One mapping per recipient with first_name, role_title, location and work_mode
+    
+    Returns:
+        Notes in the same order as specs
+    """
+    client = get_async_openai()
+    semaphore = asyncio.Semaphore(BATCH_MAX_CONCURRENCY)
+    
+    async def draft(spec: Mapping[str, str]) -> str:
+        async with semaphore:
+            r = await client.chat.completions.create(**_connect_request(tp, **spec))
+        return r.choices[0].message.content.strip()
+    
+    return list(await asyncio.gather(*(draft(spec) for spec in specs)))
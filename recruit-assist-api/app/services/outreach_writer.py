@@ -1,25 +1,98 @@
 from __future__ import annotations
+import hashlib
 from typing import Literal
+from openai import OpenAI
 from app.models import ToneProfile
+from app.services.cache import TTLCache
 from app.services.llm import get_openai
 from app.settings import settings
 
 
 def connection_note(tp: ToneProfile, *, first_name: str, role_title: str, location: str, work_mode: str) -> str:
     """Generate an initial connection note using the tone profile template."""
-    return tp.templates["initial_connect"].format(
+    return tp.render("initial_connect",
         first_name=first_name, company=tp.company, role_title=role_title, location=location, work_mode=work_mode
     )
 
 
 def followup_after_accept(tp: ToneProfile, *, first_name: str) -> str:
     """Generate a follow-up message after connection acceptance using the tone profile template."""
-    return tp.templates["after_accept_send_jd"].format(first_name=first_name)
+    return tp.render("after_accept_send_jd", first_name=first_name)
 
 
 def polite_ack(tp: ToneProfile, *, first_name: str) -> str:
     """Generate a polite acknowledgment message using the tone profile template."""
-    return tp.templates["polite_ack"].format(first_name=first_name)
+    return tp.render("polite_ack", first_name=first_name)
+
+
+# Drafts are generated once per (tone, role, location, work mode, message type)
+# with a placeholder name, then personalised by substitution
+NAME_PLACEHOLDER = "__NAME__"
+NOTE_CACHE_TTL_SECONDS = 24 * 3600
+NOTE_CACHE_MAX_SIZE = 2048
+_note_cache: TTLCache[str] = TTLCache(maxsize=NOTE_CACHE_MAX_SIZE, ttl=NOTE_CACHE_TTL_SECONDS)
+
+
+def _note_cache_key(tp: ToneProfile, *, role_title: str, location: str, work_mode: str, message_type: str) -> str:
+    """Hash of every prompt input except first_name."""
+    parts = (settings.openai_model_short, tp.persona_name, tp.company, *tp.style_markers, role_title, location, work_mode, message_type)
+    return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+
+
+def _draft_note_llm(
+    openai_client: OpenAI,
+    tp: ToneProfile,
+    *,
+    first_name: str,
+    role_title: str,
+    location: str,
+    work_mode: str,
+    message_type: str
+) -> str:
+    """Generate one note with the LLM."""
+    # Construct style markers string
+    style_markers_str = "; ".join(tp.style_markers)
+    
+    # Build the prompt
+    system_prompt = (
+        "Write ultra-concise LinkedIn messages in Jean's voice for Bershaw.\n"
+        f"Follow style markers: {style_markers_str}.\n"
+        "Never invent details; use variables provided."
+    )
+    
+    user_prompt = f"""ToneProfile:
+- persona_name: {tp.persona_name}
+- company: {tp.company}
+- style_markers: {style_markers_str}
+
+MessageType: {message_type}
+
+Variables:
+- first_name: {first_name}
+- role_title: {role_title}
+- location: {location}
+- work_mode: {work_mode}
+
+Write the message in plain text (no greeting duplication, no hashtags)."""
+
+    # Call OpenAI API using short model for fast/cheap drafting; the reply is
+    # streamed so tokens are read as they are generated
+    stream = openai_client.chat.completions.create(
+        model=settings.openai_model_short,
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ],
+        temperature=0.7,  # Slightly higher for natural language, but still controlled
+        max_tokens=300,  # Enough for a concise LinkedIn message
+        stream=True,
+    )
+    
+    return "".join(
+        chunk.choices[0].delta.content or ""
+        for chunk in stream
+        if chunk.choices
+    ).strip()
 
 
 def connection_note_llm(
@@ -34,6 +107,9 @@ def connection_note_llm(
     """
     Generate a personalized connection note using LLM while enforcing tone profile style markers.
     Falls back to template-based generation if LLM is not configured.
+    
+    Notes are drafted once per tone profile and job variables with a placeholder
+    name and cached, so candidates differing only by first name reuse the draft.
     """
     # Try to get OpenAI client, fallback to template-based if not configured
     try:
@@ -48,43 +124,18 @@ def connection_note_llm(
             raise ValueError(f"Unknown message_type: {message_type}")
 
     try:
-        # Construct style markers string
-        style_markers_str = "; ".join(tp.style_markers)
-        
-        # Build the prompt
-        system_prompt = (
-            "Write ultra-concise LinkedIn messages in Jean's voice for Bershaw.\n"
-            f"Follow style markers: {style_markers_str}.\n"
-            "Never invent details; use variables provided."
-        )
-        
-        user_prompt = f"""ToneProfile:
-- persona_name: {tp.persona_name}
-- company: {tp.company}
-- style_markers: {style_markers_str}
-
-MessageType: {message_type}
-
-Variables:
-- first_name: {first_name}
-- role_title: {role_title}
-- location: {location}
-- work_mode: {work_mode}
-
-Write the message in plain text (no greeting duplication, no hashtags)."""
-
-        # Call OpenAI API using short model for fast/cheap drafting
-        response = openai_client.chat.completions.create(
-            model=settings.openai_model_short,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.7,  # Slightly higher for natural language, but still controlled
-            max_tokens=300,  # Enough for a concise LinkedIn message
-        )
+        variables = dict(role_title=role_title, location=location, work_mode=work_mode, message_type=message_type)
+        key = _note_cache_key(tp, **variables)
+        template = _note_cache.get(key)
+        if template is None:
+            template = _draft_note_llm(openai_client, tp, first_name=NAME_PLACEHOLDER, **variables)
+            if NAME_PLACEHOLDER not in template:
+                template = ""  # Draft didn't keep the name slot; remembered so we go straight to per-candidate calls
+            _note_cache.set(key, template)
         
-        return response.choices[0].message.content.strip()
+        if not template:
+            return _draft_note_llm(openai_client, tp, first_name=first_name, **variables)
+        return template.replace(NAME_PLACEHOLDER, first_name)
         
     except Exception as e:
         # If LLM call fails, fallback to template-based
@@ -6,14 +6,15 @@ endorsements, and interview data.
 """
 
 from __future__ import annotations
+import base64
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import or_, and_, exists, select, update
 from uuid import UUID
 
-from app.db_models import CandidateProfile, Candidate, JobPosting
+from app.db_models import CandidateProfile, Candidate, JobPosting, ProfileStatus
 from app.db_schemas import (
     CandidateProfileCreate,
     CandidateProfileUpdate,
@@ -23,6 +24,17 @@ from app.db_schemas import (
 
 logger = logging.getLogger(__name__)
 
+# Columns update_profile may set; anything else in the payload is ignored
+_UPDATABLE = frozenset({
+    "profile_name", "company_name", "role_title",
+    "interview_notes", "interview_data",
+    "endorsement_text", "endorsement_recommendation", "endorsement_fit_score",
+    "match_score", "match_details",
+    "status",
+})
+# Updatable columns that can't be cleared, so an explicit None leaves them unchanged
+_NOT_CLEARABLE = frozenset({"status"})
+
 
 def create_profile(
     db: Session,
@@ -38,16 +50,17 @@ def create_profile(
     Returns:
         Created CandidateProfile
     """
-    # Verify candidate exists
-    candidate = db.query(Candidate).filter(Candidate.id == profile_data.candidate_id).first()
-    if not candidate:
-        raise ValueError(f"Candidate not found: {profile_data.candidate_id}")
-    
-    # Verify job posting exists if provided
+    # Verify the candidate (and job posting, if provided) exist in one round-trip.
+    # Checked explicitly because SQLite does not enforce the foreign keys.
+    checks = [exists().where(Candidate.id == profile_data.candidate_id)]
     if profile_data.job_posting_id:
-        job = db.query(JobPosting).filter(JobPosting.id == profile_data.job_posting_id).first()
-        if not job:
-            raise ValueError(f"Job posting not found: {profile_data.job_posting_id}")
+        checks.append(exists().where(JobPosting.id == profile_data.job_posting_id))
+    found = db.execute(select(*checks)).one()
+    
+    if not found[0]:
+        raise ValueError(f"Candidate not found: {profile_data.candidate_id}")
+    if profile_data.job_posting_id and not found[1]:
+        raise ValueError(f"Job posting not found: {profile_data.job_posting_id}")
     
     # Create profile
     profile = CandidateProfile(
@@ -58,28 +71,66 @@ def create_profile(
         role_title=profile_data.role_title,
         interview_notes=profile_data.interview_notes,
         interview_data=profile_data.interview_data,
-        status="active"
+        status=ProfileStatus.ACTIVE
     )
     
     db.add(profile)
     db.commit()
     db.refresh(profile)
     
-    logger.info(f"Created profile {profile.id} for candidate {profile_data.candidate_id}")
+    logger.info("Created profile %s for candidate %s", profile.id, profile_data.candidate_id)
     return profile
 
 
+def _save(db: Session, profile: CandidateProfile, defer_commit: bool) -> None:
+    """Commit and reload the profile, or with defer_commit just flush and leave the commit to the caller."""
+    if defer_commit:
+        db.flush()
+    else:
+        db.commit()
+        db.refresh(profile)
+
+
+def _bulk_update(db: Session, profile_id: UUID, fields: Dict[str, Any]) -> int:
+    """
+    UPDATE one profile's columns directly, without loading it first.
+    
+    Use when the caller doesn't need the updated object; the caller commits.
+    
+    Returns:
+        Number of rows updated (0 if the profile doesn't exist)
+    """
+    return db.execute(
+        update(CandidateProfile).where(CandidateProfile.id == profile_id).values(**fields)
+    ).rowcount
+
+
 def get_profile(db: Session, profile_id: UUID) -> Optional[CandidateProfile]:
-    """Get a profile by ID."""
-    return db.query(CandidateProfile).filter(CandidateProfile.id == profile_id).first()
+    """Get a profile by ID (from the session's identity map when already loaded)."""
+    return db.get(CandidateProfile, profile_id)
+
+
+def _with_related(stmt, load_related: bool):
+    """
+    Optionally load the listed profiles' candidate and job posting up front.
+    
+    selectinload fetches each relationship for the whole page in one extra
+    query, instead of one lazy load per profile when callers touch
+    profile.candidate or profile.job_posting.
+    """
+    if not load_related:
+        return stmt
+    return stmt.options(selectinload(CandidateProfile.candidate), selectinload(CandidateProfile.job_posting))
 
 
 def get_profiles_by_candidate(
     db: Session,
     candidate_id: UUID,
-    status: Optional[str] = None,
+    status: Optional[ProfileStatus] = None,
     skip: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    *,
+    load_related: bool = False
 ) -> List[CandidateProfile]:
     """
     Get all profiles for a candidate.
@@ -90,32 +141,56 @@ def get_profiles_by_candidate(
         status: Filter by status (optional)
         skip: Number of records to skip
         limit: Maximum number of records
+        load_related: Also load each profile's candidate and job posting (see _with_related)
     
     Returns:
         List of CandidateProfile
     """
-    query = db.query(CandidateProfile).filter(
+    stmt = _with_related(select(CandidateProfile), load_related).where(
         CandidateProfile.candidate_id == candidate_id
     )
     
     if status:
-        query = query.filter(CandidateProfile.status == status)
+        stmt = stmt.where(CandidateProfile.status == status)
     
     # Filter out archived by default
-    query = query.filter(CandidateProfile.status != "archived")
+    stmt = stmt.where(CandidateProfile.status != ProfileStatus.ARCHIVED)
     
     # Order by created_at descending (newest first)
-    query = query.order_by(CandidateProfile.created_at.desc())
+    stmt = stmt.order_by(CandidateProfile.created_at.desc())
+    
+    return list(db.scalars(stmt.offset(skip).limit(limit)).all())
+
+
+def encode_profile_cursor(profile: CandidateProfile) -> str:
+    """Encode a profile's (match_score, id) position in a job listing as an opaque pagination cursor."""
+    score = "" if profile.match_score is None else repr(profile.match_score)
+    return base64.urlsafe_b64encode(f"{score}|{profile.id}".encode()).decode()
+
+
+def decode_profile_cursor(cursor: str) -> Tuple[Optional[float], UUID]:
+    """
+    Decode a cursor produced by encode_profile_cursor.
     
-    return query.offset(skip).limit(limit).all()
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        score, profile_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return (float(score) if score else None), UUID(profile_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
 
 
 def get_profiles_by_job(
     db: Session,
     job_id: UUID,
-    status: Optional[str] = None,
+    status: Optional[ProfileStatus] = None,
     skip: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    cursor: Optional[Tuple[Optional[float], UUID]] = None,
+    *,
+    load_related: bool = False
 ) -> List[CandidateProfile]:
     """
     Get all profiles for a job posting.
@@ -126,24 +201,41 @@ def get_profiles_by_job(
         status: Filter by status (optional)
         skip: Number of records to skip
         limit: Maximum number of records
+        cursor: (match_score, id) of the last row of the previous page; when set,
+            keyset pagination is used and skip is ignored
+        load_related: Also load each profile's candidate and job posting (see _with_related)
     
     Returns:
         List of CandidateProfile
     """
-    query = db.query(CandidateProfile).filter(
+    stmt = _with_related(select(CandidateProfile), load_related).where(
         CandidateProfile.job_posting_id == job_id
     )
     
     if status:
-        query = query.filter(CandidateProfile.status == status)
+        stmt = stmt.where(CandidateProfile.status == status)
     
     # Filter out archived by default
-    query = query.filter(CandidateProfile.status != "archived")
-    
-    # Order by match_score descending (best matches first)
-    query = query.order_by(CandidateProfile.match_score.desc().nulls_last())
-    
-    return query.offset(skip).limit(limit).all()
+    stmt = stmt.where(CandidateProfile.status != ProfileStatus.ARCHIVED)
+    
+    # Order by match_score descending (best matches first), id as tie-breaker for stable pages
+    stmt = stmt.order_by(CandidateProfile.match_score.desc().nulls_last(), CandidateProfile.id.desc())
+    
+    if cursor is not None:
+        # Keyset pagination: seek past the cursor instead of scanning skipped rows.
+        # Unscored profiles sort last, so they follow every scored one.
+        after_score, after_id = cursor
+        if after_score is None:
+            stmt = stmt.where(CandidateProfile.match_score.is_(None), CandidateProfile.id < after_id)
+        else:
+            stmt = stmt.where(or_(
+                CandidateProfile.match_score < after_score,
+                and_(CandidateProfile.match_score == after_score, CandidateProfile.id < after_id),
+                CandidateProfile.match_score.is_(None),
+            ))
+        return list(db.scalars(stmt.limit(limit)).all())
+    
+    return list(db.scalars(stmt.offset(skip).limit(limit)).all())
 
 
 def get_profile_by_candidate_and_job(
@@ -152,24 +244,31 @@ def get_profile_by_candidate_and_job(
     job_id: UUID
 ) -> Optional[CandidateProfile]:
     """Get a profile by candidate and job posting IDs."""
-    return db.query(CandidateProfile).filter(
-        CandidateProfile.candidate_id == candidate_id,
-        CandidateProfile.job_posting_id == job_id
+    return db.scalars(
+        select(CandidateProfile).where(
+            CandidateProfile.candidate_id == candidate_id,
+            CandidateProfile.job_posting_id == job_id
+        ).limit(1)
     ).first()
 
 
 def update_profile(
     db: Session,
     profile_id: UUID,
-    updates: CandidateProfileUpdate
+    updates: CandidateProfileUpdate,
+    defer_commit: bool = False
 ) -> Optional[CandidateProfile]:
     """
     Update a candidate profile.
     
+    Only fields set on updates are applied; a field explicitly set to None
+    clears it (except status, which can't be cleared).
+    
     Args:
         db: Database session
         profile_id: Profile ID
         updates: Update data
+        defer_commit: Flush instead of committing, so several updates share one transaction
     
     Returns:
         Updated CandidateProfile or None if not found
@@ -178,20 +277,18 @@ def update_profile(
     if not profile:
         return None
     
-    # Convert Pydantic model to dict (exclude None values)
+    # Only the fields the caller set, restricted to the updatable columns
     update_dict = updates.model_dump(exclude_unset=True)
     
-    # Update fields
-    for key, value in update_dict.items():
-        if hasattr(profile, key) and value is not None:
-            setattr(profile, key, value)
-    
-    profile.updated_at = datetime.utcnow()
+    for key in _UPDATABLE.intersection(update_dict):
+        value = update_dict[key]
+        if value is None and key in _NOT_CLEARABLE:
+            continue
+        setattr(profile, key, value)
     
-    db.commit()
-    db.refresh(profile)
+    _save(db, profile, defer_commit)
     
-    logger.info(f"Updated profile {profile_id}")
+    logger.info("Updated profile %s", profile_id)
     return profile
 
 
@@ -200,7 +297,8 @@ def update_profile_endorsement(
     profile_id: UUID,
     endorsement_text: Optional[str] = None,
     endorsement_recommendation: Optional[str] = None,
-    endorsement_fit_score: Optional[float] = None
+    endorsement_fit_score: Optional[float] = None,
+    defer_commit: bool = False
 ) -> Optional[CandidateProfile]:
     """
     Update endorsement data for a profile.
@@ -211,6 +309,7 @@ def update_profile_endorsement(
         endorsement_text: Endorsement text
         endorsement_recommendation: Recommendation (Proceed, Hold, Reject)
         endorsement_fit_score: Fit score (0.0 to 1.0)
+        defer_commit: Flush instead of committing, so several updates share one transaction
     
     Returns:
         Updated CandidateProfile or None if not found
@@ -226,12 +325,9 @@ def update_profile_endorsement(
     if endorsement_fit_score is not None:
         profile.endorsement_fit_score = endorsement_fit_score
     
-    profile.updated_at = datetime.utcnow()
-    
-    db.commit()
-    db.refresh(profile)
+    _save(db, profile, defer_commit)
     
-    logger.info(f"Updated endorsement for profile {profile_id}")
+    logger.info("Updated endorsement for profile %s", profile_id)
     return profile
 
 
@@ -241,7 +337,8 @@ def update_profile_interview(
     interview_date: Optional[datetime] = None,
     interview_notes: Optional[str] = None,
     interview_transcript: Optional[str] = None,
-    interview_data: Optional[Dict[str, Any]] = None
+    interview_data: Optional[Dict[str, Any]] = None,
+    defer_commit: bool = False
 ) -> Optional[CandidateProfile]:
     """
     Update interview data for a profile.
@@ -253,6 +350,7 @@ def update_profile_interview(
         interview_notes: Interview notes
         interview_transcript: Interview transcript
         interview_data: Interview insights (JSON)
+        defer_commit: Flush instead of committing, so several updates share one transaction
     
     Returns:
         Updated CandidateProfile or None if not found
@@ -270,12 +368,9 @@ def update_profile_interview(
     if interview_data is not None:
         profile.interview_data = interview_data
     
-    profile.updated_at = datetime.utcnow()
-    
-    db.commit()
-    db.refresh(profile)
+    _save(db, profile, defer_commit)
     
-    logger.info(f"Updated interview data for profile {profile_id}")
+    logger.info("Updated interview data for profile %s", profile_id)
     return profile
 
 
@@ -283,7 +378,8 @@ def update_profile_match(
     db: Session,
     profile_id: UUID,
     match_score: Optional[float] = None,
-    match_details: Optional[Dict[str, Any]] = None
+    match_details: Optional[Dict[str, Any]] = None,
+    defer_commit: bool = False
 ) -> Optional[CandidateProfile]:
     """
     Update match data for a profile.
@@ -293,6 +389,7 @@ def update_profile_match(
         profile_id: Profile ID
         match_score: Match score (0.0 to 1.0)
         match_details: Match details (JSON)
+        defer_commit: Flush instead of committing, so several updates share one transaction
     
     Returns:
         Updated CandidateProfile or None if not found
@@ -306,37 +403,32 @@ def update_profile_match(
     if match_details is not None:
         profile.match_details = match_details
     
-    profile.updated_at = datetime.utcnow()
-    
-    db.commit()
-    db.refresh(profile)
+    _save(db, profile, defer_commit)
     
-    logger.info(f"Updated match data for profile {profile_id}")
+    logger.info("Updated match data for profile %s", profile_id)
     return profile
 
 
-def delete_profile(db: Session, profile_id: UUID) -> bool:
+def delete_profile(db: Session, profile_id: UUID, defer_commit: bool = False) -> bool:
     """
     Soft delete a profile (sets status to 'archived').
     
     Args:
         db: Database session
         profile_id: Profile ID
+        defer_commit: Leave the commit to the caller
     
     Returns:
         True if deleted, False if not found
     """
-    profile = get_profile(db, profile_id)
-    if not profile:
+    # Soft delete (set status to 'archived') in a single UPDATE, without loading the row
+    if not _bulk_update(db, profile_id, {"status": ProfileStatus.ARCHIVED}):
         return False
     
-    # Soft delete (set status to 'archived')
-    profile.status = "archived"
-    profile.updated_at = datetime.utcnow()
+    if not defer_commit:
+        db.commit()
     
-    db.commit()
-    
-    logger.info(f"Archived profile {profile_id}")
+    logger.info("Archived profile %s", profile_id)
     return True
 
 
@@ -354,55 +446,7 @@ def profile_db_to_response(
     Returns:
         CandidateProfileResponse or CandidateProfileDetail
     """
-    # Import here to avoid circular dependency
-    from app.db_schemas import CandidateProfileDetail
-    
-    if detailed:
-        return CandidateProfileDetail(
-            id=profile.id,
-            candidate_id=profile.candidate_id,
-            job_posting_id=profile.job_posting_id,
-            profile_name=profile.profile_name,
-            company_name=profile.company_name,
-            role_title=profile.role_title,
-            interview_date=profile.interview_date,
-            interview_notes=profile.interview_notes,
-            interview_transcript=profile.interview_transcript,
-            interview_data=profile.interview_data,
-            endorsement_text=profile.endorsement_text,
-            endorsement_recommendation=profile.endorsement_recommendation,
-            endorsement_fit_score=profile.endorsement_fit_score,
-            match_score=profile.match_score,
-            match_details=profile.match_details,
-            status=profile.status,
-            created_at=profile.created_at,
-            updated_at=profile.updated_at,
-            # Booking fields
-            booking_link=profile.booking_link,
-            booking_id=profile.booking_id,
-            booking_provider=profile.booking_provider,
-            booking_status=profile.booking_status,
-            booking_expires_at=profile.booking_expires_at,
-            # AI Interview fields
-            ai_interview_id=profile.ai_interview_id,
-            ai_interview_provider=profile.ai_interview_provider,
-            ai_interview_link=profile.ai_interview_link,
-            ai_interview_status=profile.ai_interview_status,
-            ai_interview_scheduled_at=profile.ai_interview_scheduled_at,
-        )
-    else:
-        return CandidateProfileResponse(
-            id=profile.id,
-            candidate_id=profile.candidate_id,
-            job_posting_id=profile.job_posting_id,
-            profile_name=profile.profile_name,
-            company_name=profile.company_name,
-            role_title=profile.role_title,
-            match_score=profile.match_score,
-            endorsement_recommendation=profile.endorsement_recommendation,
-            endorsement_fit_score=profile.endorsement_fit_score,
-            status=profile.status,
-            created_at=profile.created_at,
-            updated_at=profile.updated_at,
-        )
+    # Both schemas read attributes straight off the ORM object (from_attributes)
+    schema = CandidateProfileDetail if detailed else CandidateProfileResponse
+    return schema.model_validate(profile)
 
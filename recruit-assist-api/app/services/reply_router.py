@@ -1,40 +1,71 @@
+import functools
 import re
 import logging
 from typing import Literal
-from app.models import ToneProfile
+from app.models import ToneProfile, compile_template
 
 # Set up logging for intent classification review
 logger = logging.getLogger(__name__)
 
 Intent = Literal["positive_reply", "request_jd", "cv_attached", "decline", "unknown"]
 
-POSITIVE = re.compile(r"\b(yes|sure|interested|exploring|okay|ok|sounds good|go ahead)\b", re.I)
-REQUEST_JD = re.compile(r"\b(jd|job desc|job description|share details)\b", re.I)
-DECLINE = re.compile(r"\b(not interested|no thanks|no, thank|pass|maybe later)\b", re.I)
-CV_ATTACHED = re.compile(r"\b(attached my cv|here is my cv|shared my cv|cv attached)\b", re.I)
+# All intents in one pattern, matched against lowercased text: one scan finds
+# every keyword, and the highest-priority intent found wins
+INTENT_RE = re.compile(
+    r"\b(?:"
+    r"(?P<cv_attached>attached my cv|here is my cv|shared my cv|cv attached)"
+    r"|(?P<decline>not interested|no thanks|no, thank|pass|maybe later)"
+    r"|(?P<request_jd>jd|job desc|job description|share details)"
+    r"|(?P<positive_reply>yes|sure|interested|exploring|okay|ok|sounds good|go ahead)"
+    r")\b"
+)
+
+# Lower rank wins when a message matches several intents
+_INTENT_PRIORITY = {"cv_attached": 0, "decline": 1, "request_jd": 2, "positive_reply": 3}
+
+
+# Replies up to this length are memoised (autoresponders and short acknowledgements
+# recur constantly); longer ones are classified directly
+CLASSIFY_CACHE_MAX_TEXT = 512
+
+
+def _intent_of(text: str) -> Intent:
+    """Highest-priority intent found in the text."""
+    intent = "unknown"
+    best = len(_INTENT_PRIORITY)
+    for match in INTENT_RE.finditer(text.lower()):
+        rank = _INTENT_PRIORITY[match.lastgroup]
+        if rank < best:
+            intent, best = match.lastgroup, rank
+            if rank == 0:
+                break
+    return intent
+
+
+_cached_intent_of = functools.lru_cache(maxsize=4096)(_intent_of)
 
 
 def classify(text: str) -> Intent:
     """Classify the intent of a reply message. Logs for review of borderline cases."""
-    text_lower = text.lower()
-    
-    if CV_ATTACHED.search(text):
-        intent = "cv_attached"
-    elif DECLINE.search(text):
-        intent = "decline"
-    elif REQUEST_JD.search(text):
-        intent = "request_jd"
-    elif POSITIVE.search(text):
-        intent = "positive_reply"
-    else:
-        intent = "unknown"
+    intent = _cached_intent_of(text) if len(text) <= CLASSIFY_CACHE_MAX_TEXT else _intent_of(text)
     
     # Log intent classification for review (especially unknown/borderline cases)
-    logger.info(f"Intent classified: {intent} | Message: {text[:100]}...")
+    logger.info("Intent classified: %s | Message: %.100s...", intent, text)
     
     return intent
 
 
+@functools.lru_cache(maxsize=2048)
+def _render_for_name(template: str, first_name: str) -> str:
+    """
+    Render a first_name-only reply template, memoised per (template text, name).
+    
+    Keyed on the template text rather than the tone profile, so edited templates
+    are never served stale.
+    """
+    return compile_template(template)(first_name=first_name)
+
+
 def next_message(intent: Intent, first_name: str, *, jd_link_available: bool, tone: ToneProfile) -> str:
     """
     Generate the appropriate follow-up message based on intent.
@@ -44,15 +75,15 @@ def next_message(intent: Intent, first_name: str, *, jd_link_available: bool, to
     if intent in {"positive_reply", "request_jd"}:
         if jd_link_available:
             # Use the exact template from tone profile - this asks for salary and notice
-            return tone.templates["after_accept_send_jd"].format(first_name=first_name)
+            return _render_for_name(tone.templates["after_accept_send_jd"], first_name)
         else:
             # Use polite acknowledgment template when JD not ready yet
-            return tone.templates["polite_ack"].format(first_name=first_name)
+            return _render_for_name(tone.templates["polite_ack"], first_name)
     
     if intent == "cv_attached":
         # When CV is attached, acknowledge and ask for salary/notice
         # Using the same template as after_accept_send_jd for consistency
-        return tone.templates["after_accept_send_jd"].format(first_name=first_name)
+        return _render_for_name(tone.templates["after_accept_send_jd"], first_name)
     
     if intent == "decline":
         # For declines, use a simple acknowledgment
@@ -61,4 +92,4 @@ def next_message(intent: Intent, first_name: str, *, jd_link_available: bool, to
     
     # Unknown intent - fallback: politely ask for CV, salary, notice
     # Using the same template for consistency
-    return tone.templates["after_accept_send_jd"].format(first_name=first_name)
+    return _render_for_name(tone.templates["after_accept_send_jd"], first_name)
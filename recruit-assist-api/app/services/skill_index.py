@@ -0,0 +1,142 @@
+"""
+Skill Index
+
+Prepared view of a candidate's skills and technologies for requirement matching.
+Names are normalised and tokenised once per candidate, so scoring a job's
+requirements does not redo that string work for every requirement.
+"""
+
+from __future__ import annotations
+import functools
+import re
+from typing import Dict, Iterable, List, Tuple, FrozenSet
+
+
+# Common aliases -> canonical skill names (can be expanded)
+SKILL_ALIASES: Dict[str, str] = {
+    "node": "node.js",
+    "nodejs": "node.js",
+    "js": "javascript",
+    "reactjs": "react",
+    "vuejs": "vue",
+    "postgres": "postgresql",
+    "aws": "amazon web services",
+}
+
+# Matches an alias only as a whole word (not inside e.g. "node.js" or "postgresql"),
+# so all aliases are rewritten in a single pass
+_ALIAS_RE = re.compile(
+    r"(?<![\w.])(" + "|".join(sorted(map(re.escape, SKILL_ALIASES), key=len, reverse=True)) + r")(?![\w.])"
+)
+
+
+@functools.lru_cache(maxsize=8192)
+def normalize_skill_name(skill_name: str) -> str:
+    """Normalize skill name for comparison (lowercase, strip, handle variations)."""
+    normalized = skill_name.lower().strip()
+    return _ALIAS_RE.sub(lambda m: SKILL_ALIASES[m.group(1)], normalized)
+
+
+def build_skill_vocab(names: Iterable[str]) -> Dict[str, int]:
+    """
+    Bit position per canonical skill among names.
+
+    Built per job from its requirements, so bitsets stay as wide as the job's
+    skill list rather than every skill name ever seen.
+    """
+    vocab: Dict[str, int] = {}
+    for name in names:
+        vocab.setdefault(normalize_skill_name(name), len(vocab))
+    return vocab
+
+
+def skill_bits(names: Iterable[str], vocab: Dict[str, int]) -> int:
+    """Bitset of the vocab skills among names; names outside the vocab set no bit."""
+    bits = 0
+    for name in names:
+        bit = vocab.get(normalize_skill_name(name))
+        if bit is not None:
+            bits |= 1 << bit
+    return bits
+
+
+# (original name, normalised name, normalised tokens)
+_Entry = Tuple[str, str, FrozenSet[str]]
+
+
+def _prepare(names: Iterable[str]) -> Tuple[List[_Entry], Dict[str, int]]:
+    """Build entries plus a map of normalised name -> position of its first entry."""
+    entries = []
+    positions: Dict[str, int] = {}
+    for name in names:
+        normalized = normalize_skill_name(name)
+        positions.setdefault(normalized, len(entries))
+        entries.append((name, normalized, frozenset(normalized.split())))
+    return entries, positions
+
+
+class SkillIndex:
+    """
+    Normalised candidate skills and technologies.
+
+    match() gives the same result as scanning the raw names: skills are checked
+    for an exact (substring) match, then a partial (token overlap) match, then
+    technologies for either.
+    """
+
+    __slots__ = ("_skills", "_skill_positions", "_token_positions", "_technologies")
+
+    def __init__(self, skills: Iterable[str], technologies: Iterable[str]):
+        self._skills, self._skill_positions = _prepare(skills)
+        self._technologies, _ = _prepare(technologies)
+
+        # Token -> positions of the skills containing it, for partial matching
+        self._token_positions: Dict[str, List[int]] = {}
+        for position, (_, _, tokens) in enumerate(self._skills):
+            for token in tokens:
+                self._token_positions.setdefault(token, []).append(position)
+
+    def match(self, requirement: str) -> Tuple[float, str]:
+        """
+        Match a requirement against the indexed skills.
+
+        Returns:
+            Tuple of (match_score, evidence)
+            - match_score: 1.0 (exact match), 0.5 (partial match), 0.0 (no match)
+            - evidence: String with matched skill/technology
+        """
+        req_lower = normalize_skill_name(requirement)
+
+        # Check for exact match in skills. A skill with the same canonical name is
+        # an exact match, so only the skills before it need the substring scan.
+        position = self._skill_positions.get(req_lower)
+        candidates = self._skills if position is None else self._skills[:position + 1]
+        for original, normalized, _ in candidates:
+            if req_lower in normalized or normalized in req_lower:
+                return 1.0, original
+
+        req_tokens = set(req_lower.split())
+        min_overlap = len(req_tokens) * 0.5  # At least 50% token overlap
+
+        # Check for token overlap (partial match), visiting only skills that share
+        # a token with the requirement, in their original order
+        positions = sorted({
+            position
+            for token in req_tokens
+            for position in self._token_positions.get(token, ())
+        })
+        for position in positions:
+            original, _, tokens = self._skills[position]
+            if len(req_tokens.intersection(tokens)) >= min_overlap:
+                return 0.5, original
+
+        # Check technologies from experience
+        for original, normalized, tokens in self._technologies:
+            if req_lower in normalized or normalized in req_lower:
+                return 1.0, original
+
+            overlap = req_tokens.intersection(tokens)
+            if overlap and len(overlap) >= min_overlap:
+                return 0.5, original
+
+        return 0.0, ""
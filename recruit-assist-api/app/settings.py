@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
@@ -7,6 +8,10 @@ class Settings(BaseSettings):
     openai_model_long: str = "gpt-4o"  # for endorsements (higher quality)
     openai_timeout: float = Field(default=60.0, alias="OPENAI_TIMEOUT", description="Timeout for OpenAI API calls in seconds")
     
+    # Local OpenAI-compatible server (llama.cpp server, vLLM, Ollama) used in place of OpenAI
+    use_local_llm: bool = Field(default=False, alias="USE_LOCAL_LLM", description="Send LLM calls to LOCAL_LLM_BASE_URL instead of OpenAI")
+    local_llm_base_url: str = Field(default="http://localhost:8080/v1", alias="LOCAL_LLM_BASE_URL", description="Base URL of the local OpenAI-compatible server")
+    
     # Database settings
     # Can use SQLite for testing or PostgreSQL for production
     database_url: str = Field(
@@ -15,6 +20,21 @@ class Settings(BaseSettings):
         alias="DATABASE_URL",
         description="Database URL (SQLite or PostgreSQL)"
     )
+    db_query_cache_size: int = Field(
+        default=1200,
+        alias="DB_QUERY_CACHE_SIZE",
+        description="Compiled SQL statements kept per engine (SQLAlchemy query_cache_size)"
+    )
+    parallel_match_workers: int = Field(
+        default=0,
+        alias="PARALLEL_MATCH_WORKERS",
+        description="Worker processes for scoring very large candidate batches (0 scores in-process)"
+    )
+    parallel_match_min_rows: int = Field(
+        default=20_000,
+        alias="PARALLEL_MATCH_MIN_ROWS",
+        description="Smallest candidate batch sent to the worker processes; smaller batches score faster in-process"
+    )
     debug: bool = Field(default=False, alias="DEBUG", description="Enable debug mode (SQL logging)")
     
     # Calendar integration settings
@@ -37,6 +57,12 @@ class Settings(BaseSettings):
     # LinkedIn API settings
     linkedin_api_key: str = Field(default="", alias="LINKEDIN_API_KEY", description="LinkedIn API key")
     linkedin_api_secret: str = Field(default="", alias="LINKEDIN_API_SECRET", description="LinkedIn API secret")
+    linkedin_webhook_secret: str = Field(default="", alias="LINKEDIN_WEBHOOK_SECRET", description="Secret used to verify X-LI-Signature on LinkedIn webhooks")
+    linkedin_messages_per_minute: float = Field(default=30.0, alias="LINKEDIN_MESSAGES_PER_MINUTE", description="Max LinkedIn messages sent per minute")
+    linkedin_invitations_per_minute: float = Field(default=10.0, alias="LINKEDIN_INVITATIONS_PER_MINUTE", description="Max LinkedIn connection requests sent per minute")
+    linkedin_max_concurrent_requests: int = Field(default=8, alias="LINKEDIN_MAX_CONCURRENT_REQUESTS", description="Max in-flight LinkedIn API requests")
+    linkedin_webhook_workers: int = Field(default=4, alias="LINKEDIN_WEBHOOK_WORKERS", description="Background workers processing queued LinkedIn webhooks")
+    linkedin_webhook_queue_size: int = Field(default=10_000, alias="LINKEDIN_WEBHOOK_QUEUE_SIZE", description="Max queued LinkedIn webhook events before new ones are rejected")
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -45,4 +71,11 @@ class Settings(BaseSettings):
         extra="ignore"
     )
 
-settings = Settings()
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Process-wide Settings, parsed from the environment and .env once (usable with Depends)."""
+    return Settings()
+
+
+settings = get_settings()
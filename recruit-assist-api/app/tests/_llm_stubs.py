@@ -0,0 +1,12 @@
+"""Stand-ins for OpenAI SDK response objects used by the LLM service tests."""
+from types import SimpleNamespace
+
+
+def make_resp(text):
+    """Chat completion response whose first choice's message content is text."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=text))])
+
+
+def make_client(create):
+    """OpenAI client stand-in whose chat.completions.create is the given callable."""
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
@@ -0,0 +1,17 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.main import create_app
+from app.models import InterviewSnapshot
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient for the whole session; the app lifespan starts and stops once."""
+    with TestClient(create_app()) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def empty_interview():
+    """An InterviewSnapshot with no interview data, shared by every test (the writers don't mutate it)."""
+    return InterviewSnapshot()
@@ -1,280 +1,180 @@
+from collections import Counter
 import pytest
-from app.models import CandidateCVNormalized, JobDescriptionNormalized, InterviewSnapshot
-from app.services.endorsement_writer import write_endorsement, _write_endorsement_rule_based
+from app.models import (
+    CandidateCVNormalized,
+    ExperienceItem,
+    InterviewSnapshot,
+    JobDescriptionNormalized,
+    RequirementItem,
+    Requirements,
+    SalaryBand,
+    Skill,
+)
+from app.services import endorsement_writer
+from app.services.endorsement_writer import write_endorsement
 
 
-def test_many_partial_matches_vs_few_perfect_matches():
-    """
-    Borderline case: Many △ (partial matches) but few ✔ (perfect matches).
-    This should typically result in a 'Hold' recommendation rather than 'Proceed'.
-    """
-    cv = CandidateCVNormalized.model_validate({
+def _llm_not_configured():
+    raise RuntimeError("LLM disabled for rule-based endorsement tests")
+
+
+# These tests assert on the rule-based writer's output, so write_endorsement takes its
+# fallback path even when an OpenAI key is configured. Module-scoped so it is in
+# place before the module-scoped scenario_endorsements fixture runs.
+@pytest.fixture(scope="module", autouse=True)
+def _force_rule_based():
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(endorsement_writer, "get_openai", _llm_not_configured)
+        yield
+
+
+MARKS = frozenset("✔△✖")
+
+
+def count_marks(text):
+    """Counts of the ✔/△/✖ fit markers, in one pass over the text."""
+    return Counter(ch for ch in text if ch in MARKS)
+
+
+# The base models are validated once per module; each test derives its CV/JD with
+# model_copy, replacing nested fields with already-built models.
+@pytest.fixture(scope="module")
+def base_cv_london():
+    return CandidateCVNormalized.model_validate({
         "candidate": {
-            "full_name": "Borderline Candidate",
+            "full_name": "Base Candidate",
             "location": {"city": "London", "country": "UK"}
         },
-        "experience": [{
-            "title": "Full Stack Developer",
-            "employer": "TechCo",
-            "start_date": "2021-01",
-            "is_current": True,
-            "technologies": ["JavaScript", "Python", "Postgres"],
-            "achievements": [
-                "Some exposure to Node.js in side projects",
-                "Used AWS EC2 but not Lambda",
-                "Basic SQL knowledge"
-            ]
-        }],
-        "skills": [
-            {"name": "JavaScript"},
-            {"name": "Python"},
-            {"name": "PostgreSQL"}
-        ]
+        "skills": []
     })
-    
-    jd = JobDescriptionNormalized.model_validate({
+
+
+@pytest.fixture(scope="module")
+def base_jd_backend():
+    return JobDescriptionNormalized.model_validate({
         "job": {
             "title": "Senior Backend Engineer",
             "client": "ClientCo",
             "location_policy": "hybrid"
         },
-        "requirements": {
-            "must_haves": [
-                {"name": "Node.js & TypeScript", "weight": 0.3},
-                {"name": "AWS Lambda/ECS", "weight": 0.25},
-                {"name": "Advanced SQL", "weight": 0.15}
-            ],
-            "nice_to_haves": []
-        }
+        "requirements": {"must_haves": []}
     })
-    
-    interview = InterviewSnapshot()
-    endorsement = write_endorsement(cv, jd, interview)
-    text = endorsement.endorsement_text
-    
-    # Should have more triangles than checkmarks
-    triangle_count = text.count("△")
-    checkmark_count = text.count("✔")
-    
-    # This is a borderline case - should have more partial matches
-    # Recommendation should be Hold (not Proceed) when partial matches dominate
-    assert triangle_count >= checkmark_count or "Hold" in text, \
-        "Many partial matches should lead to Hold recommendation"
-
-
-def test_few_critical_matches_should_proceed():
-    """
-    Borderline case: Few ✔ but they're all critical/high-weight requirements.
-    Should still recommend Proceed if critical requirements are met.
-    """
-    cv = CandidateCVNormalized.model_validate({
-        "candidate": {
-            "full_name": "Critical Match Candidate",
-            "location": {"city": "London", "country": "UK"}
-        },
-        "experience": [{
-            "title": "Senior Backend Engineer",
-            "employer": "BigTech",
-            "start_date": "2019-01",
-            "is_current": True,
-            "technologies": ["Node.js", "TypeScript", "AWS ECS", "AWS Lambda"],
-            "achievements": [
-                "Expert in Node.js and TypeScript",
-                "Production experience with AWS ECS/Lambda",
-                "Built scalable backend systems"
-            ]
-        }],
-        "skills": [
-            {"name": "Node.js"},
-            {"name": "TypeScript"},
-            {"name": "AWS"}
-        ]
+
+
+def make_cv(base, full_name, skills, **experience):
+    """London candidate with one current role and the named skills."""
+    return base.model_copy(update={
+        "candidate": base.candidate.model_copy(update={"full_name": full_name}),
+        "experience": [ExperienceItem(is_current=True, **experience)],
+        "skills": [Skill(name=name) for name in skills],
     })
-    
-    jd = JobDescriptionNormalized.model_validate({
-        "job": {
-            "title": "Senior Backend Engineer",
-            "client": "ClientCo",
-            "location_policy": "hybrid"
-        },
-        "requirements": {
-            "must_haves": [
-                {"name": "Node.js & TypeScript", "weight": 0.5},  # High weight
-                {"name": "AWS ECS/Lambda", "weight": 0.4}  # High weight
-            ],
-            "nice_to_haves": [
-                {"name": "Kubernetes", "weight": 0.05},
-                {"name": "GraphQL", "weight": 0.05}
-            ]
-        }
+
+
+def make_jd(base, must_haves, nice_to_haves=(), years_experience_min=None, **job):
+    """Job from base with (name, weight) requirements and any JobCore fields overridden."""
+    return base.model_copy(update={
+        "job": base.job.model_copy(update=job),
+        "requirements": Requirements(
+            must_haves=[RequirementItem(name=name, weight=weight) for name, weight in must_haves],
+            nice_to_haves=[RequirementItem(name=name, weight=weight) for name, weight in nice_to_haves],
+            years_experience_min=years_experience_min,
+        ),
     })
-    
-    interview = InterviewSnapshot()
-    endorsement = write_endorsement(cv, jd, interview)
-    text = endorsement.endorsement_text
-    
-    # Even if only 2 checkmarks, they're critical - should proceed
-    checkmark_count = text.count("✔")
-    assert checkmark_count >= 2
-    # Should recommend Proceed because critical requirements are met
-    assert "Proceed" in text or checkmark_count >= 2, \
-        "Few but critical matches should still recommend Proceed"
 
 
-def test_long_notice_period_with_urgent_hiring():
+def test_long_notice_period_with_urgent_hiring(base_cv_london, base_jd_backend):
     """
     Borderline case: Perfect candidate but long notice period vs urgent hiring.
     Should flag as risk and potentially Hold rather than Proceed.
     """
-    cv = CandidateCVNormalized.model_validate({
-        "candidate": {
-            "full_name": "Long Notice Candidate",
-            "location": {"city": "London", "country": "UK"}
-        },
-        "experience": [{
-            "title": "Senior Backend Engineer",
-            "employer": "TechCorp",
-            "start_date": "2018-01",
-            "is_current": True,
-            "technologies": ["Node.js", "TypeScript", "AWS"],
-            "achievements": ["Perfect match for role"]
-        }],
-        "skills": [
-            {"name": "Node.js"},
-            {"name": "TypeScript"},
-            {"name": "AWS"}
-        ]
-    })
-    
-    jd = JobDescriptionNormalized.model_validate({
-        "job": {
-            "title": "Senior Backend Engineer",
-            "client": "UrgentHire",
-            "location_policy": "hybrid",
-            "hiring_urgency": "asap"
-        },
-        "requirements": {
-            "must_haves": [
-                {"name": "Node.js & TypeScript", "weight": 0.3},
-                {"name": "AWS", "weight": 0.25}
-            ],
-            "nice_to_haves": []
-        }
-    })
-    
+    cv = make_cv(
+        base_cv_london, "Long Notice Candidate", ["Node.js", "TypeScript", "AWS"],
+        title="Senior Backend Engineer",
+        employer="TechCorp",
+        start_date="2018-01",
+        technologies=["Node.js", "TypeScript", "AWS"],
+        achievements=["Perfect match for role"]
+    )
+
+    jd = make_jd(
+        base_jd_backend,
+        [
+            ("Node.js & TypeScript", 0.3),
+            ("AWS", 0.25)
+        ],
+        client="UrgentHire",
+        hiring_urgency="asap"
+    )
+
     interview = InterviewSnapshot(notice_period_weeks=12)  # Long notice
     endorsement = write_endorsement(cv, jd, interview)
     text = endorsement.endorsement_text
-    
+
     # Should mention the notice period in risks
     assert "12" in text or "notice" in text.lower() or "weeks" in text.lower(), \
         "Long notice period should be flagged"
-    
+
     # Should have risks/unknowns section mentioning notice
     assert "Risks" in text or "Unknowns" in text, \
         "Should have Risks/Unknowns section for long notice"
 
 
-def test_salary_expectations_above_budget():
+def test_salary_expectations_above_budget(base_cv_london, base_jd_backend):
     """
     Borderline case: Good candidate but salary expectations above budget.
     Should be flagged as risk and potentially Hold.
     """
-    cv = CandidateCVNormalized.model_validate({
-        "candidate": {
-            "full_name": "High Salary Candidate",
-            "location": {"city": "London", "country": "UK"}
-        },
-        "experience": [{
-            "title": "Senior Backend Engineer",
-            "employer": "BigTech",
-            "start_date": "2019-01",
-            "is_current": True,
-            "technologies": ["Node.js", "TypeScript", "AWS"]
-        }],
-        "skills": [
-            {"name": "Node.js"},
-            {"name": "TypeScript"},
-            {"name": "AWS"}
-        ]
-    })
-    
-    jd = JobDescriptionNormalized.model_validate({
-        "job": {
-            "title": "Senior Backend Engineer",
-            "client": "BudgetCorp",
-            "location_policy": "hybrid",
-            "salary_band": {
-                "min": 70000,
-                "max": 80000,
-                "currency": "GBP",
-                "period": "year"
-            }
-        },
-        "requirements": {
-            "must_haves": [
-                {"name": "Node.js & TypeScript", "weight": 0.3}
-            ],
-            "nice_to_haves": []
-        }
-    })
-    
+    cv = make_cv(
+        base_cv_london, "High Salary Candidate", ["Node.js", "TypeScript", "AWS"],
+        title="Senior Backend Engineer",
+        employer="BigTech",
+        start_date="2019-01",
+        technologies=["Node.js", "TypeScript", "AWS"]
+    )
+
+    jd = make_jd(
+        base_jd_backend,
+        [("Node.js & TypeScript", 0.3)],
+        client="BudgetCorp",
+        salary_band=SalaryBand(min=70000, max=80000, currency="GBP", period="year")
+    )
+
     interview = InterviewSnapshot(
         target_comp={"base_min": 95000, "base_max": 100000, "currency": "GBP", "period": "year"}
     )
     endorsement = write_endorsement(cv, jd, interview)
     text = endorsement.endorsement_text
-    
+
     # Should mention salary in compensation section
     assert "Compensation:" in text
     # Should flag salary mismatch as risk if significantly above budget
     assert "95000" in text or "100000" in text or "salary" in text.lower()
 
 
-def test_experience_below_minimum_threshold():
+def test_experience_below_minimum_threshold(base_cv_london, base_jd_backend, empty_interview):
     """
     Borderline case: Good skills but years of experience below minimum requirement.
     Should be flagged and potentially Hold.
     """
-    cv = CandidateCVNormalized.model_validate({
-        "candidate": {
-            "full_name": "Junior Candidate",
-            "location": {"city": "London", "country": "UK"}
-        },
-        "experience": [{
-            "title": "Backend Developer",
-            "employer": "Startup",
-            "start_date": "2022-08",  # Only ~2.5 years
-            "is_current": True,
-            "technologies": ["Node.js", "TypeScript", "AWS"],
-            "achievements": ["Fast learner, strong skills"]
-        }],
-        "skills": [
-            {"name": "Node.js"},
-            {"name": "TypeScript"},
-            {"name": "AWS"}
-        ]
-    })
-    
-    jd = JobDescriptionNormalized.model_validate({
-        "job": {
-            "title": "Senior Backend Engineer",
-            "client": "EnterpriseCo",
-            "location_policy": "hybrid"
-        },
-        "requirements": {
-            "must_haves": [
-                {"name": "Node.js & TypeScript", "weight": 0.3}
-            ],
-            "nice_to_haves": [],
-            "years_experience_min": 5
-        }
-    })
-    
-    interview = InterviewSnapshot()
-    endorsement = write_endorsement(cv, jd, interview)
+    cv = make_cv(
+        base_cv_london, "Junior Candidate", ["Node.js", "TypeScript", "AWS"],
+        title="Backend Developer",
+        employer="Startup",
+        start_date="2022-08",  # Only ~2.5 years
+        technologies=["Node.js", "TypeScript", "AWS"],
+        achievements=["Fast learner, strong skills"]
+    )
+
+    jd = make_jd(
+        base_jd_backend,
+        [("Node.js & TypeScript", 0.3)],
+        years_experience_min=5,
+        client="EnterpriseCo"
+    )
+
+    endorsement = write_endorsement(cv, jd, empty_interview)
     text = endorsement.endorsement_text
-    
+
     # Should mention experience in risks or background
     # The candidate has skills but not enough years
     assert "Background:" in text
@@ -283,217 +183,101 @@ def test_experience_below_minimum_threshold():
         "Should have a recommendation"
 
 
-def test_all_must_haves_met_but_no_nice_to_haves():
-    """
-    Borderline case: All must-haves met but no nice-to-haves.
-    Should still recommend Proceed if must-haves are sufficient.
-    """
-    cv = CandidateCVNormalized.model_validate({
-        "candidate": {
-            "full_name": "Must-Have Only Candidate",
-            "location": {"city": "London", "country": "UK"}
-        },
-        "experience": [{
-            "title": "Backend Engineer",
-            "employer": "TechCo",
-            "start_date": "2020-01",
-            "is_current": True,
-            "technologies": ["Node.js", "TypeScript", "AWS"],
-            "achievements": ["Meets all must-haves"]
-        }],
-        "skills": [
-            {"name": "Node.js"},
-            {"name": "TypeScript"},
-            {"name": "AWS"}
-        ]
-    })
-    
-    jd = JobDescriptionNormalized.model_validate({
-        "job": {
-            "title": "Backend Engineer",
-            "client": "ClientCo",
-            "location_policy": "hybrid"
-        },
-        "requirements": {
-            "must_haves": [
-                {"name": "Node.js & TypeScript", "weight": 0.3},
-                {"name": "AWS", "weight": 0.25}
-            ],
-            "nice_to_haves": [
-                {"name": "Kubernetes", "weight": 0.05},
-                {"name": "Docker", "weight": 0.05}
-            ]
-        }
-    })
-    
-    interview = InterviewSnapshot()
-    # Use rule-based writer directly to test the logic (not LLM)
-    endorsement = _write_endorsement_rule_based(cv, jd, interview)
-    text = endorsement.endorsement_text
-    
-    # All must-haves met - should recommend Proceed
-    checkmark_count = text.count("✔")
-    assert checkmark_count >= 2  # At least 2 must-haves
-    assert "Proceed" in text, \
-        "All must-haves met should recommend Proceed even without nice-to-haves"
-
-
-def test_empty_interview_snapshot():
+def test_empty_interview_snapshot(base_cv_london, base_jd_backend, empty_interview):
     """
     Edge case: Empty interview snapshot (no interview data).
     Should still produce valid endorsement with Unknown values.
     """
-    cv = CandidateCVNormalized.model_validate({
-        "candidate": {
-            "full_name": "No Interview Candidate",
-            "location": {"city": "London", "country": "UK"}
-        },
-        "experience": [{
-            "title": "Backend Engineer",
-            "employer": "TechCo",
-            "start_date": "2020-01",
-            "is_current": True,
-            "technologies": ["Node.js", "TypeScript"]
-        }],
-        "skills": [
-            {"name": "Node.js"},
-            {"name": "TypeScript"}
-        ]
-    })
-    
-    jd = JobDescriptionNormalized.model_validate({
-        "job": {
-            "title": "Backend Engineer",
-            "client": "ClientCo",
-            "location_policy": "hybrid"
-        },
-        "requirements": {
-            "must_haves": [
-                {"name": "Node.js & TypeScript", "weight": 0.3}
-            ],
-            "nice_to_haves": []
-        }
-    })
-    
-    interview = InterviewSnapshot()  # Empty
-    endorsement = write_endorsement(cv, jd, interview)
+    cv = make_cv(
+        base_cv_london, "No Interview Candidate", ["Node.js", "TypeScript"],
+        title="Backend Engineer",
+        employer="TechCo",
+        start_date="2020-01",
+        technologies=["Node.js", "TypeScript"]
+    )
+
+    jd = make_jd(base_jd_backend, [("Node.js & TypeScript", 0.3)], title="Backend Engineer")
+
+    endorsement = write_endorsement(cv, jd, empty_interview)
     text = endorsement.endorsement_text
-    
+
     # Should still produce valid endorsement
     assert endorsement.endorsement_text
     assert "Candidate:" in text
     assert "Recommendation:" in text
-    
+
     # Should handle missing interview data gracefully
     # Motivation might be "Unknown" or missing
     assert "Motivation:" in text or "Background:" in text
 
 
-def test_all_requirements_missing():
+def test_all_requirements_missing(base_cv_london, base_jd_backend, empty_interview):
     """
     Edge case: Candidate with no matching skills/experience.
     Should recommend Reject with multiple ✖ marks.
     """
-    cv = CandidateCVNormalized.model_validate({
-        "candidate": {
-            "full_name": "No Match Candidate",
-            "location": {"city": "London", "country": "UK"}
-        },
-        "experience": [{
-            "title": "Frontend Developer",
-            "employer": "WebCo",
-            "start_date": "2021-01",
-            "is_current": True,
-            "technologies": ["React", "CSS", "HTML"],
-            "achievements": ["Built websites"]
-        }],
-        "skills": [
-            {"name": "React"},
-            {"name": "CSS"}
-        ]
-    })
-    
-    jd = JobDescriptionNormalized.model_validate({
-        "job": {
-            "title": "Senior Backend Engineer",
-            "client": "BackendCo",
-            "location_policy": "remote"
-        },
-        "requirements": {
-            "must_haves": [
-                {"name": "Node.js & TypeScript", "weight": 0.4},
-                {"name": "Backend API design", "weight": 0.3},
-                {"name": "Database design", "weight": 0.2}
-            ],
-            "nice_to_haves": []
-        }
-    })
-    
-    interview = InterviewSnapshot()
-    endorsement = write_endorsement(cv, jd, interview)
+    cv = make_cv(
+        base_cv_london, "No Match Candidate", ["React", "CSS"],
+        title="Frontend Developer",
+        employer="WebCo",
+        start_date="2021-01",
+        technologies=["React", "CSS", "HTML"],
+        achievements=["Built websites"]
+    )
+
+    jd = make_jd(
+        base_jd_backend,
+        [
+            ("Node.js & TypeScript", 0.4),
+            ("Backend API design", 0.3),
+            ("Database design", 0.2)
+        ],
+        client="BackendCo",
+        location_policy="remote"
+    )
+
+    endorsement = write_endorsement(cv, jd, empty_interview)
     text = endorsement.endorsement_text
-    
+
     # Should have multiple X marks
-    xmark_count = text.count("✖")
+    xmark_count = count_marks(text)["✖"]
     assert xmark_count >= 2, \
         "No match candidate should have multiple ✖ marks"
-    
+
     # Should recommend Reject
     assert "Reject" in text, \
         "No matching requirements should recommend Reject"
 
 
-def test_evidence_quotes_required_for_checkmarks():
+def test_evidence_quotes_required_for_checkmarks(base_cv_london, base_jd_backend, empty_interview):
     """
     Borderline case: Verify that checkmarks (✔) are accompanied by evidence quotes.
     Evidence should be short verbatim snippets from CV or interview.
     """
-    cv = CandidateCVNormalized.model_validate({
-        "candidate": {
-            "full_name": "Evidence Test Candidate",
-            "location": {"city": "London", "country": "UK"}
-        },
-        "experience": [{
-            "title": "Senior Backend Engineer",
-            "employer": "FintechCo",
-            "start_date": "2020-01",
-            "is_current": True,
-            "technologies": ["Node.js", "TypeScript", "AWS ECS"],
-            "achievements": [
-                "Built high-throughput REST APIs handling 10k+ req/sec",
-                "Owned CI/CD pipelines for microservices"
-            ],
-            "responsibilities": [
-                "Design and implement REST APIs using Node.js and TypeScript",
-                "Manage AWS infrastructure including ECS and Lambda"
-            ]
-        }],
-        "skills": [
-            {"name": "Node.js"},
-            {"name": "TypeScript"},
-            {"name": "AWS"}
+    cv = make_cv(
+        base_cv_london, "Evidence Test Candidate", ["Node.js", "TypeScript", "AWS"],
+        title="Senior Backend Engineer",
+        employer="FintechCo",
+        start_date="2020-01",
+        technologies=["Node.js", "TypeScript", "AWS ECS"],
+        achievements=[
+            "Built high-throughput REST APIs handling 10k+ req/sec",
+            "Owned CI/CD pipelines for microservices"
+        ],
+        responsibilities=[
+            "Design and implement REST APIs using Node.js and TypeScript",
+            "Manage AWS infrastructure including ECS and Lambda"
         ]
-    })
-    
-    jd = JobDescriptionNormalized.model_validate({
-        "job": {
-            "title": "Senior Backend Engineer",
-            "client": "ClientCo",
-            "location_policy": "hybrid"
-        },
-        "requirements": {
-            "must_haves": [
-                {"name": "Node.js & TypeScript", "weight": 0.3},
-                {"name": "AWS ECS", "weight": 0.25}
-            ],
-            "nice_to_haves": []
-        }
-    })
-    
-    interview = InterviewSnapshot()
-    endorsement = write_endorsement(cv, jd, interview)
+    )
+
+    jd = make_jd(base_jd_backend, [
+        ("Node.js & TypeScript", 0.3),
+        ("AWS ECS", 0.25)
+    ])
+
+    endorsement = write_endorsement(cv, jd, empty_interview)
     text = endorsement.endorsement_text
-    
+
     # If there are checkmarks, there should be evidence
     if "✔" in text:
         # Evidence might be in format: evidence: "quote" or just quoted text
@@ -502,58 +286,119 @@ def test_evidence_quotes_required_for_checkmarks():
             "Checkmarks must be accompanied by evidence quotes from CV/interview"
 
 
-def test_recommendation_consistency():
-    """
-    Test that recommendations are consistent with fit assessment:
-    - Many ✔ + few ✖ = Proceed
-    - Many △ + few ✔ = Hold
-    - Many ✖ = Reject
-    """
-    # Test case 1: Many checkmarks should Proceed
-    cv_strong = CandidateCVNormalized.model_validate({
-        "candidate": {
-            "full_name": "Strong Match",
-            "location": {"city": "London", "country": "UK"}
-        },
-        "experience": [{
-            "title": "Senior Backend Engineer",
-            "employer": "TechCo",
-            "start_date": "2019-01",
-            "is_current": True,
-            "technologies": ["Node.js", "TypeScript", "AWS ECS", "AWS Lambda", "Postgres"]
-        }],
-        "skills": [
-            {"name": "Node.js"},
-            {"name": "TypeScript"},
-            {"name": "AWS"},
-            {"name": "PostgreSQL"}
+# Recommendation scenarios: each endorsement is written once and checked by several
+# assertions. id -> (make_cv arguments, make_jd arguments)
+SCENARIOS = {
+    # Many △ (partial matches) but few ✔ (perfect matches): typically Hold rather than Proceed
+    "many_partial_matches": (dict(
+        full_name="Borderline Candidate",
+        skills=["JavaScript", "Python", "PostgreSQL"],
+        title="Full Stack Developer",
+        employer="TechCo",
+        start_date="2021-01",
+        technologies=["JavaScript", "Python", "Postgres"],
+        achievements=[
+            "Some exposure to Node.js in side projects",
+            "Used AWS EC2 but not Lambda",
+            "Basic SQL knowledge"
         ]
-    })
-    
-    jd_critical = JobDescriptionNormalized.model_validate({
-        "job": {
-            "title": "Senior Backend Engineer",
-            "client": "ClientCo",
-            "location_policy": "hybrid"
-        },
-        "requirements": {
-            "must_haves": [
-                {"name": "Node.js & TypeScript", "weight": 0.5},
-                {"name": "AWS", "weight": 0.3}
-            ],
-            "nice_to_haves": []
-        }
-    })
-    
-    # Use rule-based writer directly to test the logic (not LLM)
-    endorsement = _write_endorsement_rule_based(cv_strong, jd_critical, InterviewSnapshot())
-    text_strong = endorsement.endorsement_text
-    
-    # Strong match should recommend Proceed
-    checkmarks_strong = text_strong.count("✔")
-    assert checkmarks_strong >= 2
-    assert "Proceed" in text_strong, \
-        "Strong match (many ✔) should recommend Proceed"
+    ), dict(must_haves=[
+        ("Node.js & TypeScript", 0.3),
+        ("AWS Lambda/ECS", 0.25),
+        ("Advanced SQL", 0.15)
+    ])),
+    # Few ✔ but all on critical/high-weight requirements: still Proceed
+    "few_critical_matches": (dict(
+        full_name="Critical Match Candidate",
+        skills=["Node.js", "TypeScript", "AWS"],
+        title="Senior Backend Engineer",
+        employer="BigTech",
+        start_date="2019-01",
+        technologies=["Node.js", "TypeScript", "AWS ECS", "AWS Lambda"],
+        achievements=[
+            "Expert in Node.js and TypeScript",
+            "Production experience with AWS ECS/Lambda",
+            "Built scalable backend systems"
+        ]
+    ), dict(must_haves=[
+        ("Node.js & TypeScript", 0.5),  # High weight
+        ("AWS ECS/Lambda", 0.4)  # High weight
+    ], nice_to_haves=[
+        ("Kubernetes", 0.05),
+        ("GraphQL", 0.05)
+    ])),
+    # All must-haves met but no nice-to-haves: Proceed
+    "must_haves_only": (dict(
+        full_name="Must-Have Only Candidate",
+        skills=["Node.js", "TypeScript", "AWS"],
+        title="Backend Engineer",
+        employer="TechCo",
+        start_date="2020-01",
+        technologies=["Node.js", "TypeScript", "AWS"],
+        achievements=["Meets all must-haves"]
+    ), dict(must_haves=[
+        ("Node.js & TypeScript", 0.3),
+        ("AWS", 0.25)
+    ], nice_to_haves=[
+        ("Kubernetes", 0.05),
+        ("Docker", 0.05)
+    ], title="Backend Engineer")),
+    # Recommendation consistency - many ✔ + few ✖ = Proceed
+    "strong_match": (dict(
+        full_name="Strong Match",
+        skills=["Node.js", "TypeScript", "AWS", "PostgreSQL"],
+        title="Senior Backend Engineer",
+        employer="TechCo",
+        start_date="2019-01",
+        technologies=["Node.js", "TypeScript", "AWS ECS", "AWS Lambda", "Postgres"]
+    ), dict(must_haves=[
+        ("Node.js & TypeScript", 0.5),
+        ("AWS", 0.3)
+    ])),
+}
+
 
+@pytest.fixture(scope="module")
+def scenario_endorsements(base_cv_london, base_jd_backend, empty_interview):
+    """scenario id -> (endorsement text, its marker counts)"""
+    endorsements = {}
+    for scenario_id, (cv_args, jd_args) in SCENARIOS.items():
+        text = write_endorsement(
+            make_cv(base_cv_london, **cv_args), make_jd(base_jd_backend, **jd_args), empty_interview
+        ).endorsement_text
+        endorsements[scenario_id] = text, count_marks(text)
+    return endorsements
 
 
+@pytest.mark.parametrize("scenario_id, check, message", [
+    pytest.param(
+        "many_partial_matches", lambda text, marks: marks["△"] >= marks["✔"] or "Hold" in text,
+        "Many partial matches should lead to Hold recommendation", id="many_partial_matches-hold"
+    ),
+    pytest.param(
+        "few_critical_matches", lambda text, marks: marks["✔"] >= 2,
+        "Few but critical matches should have at least 2 ✔", id="few_critical_matches-checkmarks"
+    ),
+    pytest.param(
+        "few_critical_matches", lambda text, marks: "Proceed" in text or marks["✔"] >= 2,
+        "Few but critical matches should still recommend Proceed", id="few_critical_matches-proceed"
+    ),
+    pytest.param(
+        "must_haves_only", lambda text, marks: marks["✔"] >= 2,
+        "All must-haves met should have at least 2 ✔", id="must_haves_only-checkmarks"
+    ),
+    pytest.param(
+        "must_haves_only", lambda text, marks: "Proceed" in text,
+        "All must-haves met should recommend Proceed even without nice-to-haves", id="must_haves_only-proceed"
+    ),
+    pytest.param(
+        "strong_match", lambda text, marks: marks["✔"] >= 2,
+        "Strong match should have at least 2 ✔", id="strong_match-checkmarks"
+    ),
+    pytest.param(
+        "strong_match", lambda text, marks: "Proceed" in text,
+        "Strong match (many ✔) should recommend Proceed", id="strong_match-proceed"
+    ),
+])
+def test_recommendation_scenarios(scenario_endorsements, scenario_id, check, message):
+    assert check(*scenario_endorsements[scenario_id]), message
@@ -1,23 +1,71 @@
 import pytest
 import json
-from datetime import datetime
 from app.models import CandidateCVNormalized
 from app.services import cv_parser_llm
-
-
-class DummyMessage:
-    def __init__(self, text):
-        self.content = text
-
-
-class DummyChoice:
-    def __init__(self, text):
-        self.message = DummyMessage(text)
-
-
-class DummyResp:
-    def __init__(self, text):
-        self.choices = [DummyChoice(text)]
+from app.tests._llm_stubs import make_resp
+
+
+# Dummy uploads: valid PDF/DOCX signatures followed by filler
+_DUMMY_PDF = b"%PDF-1.4\n" + b"dummy content" * 100
+_DUMMY_DOCX = b"PK\x03\x04" + b"dummy content" * 100
+_MINIMAL_PDF = b"%PDF-1.4\ndummy content"
+
+
+# A valid CandidateCVNormalized JSON structure, serialised once and returned by every call
+_CV_JSON = json.dumps({
+    "candidate": {
+        "full_name": "John Smith",
+        "email": "john.smith@example.com",
+        "phone": "+44 7700 900123",
+        "linkedin_url": "https://www.linkedin.com/in/johnsmith",
+        "location": {
+            "city": "Manchester",
+            "country": "UK",
+            "remote_preference": "hybrid"
+        },
+        "right_to_work": ["UK"],
+        "notice_period_weeks": None
+    },
+    "experience": [
+        {
+            "title": "Senior Backend Engineer",
+            "employer": "FintechCo",
+            "location": "Manchester",
+            "start_date": "2022-01",
+            "end_date": None,
+            "is_current": True,
+            "responsibilities": [
+                "Design REST APIs",
+                "Own on-call rotation"
+            ],
+            "achievements": [
+                "Reduced p95 latency by 40%"
+            ],
+            "technologies": ["Node.js", "TypeScript", "Postgres", "AWS ECS"],
+            "team_size": 3
+        }
+    ],
+    "skills": [
+        {
+            "name": "Node.js",
+            "category": "tech",
+            "level": "expert",
+            "evidence": ["Built high-throughput APIs"]
+        },
+        {
+            "name": "AWS",
+            "category": "tech",
+            "level": "advanced",
+            "evidence": ["ECS, RDS in production"]
+        }
+    ],
+    "extraction_meta": {
+        "source": "pdf",
+        "extracted_at": "2024-01-01T00:00:00",
+        "parser_version": "cvx-1.2.0"
+    }
+})
+_CV_RESP = make_resp(_CV_JSON)
 
 
 class DummyClient:
@@ -25,68 +73,21 @@ class DummyClient:
         class completions:
             @staticmethod
             def create(model, messages, **kwargs):
-                # Return a valid CandidateCVNormalized JSON structure
-                cv_json = {
-                    "candidate": {
-                        "full_name": "John Smith",
-                        "email": "john.smith@example.com",
-                        "phone": "+44 7700 900123",
-                        "linkedin_url": "https://www.linkedin.com/in/johnsmith",
-                        "location": {
-                            "city": "Manchester",
-                            "country": "UK",
-                            "remote_preference": "hybrid"
-                        },
-                        "right_to_work": ["UK"],
-                        "notice_period_weeks": None
-                    },
-                    "experience": [
-                        {
-                            "title": "Senior Backend Engineer",
-                            "employer": "FintechCo",
-                            "location": "Manchester",
-                            "start_date": "2022-01",
-                            "end_date": None,
-                            "is_current": True,
-                            "responsibilities": [
-                                "Design REST APIs",
-                                "Own on-call rotation"
-                            ],
-                            "achievements": [
-                                "Reduced p95 latency by 40%"
-                            ],
-                            "technologies": ["Node.js", "TypeScript", "Postgres", "AWS ECS"],
-                            "team_size": 3
-                        }
-                    ],
-                    "skills": [
-                        {
-                            "name": "Node.js",
-                            "category": "tech",
-                            "level": "expert",
-                            "evidence": ["Built high-throughput APIs"]
-                        },
-                        {
-                            "name": "AWS",
-                            "category": "tech",
-                            "level": "advanced",
-                            "evidence": ["ECS, RDS in production"]
-                        }
-                    ],
-                    "extraction_meta": {
-                        "source": "pdf",
-                        "extracted_at": datetime.utcnow().isoformat(),
-                        "parser_version": "cvx-1.2.0"
-                    }
-                }
-                return DummyResp(json.dumps(cv_json))
-
-
-def test_parse_cv_bytes_to_normalized_llm_pdf(monkeypatch):
+                return _CV_RESP
+
+
+@pytest.fixture
+def patch_llm(monkeypatch):
+    """Returns apply(client, extract): stub cv_parser_llm's OpenAI client and, if given, its text extraction."""
+    def apply(client=DummyClient(), extract=None):
+        monkeypatch.setattr(cv_parser_llm, "get_openai", lambda: client)
+        if extract is not None:
+            monkeypatch.setattr(cv_parser_llm, "_extract_text_from_bytes", extract)
+    return apply
+
+
+def test_parse_cv_bytes_to_normalized_llm_pdf(patch_llm):
     """Test LLM-based CV parsing with PDF file"""
-    # Mock OpenAI client
-    monkeypatch.setattr(cv_parser_llm, "get_openai", lambda: DummyClient())
-    
     # Mock text extraction to return sample CV text
     def mock_extract_text(data, filename):
         return """John Smith
@@ -109,13 +110,10 @@ SKILLS
 - AWS (Advanced) - ECS, RDS in production
 """
     
-    monkeypatch.setattr(cv_parser_llm, "_extract_text_from_bytes", mock_extract_text)
-    
-    # Create dummy PDF bytes (just needs to pass the initial check)
-    pdf_bytes = b"%PDF-1.4\n" + b"dummy content" * 100
+    patch_llm(extract=mock_extract_text)
     
     result = cv_parser_llm.parse_cv_bytes_to_normalized_llm(
-        data=pdf_bytes,
+        data=_DUMMY_PDF,
         filename="john_smith_cv.pdf"
     )
     
@@ -135,22 +133,16 @@ SKILLS
     assert result.extraction_meta.source == "pdf"
 
 
-def test_parse_cv_bytes_to_normalized_llm_docx(monkeypatch):
+def test_parse_cv_bytes_to_normalized_llm_docx(patch_llm):
     """Test LLM-based CV parsing with DOCX file"""
-    # Mock OpenAI client
-    monkeypatch.setattr(cv_parser_llm, "get_openai", lambda: DummyClient())
-    
     # Mock text extraction
     def mock_extract_text(data, filename):
         return "John Smith\nSenior Backend Engineer\n..."
     
-    monkeypatch.setattr(cv_parser_llm, "_extract_text_from_bytes", mock_extract_text)
-    
-    # Create dummy DOCX bytes (ZIP signature)
-    docx_bytes = b"PK\x03\x04" + b"dummy content" * 100
+    patch_llm(extract=mock_extract_text)
     
     result = cv_parser_llm.parse_cv_bytes_to_normalized_llm(
-        data=docx_bytes,
+        data=_DUMMY_DOCX,
         filename="cv.docx"
     )
     
@@ -168,9 +160,8 @@ def test_parse_cv_bytes_to_normalized_llm_fallback_no_api_key(monkeypatch):
     monkeypatch.setattr(cv_parser_llm, "get_openai", raise_runtime_error)
     
     # Should fall back to stub parser
-    pdf_bytes = b"%PDF-1.4\n" + b"dummy content"
     result = cv_parser_llm.parse_cv_bytes_to_normalized_llm(
-        data=pdf_bytes,
+        data=_MINIMAL_PDF,
         filename="test_cv.pdf"
     )
     
@@ -180,20 +171,16 @@ def test_parse_cv_bytes_to_normalized_llm_fallback_no_api_key(monkeypatch):
     assert len(result.skills) > 0  # Stub should have skills
 
 
-def test_parse_cv_bytes_to_normalized_llm_fallback_empty_text(monkeypatch):
+def test_parse_cv_bytes_to_normalized_llm_fallback_empty_text(patch_llm):
     """Test that it falls back to stub parser when text extraction returns empty"""
-    # Mock OpenAI client
-    monkeypatch.setattr(cv_parser_llm, "get_openai", lambda: DummyClient())
-    
     # Mock text extraction to return empty string
     def mock_extract_text_empty(data, filename):
         return ""
     
-    monkeypatch.setattr(cv_parser_llm, "_extract_text_from_bytes", mock_extract_text_empty)
+    patch_llm(extract=mock_extract_text_empty)
     
-    pdf_bytes = b"%PDF-1.4\n" + b"dummy content"
     result = cv_parser_llm.parse_cv_bytes_to_normalized_llm(
-        data=pdf_bytes,
+        data=_MINIMAL_PDF,
         filename="empty_cv.pdf"
     )
     
@@ -202,7 +189,7 @@ def test_parse_cv_bytes_to_normalized_llm_fallback_empty_text(monkeypatch):
     assert result.candidate.full_name
 
 
-def test_parse_cv_bytes_to_normalized_llm_fallback_invalid_json(monkeypatch):
+def test_parse_cv_bytes_to_normalized_llm_fallback_invalid_json(patch_llm):
     """Test that it falls back to stub parser when LLM returns invalid JSON"""
     # Mock OpenAI client to return invalid JSON
     class DummyClientInvalid:
@@ -210,19 +197,16 @@ def test_parse_cv_bytes_to_normalized_llm_fallback_invalid_json(monkeypatch):
             class completions:
                 @staticmethod
                 def create(model, messages, **kwargs):
-                    return DummyResp("This is not valid JSON")
-    
-    monkeypatch.setattr(cv_parser_llm, "get_openai", lambda: DummyClientInvalid())
+                    return make_resp("This is not valid JSON")
     
     # Mock text extraction
     def mock_extract_text(data, filename):
         return "Some CV text"
     
-    monkeypatch.setattr(cv_parser_llm, "_extract_text_from_bytes", mock_extract_text)
+    patch_llm(client=DummyClientInvalid(), extract=mock_extract_text)
     
-    pdf_bytes = b"%PDF-1.4\n" + b"dummy content"
     result = cv_parser_llm.parse_cv_bytes_to_normalized_llm(
-        data=pdf_bytes,
+        data=_MINIMAL_PDF,
         filename="test_cv.pdf"
     )
     
@@ -0,0 +1,26 @@
+from sqlalchemy import create_engine, inspect, text
+from app.database import Base, ensure_schema
+from app.db_models import CandidateProfile, JobPosting
+
+
+def index_names(engine, table):
+    return {index["name"] for index in inspect(engine).get_indexes(table)}
+
+
+def test_ensure_schema_adds_indexes_missing_from_existing_tables():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        Base.metadata.create_all(conn)
+        # A database created before these indexes were added to the models
+        conn.execute(text("DROP INDEX idx_profile_candidate_job"))
+        conn.execute(text("DROP INDEX idx_job_active_client_title"))
+
+    with engine.begin() as conn:
+        ensure_schema(conn)
+    with engine.begin() as conn:
+        ensure_schema(conn)  # idempotent
+
+    assert "idx_profile_candidate_job" in index_names(engine, CandidateProfile.__tablename__)
+    assert "idx_job_active_client_title" in index_names(engine, JobPosting.__tablename__)
+    unique = {i["name"] for i in inspect(engine).get_indexes(CandidateProfile.__tablename__) if i["unique"]}
+    assert "idx_profile_candidate_job" in unique
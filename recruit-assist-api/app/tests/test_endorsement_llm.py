@@ -1,21 +1,6 @@
-import pytest
-from app.models import CandidateCVNormalized, JobDescriptionNormalized, InterviewSnapshot
+from app.models import CandidateCVNormalized, JobDescriptionNormalized
 from app.services import endorsement_llm
-
-
-class DummyMessage:
-    def __init__(self, text):
-        self.content = text
-
-
-class DummyChoice:
-    def __init__(self, text):
-        self.message = DummyMessage(text)
-
-
-class DummyResp:
-    def __init__(self, text):
-        self.choices = [DummyChoice(text)]
+from app.tests._llm_stubs import make_resp
 
 
 class DummyClient:
@@ -23,10 +8,10 @@ class DummyClient:
         class completions:
             @staticmethod
             def create(model, messages, **kwargs):
-                return DummyResp("Candidate: Alex — Leeds, UK\nBackground: ...\nMotivation: ...\nCompensation: Unknown → Unknown\nNotice: Unknown\nLocation: Hybrid\nFit vs JD:\n- Node: ✔ — ...\nRisks/Unknowns: None material\nRecommendation: Proceed — ...")
+                return make_resp("Candidate: Alex — Leeds, UK\nBackground: ...\nMotivation: ...\nCompensation: Unknown → Unknown\nNotice: Unknown\nLocation: Hybrid\nFit vs JD:\n- Node: ✔ — ...\nRisks/Unknowns: None material\nRecommendation: Proceed — ...")
 
 
-def test_generate_endorsement_llm_monkeypatch(monkeypatch):
+def test_generate_endorsement_llm_monkeypatch(monkeypatch, empty_interview):
     monkeypatch.setattr(endorsement_llm, "get_openai", lambda: DummyClient())
 
     cv = CandidateCVNormalized.model_validate({
@@ -38,6 +23,5 @@ def test_generate_endorsement_llm_monkeypatch(monkeypatch):
         "job": {"title": "Engineer", "client": "Client", "location_policy": "hybrid"},
         "requirements": {"must_haves": [{"name": "Node"}], "nice_to_haves": []}
     })
-    iv = InterviewSnapshot.model_validate({})
-    out = endorsement_llm.generate_endorsement_llm(cv, jd, iv)
+    out = endorsement_llm.generate_endorsement_llm(cv, jd, empty_interview)
     assert "Candidate:" in out.endorsement_text
@@ -0,0 +1,64 @@
+import json
+import logging
+import time
+from datetime import datetime, timedelta
+from app.services.gdpr import AuditEntry, AuditLogBuffer, GDPRCompliance
+
+
+def make_buffer():
+    # Long interval and high threshold so the flusher thread never drains the test's entries
+    return AuditLogBuffer(flush_interval=3600, flush_threshold=1_000_000)
+
+
+def test_audit_buffer_keeps_every_entry_when_the_flusher_falls_behind():
+    buffer = make_buffer()
+    for i in range(10_000):
+        buffer.append(AuditEntry(ts_ns=time.time_ns(), action="access", cv_id=str(i)))
+
+    assert buffer.flush() == 10_000
+    assert buffer.flush() == 0
+
+
+def test_audit_flush_writes_iso_timestamps(caplog):
+    buffer = make_buffer()
+    buffer.append(AuditEntry(ts_ns=1_700_000_000_000_000_000, action="upload", cv_id="cv-1"))
+
+    with caplog.at_level(logging.INFO, logger="app.services.gdpr"):
+        buffer.flush()
+
+    entry = json.loads(caplog.records[-1].getMessage().splitlines()[1])
+    assert entry["timestamp"] == "2023-11-14T22:13:20"
+    assert "ts_ns" not in entry
+    assert entry["action"] == "upload"
+    assert entry["cv_id"] == "cv-1"
+
+
+def test_consent_record_has_iso_timestamps():
+    record = GDPRCompliance(retention_days=30).create_consent_record("jane@example.com")
+
+    assert "ts_ns" not in record
+    assert "expiry_ns" not in record
+    timestamp = datetime.fromisoformat(record["timestamp"])
+    expiry = datetime.fromisoformat(record["expiry_date"])
+    assert expiry - timestamp == timedelta(days=30)
+
+
+def test_validate_consent_checks_iso_expiry_date():
+    gdpr = GDPRCompliance()
+    expired = {"granted": True, "expiry_date": (datetime.utcnow() - timedelta(days=1)).isoformat()}
+    current = {"granted": True, "expiry_date": (datetime.utcnow() + timedelta(days=1)).isoformat()}
+
+    assert gdpr.validate_consent(expired) is False
+    assert gdpr.validate_consent(current) is True
+    assert gdpr.validate_consent(gdpr.create_consent_record("jane@example.com")) is True
+    assert gdpr.validate_consent(gdpr.create_consent_record("jane@example.com", granted=False)) is False
+
+
+def test_consent_endpoint_returns_iso_timestamps(client):
+    r = client.post("/compliance/consent", json={"email": "jane@example.com"})
+    assert r.status_code == 200
+    record = r.json()["consent_record"]
+    assert set(record) >= {"timestamp", "expiry_date"}
+    assert "ts_ns" not in record and "expiry_ns" not in record
+    datetime.fromisoformat(record["timestamp"])
+    datetime.fromisoformat(record["expiry_date"])
@@ -1,53 +1,106 @@
 import json
 import pytest
 from pathlib import Path
+from pydantic import BaseModel, Field, TypeAdapter
 from app.models import CandidateCVNormalized, JobDescriptionNormalized, InterviewSnapshot
 from app.services.endorsement_writer import write_endorsement, _write_endorsement_rule_based
 
 # Load golden test data
 _FIXTURES_DIR = Path(__file__).parent / "fixtures"
 _GOLDEN_DATA_PATH = _FIXTURES_DIR / "golden_cv_jd_pairs.json"
-
-
-def _load_golden_data():
-    """Load golden test data from JSON file."""
-    with open(_GOLDEN_DATA_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+_GOLDEN_DATA = json.loads(_GOLDEN_DATA_PATH.read_text(encoding="utf-8"))
+_GOLDEN_PAIRS = _GOLDEN_DATA["golden_pairs"]
+_PAIRS_BY_NAME = {pair["name"]: pair for pair in _GOLDEN_PAIRS}
+
+
+class _GoldenPair(BaseModel):
+    """The validated parts of a golden pair; expectation keys are read from the raw dict."""
+    name: str
+    cv: CandidateCVNormalized
+    jd: JobDescriptionNormalized
+    interview: InterviewSnapshot = Field(default_factory=InterviewSnapshot)
+
+
+_GOLDEN_PAIRS_ADAPTER = TypeAdapter(list[_GoldenPair])
+
+# Sections every endorsement must contain
+_REQUIRED_SECTIONS = frozenset({
+    "Candidate:",
+    "Background:",
+    "Motivation:",
+    "Compensation:",
+    "Notice:",
+    "Location:",
+    "Fit vs JD:",
+    "Risks/Unknowns:",
+    "Recommendation:",
+})
+
+
+def _endorsement_stats(text):
+    """Scan an endorsement once for everything the assertions below look at."""
+    return {
+        "text": text,
+        "lower": text.lower(),
+        "words": len(text.split()),
+        "check_count": text.count("✔"),
+        "triangle_count": text.count("△"),
+        "xmark_count": text.count("✖"),
+        "sections_present": {section for section in _REQUIRED_SECTIONS if section in text},
+    }
 
 
 @pytest.fixture
 def golden_pairs():
     """Fixture providing access to all golden CV/JD pairs."""
-    data = _load_golden_data()
-    return data["golden_pairs"]
+    return _GOLDEN_PAIRS
+
+
+@pytest.fixture(scope="module")
+def validated_golden_pairs():
+    """Validated (cv, jd, interview) models for every golden pair, keyed by pair name.
+
+    Validation runs once per module; the endorsement writers only read these
+    models, so the tests can share them.
+    """
+    return {
+        pair.name: (pair.cv, pair.jd, pair.interview)
+        for pair in _GOLDEN_PAIRS_ADAPTER.validate_python(_GOLDEN_PAIRS)
+    }
+
+
+@pytest.fixture(scope="module")
+def endorsements_by_name(validated_golden_pairs):
+    """Stats of the write_endorsement output for every golden pair, generated once per module."""
+    return {
+        name: _endorsement_stats(write_endorsement(cv, jd, interview).endorsement_text)
+        for name, (cv, jd, interview) in validated_golden_pairs.items()
+    }
 
 
 def test_golden_data_file_exists():
-    """Ensure the golden data file exists and is valid JSON."""
-    assert _GOLDEN_DATA_PATH.exists(), f"Golden data file not found: {_GOLDEN_DATA_PATH}"
-    data = _load_golden_data()
-    assert "golden_pairs" in data
-    assert isinstance(data["golden_pairs"], list)
-    assert len(data["golden_pairs"]) > 0
+    """Ensure the golden data file exists and is valid JSON (a missing or malformed file fails at import)."""
+    assert "golden_pairs" in _GOLDEN_DATA
+    assert isinstance(_GOLDEN_DATA["golden_pairs"], list)
+    assert len(_GOLDEN_DATA["golden_pairs"]) > 0
 
 
-def test_golden_data_schema_validation(golden_pairs):
+def test_golden_data_schema_validation(golden_pairs, validated_golden_pairs):
     """Validate that all golden CV/JD pairs match their respective schemas."""
     for pair in golden_pairs:
+        cv, jd, interview = validated_golden_pairs[pair["name"]]
+
         # Validate CV
-        cv = CandidateCVNormalized.model_validate(pair["cv"])
         assert cv.candidate.full_name
         assert len(cv.experience) > 0
         
         # Validate JD
-        jd = JobDescriptionNormalized.model_validate(pair["jd"])
         assert jd.job.title
         assert jd.job.client
         assert len(jd.requirements.must_haves) > 0
         
         # Validate interview (if provided)
         if pair.get("interview"):
-            interview = InterviewSnapshot.model_validate(pair["interview"])
             assert isinstance(interview, InterviewSnapshot)
 
 
@@ -59,53 +112,35 @@ def test_golden_data_schema_validation(golden_pairs):
     "salary_out_of_range",
     "minimal_experience_below_threshold"
 ])
-def test_endorsement_format_compliance(pair_name, golden_pairs):
+def test_endorsement_format_compliance(pair_name, endorsements_by_name):
     """Test that endorsements follow the required format for all golden pairs."""
-    pair = next((p for p in golden_pairs if p["name"] == pair_name), None)
+    pair = _PAIRS_BY_NAME.get(pair_name)
     assert pair is not None, f"Golden pair '{pair_name}' not found"
     
-    cv = CandidateCVNormalized.model_validate(pair["cv"])
-    jd = JobDescriptionNormalized.model_validate(pair["jd"])
-    interview = InterviewSnapshot.model_validate(pair.get("interview", {}))
-    
-    endorsement = write_endorsement(cv, jd, interview)
-    text = endorsement.endorsement_text
+    data = endorsements_by_name[pair["name"]]
+    text = data["text"]
     
     # Must have all required sections
-    required_sections = [
-        "Candidate:",
-        "Background:",
-        "Motivation:",
-        "Compensation:",
-        "Notice:",
-        "Location:",
-        "Fit vs JD:",
-        "Risks/Unknowns:",
-        "Recommendation:"
-    ]
-    
-    for section in required_sections:
-        assert section in text, f"Missing required section '{section}' in endorsement for {pair_name}"
+    missing = _REQUIRED_SECTIONS - data["sections_present"]
+    assert not missing, f"Missing required sections {sorted(missing)} in endorsement for {pair_name}"
     
     # Must use correct symbols for fit assessment
-    assert any(mark in text for mark in ["✔", "△", "✖"]), \
+    assert data["check_count"] or data["triangle_count"] or data["xmark_count"], \
         f"No fit assessment symbols (✔/△/✖) found in endorsement for {pair_name}"
     
     # Recommendation must be one of the expected values
-    recommendation_line = [line for line in text.split("\n") if "Recommendation:" in line]
-    assert len(recommendation_line) > 0, f"No recommendation found in endorsement for {pair_name}"
-    assert any(rec in recommendation_line[0] for rec in ["Proceed", "Hold", "Reject"]), \
+    assert "Recommendation:" in text, f"No recommendation found in endorsement for {pair_name}"
+    recommendation_line = text.partition("Recommendation:")[2].split("\n", 1)[0]
+    assert any(rec in recommendation_line for rec in ("Proceed", "Hold", "Reject")), \
         f"Invalid recommendation format for {pair_name}"
 
 
-def test_perfect_match_proceed_recommendation(golden_pairs):
+def test_perfect_match_proceed_recommendation(validated_golden_pairs):
     """Test that perfect match candidate gets Proceed recommendation."""
-    pair = next((p for p in golden_pairs if p["name"] == "perfect_match_backend_engineer"), None)
+    pair = _PAIRS_BY_NAME.get("perfect_match_backend_engineer")
     assert pair is not None
     
-    cv = CandidateCVNormalized.model_validate(pair["cv"])
-    jd = JobDescriptionNormalized.model_validate(pair["jd"])
-    interview = InterviewSnapshot.model_validate(pair.get("interview", {}))
+    cv, jd, interview = validated_golden_pairs[pair["name"]]
     
     # Use rule-based writer directly to test the logic (not LLM)
     endorsement = _write_endorsement_rule_based(cv, jd, interview)
@@ -124,21 +159,17 @@ def test_perfect_match_proceed_recommendation(golden_pairs):
     assert "Proceed" in text, f"Expected 'Proceed' recommendation, got: {text.split('Recommendation:')[-1]}"
 
 
-def test_borderline_partial_matches(golden_pairs):
+def test_borderline_partial_matches(endorsements_by_name):
     """Test borderline case with many partial matches."""
-    pair = next((p for p in golden_pairs if p["name"] == "borderline_many_partial_matches"), None)
+    pair = _PAIRS_BY_NAME.get("borderline_many_partial_matches")
     assert pair is not None
     
-    cv = CandidateCVNormalized.model_validate(pair["cv"])
-    jd = JobDescriptionNormalized.model_validate(pair["jd"])
-    interview = InterviewSnapshot.model_validate(pair.get("interview", {}))
-    
-    endorsement = write_endorsement(cv, jd, interview)
-    text = endorsement.endorsement_text
+    data = endorsements_by_name[pair["name"]]
+    text = data["text"]
     
     # Should have many triangles (partial matches)
     if "expected_min_triangles" in pair:
-        triangle_count = text.count("△")
+        triangle_count = data["triangle_count"]
         assert triangle_count >= pair["expected_min_triangles"], \
             f"Expected at least {pair['expected_min_triangles']} △, got {triangle_count}"
     
@@ -147,21 +178,17 @@ def test_borderline_partial_matches(golden_pairs):
         "Borderline case should recommend Hold or Proceed (not Reject)"
 
 
-def test_weak_match_reject_recommendation(golden_pairs):
+def test_weak_match_reject_recommendation(endorsements_by_name):
     """Test that weak match candidate gets Reject recommendation."""
-    pair = next((p for p in golden_pairs if p["name"] == "weak_match_reject_candidate"), None)
+    pair = _PAIRS_BY_NAME.get("weak_match_reject_candidate")
     assert pair is not None
     
-    cv = CandidateCVNormalized.model_validate(pair["cv"])
-    jd = JobDescriptionNormalized.model_validate(pair["jd"])
-    interview = InterviewSnapshot.model_validate(pair.get("interview", {}))
-    
-    endorsement = write_endorsement(cv, jd, interview)
-    text = endorsement.endorsement_text
+    data = endorsements_by_name[pair["name"]]
+    text = data["text"]
     
     # Should have X marks for missing requirements
     if "expected_min_xmarks" in pair:
-        xmark_count = text.count("✖")
+        xmark_count = data["xmark_count"]
         assert xmark_count >= pair["expected_min_xmarks"], \
             f"Expected at least {pair['expected_min_xmarks']} ✖, got {xmark_count}"
     
@@ -170,58 +197,41 @@ def test_weak_match_reject_recommendation(golden_pairs):
         f"Expected 'Reject' recommendation for weak match candidate"
 
 
-def test_evidence_quotes_present(golden_pairs):
+def test_evidence_quotes_present(endorsements_by_name):
     """Test that endorsements include evidence quotes for checkmarks."""
-    pair = next((p for p in golden_pairs if p["name"] == "perfect_match_backend_engineer"), None)
+    pair = _PAIRS_BY_NAME.get("perfect_match_backend_engineer")
     assert pair is not None
     
-    cv = CandidateCVNormalized.model_validate(pair["cv"])
-    jd = JobDescriptionNormalized.model_validate(pair["jd"])
-    interview = InterviewSnapshot.model_validate(pair.get("interview", {}))
-    
-    endorsement = write_endorsement(cv, jd, interview)
-    text = endorsement.endorsement_text
+    data = endorsements_by_name[pair["name"]]
+    text = data["text"]
     
     # If there are checkmarks, there should be evidence quotes
-    if "✔" in text:
+    if data["check_count"]:
         # Look for evidence quotes (typically in format: evidence: "quote")
-        has_evidence = 'evidence:' in text.lower() or '"' in text
+        has_evidence = 'evidence:' in data["lower"] or '"' in text
         assert has_evidence, \
             "Checkmarks should be accompanied by evidence quotes"
 
 
-def test_endorsement_word_count(golden_pairs):
+@pytest.mark.parametrize("pair_name", list(_PAIRS_BY_NAME))
+def test_endorsement_word_count(pair_name, endorsements_by_name):
     """Test that endorsements are within expected word count (~160-220 words)."""
-    for pair in golden_pairs:
-        cv = CandidateCVNormalized.model_validate(pair["cv"])
-        jd = JobDescriptionNormalized.model_validate(pair["jd"])
-        interview = InterviewSnapshot.model_validate(pair.get("interview", {}))
-        
-        endorsement = write_endorsement(cv, jd, interview)
-        text = endorsement.endorsement_text
-        word_count = len(text.split())
-        
-        # Should be concise but informative
-        assert word_count >= 100, \
-            f"Endorsement too short ({word_count} words) for {pair['name']}"
-        assert word_count <= 400, \
-            f"Endorsement too long ({word_count} words) for {pair['name']}"
+    word_count = endorsements_by_name[pair_name]["words"]
+    
+    # Should be concise but informative
+    assert word_count >= 100, \
+        f"Endorsement too short ({word_count} words) for {pair_name}"
+    assert word_count <= 400, \
+        f"Endorsement too long ({word_count} words) for {pair_name}"
 
 
-def test_all_golden_pairs_produce_valid_endorsements(golden_pairs):
+@pytest.mark.parametrize("pair_name", list(_PAIRS_BY_NAME))
+def test_all_golden_pairs_produce_valid_endorsements(pair_name, endorsements_by_name):
     """Regression test: ensure all golden pairs produce valid endorsements without errors."""
-    for pair in golden_pairs:
-        cv = CandidateCVNormalized.model_validate(pair["cv"])
-        jd = JobDescriptionNormalized.model_validate(pair["jd"])
-        interview = InterviewSnapshot.model_validate(pair.get("interview", {}))
-        
-        # Should not raise any exceptions
-        endorsement = write_endorsement(cv, jd, interview)
-        
-        # Should produce non-empty text
-        assert endorsement.endorsement_text
-        assert len(endorsement.endorsement_text.strip()) > 0, \
-            f"Empty endorsement produced for {pair['name']}"
-
-
-
+    # Generating the cache would have raised on any error
+    text = endorsements_by_name[pair_name]["text"]
+    
+    # Should produce non-empty text
+    assert text
+    assert len(text.strip()) > 0, \
+        f"Empty endorsement produced for {pair_name}"
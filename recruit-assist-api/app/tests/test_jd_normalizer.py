@@ -1,3 +1,10 @@
+import asyncio
+from fastapi import Response
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+from app.database import Base
+from app.db_models import JobPosting
+from app.routers.normalize import JDNormalizeIn, normalize_jd_endpoint
 from app.services.jd_normalizer import normalize_jd
 
 def test_normalize_jd_defaults_and_weights():
@@ -8,3 +15,20 @@ def test_normalize_jd_defaults_and_weights():
     assert max(weights) <= 1.0
 
 
+
+
+def test_renormalizing_same_jd_updates_the_saved_posting():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        job_ids = []
+        for salary_max in (95000, 99000):
+            payload = JDNormalizeIn(text="We need Node, AWS, SQL", title="Backend Engineer", client="TechCorp",
+                                    salary_min=85000, salary_max=salary_max)
+            response = Response()
+            asyncio.run(normalize_jd_endpoint(payload=payload, response=response, use_llm=False, save_to_db=True, db=db))
+            job_ids.append(response.headers["X-Job-Id"])
+
+        assert job_ids[0] == job_ids[1]
+        assert db.scalar(select(func.count()).select_from(JobPosting)) == 1
+        assert db.scalar(select(JobPosting.salary_band_max)) == 99000
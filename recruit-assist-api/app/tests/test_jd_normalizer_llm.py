@@ -2,70 +2,56 @@ import pytest
 import json
 from app.models import JobDescriptionNormalized
 from app.services import jd_normalizer_llm
-
-
-class DummyMessage:
-    def __init__(self, text):
-        self.content = text
-
-
-class DummyChoice:
-    def __init__(self, text):
-        self.message = DummyMessage(text)
-
-
-class DummyResp:
-    def __init__(self, text):
-        self.choices = [DummyChoice(text)]
-
-
-class DummyClient:
-    class chat:
-        class completions:
-            @staticmethod
-            def create(model, messages, **kwargs):
-                # Return a valid JobDescriptionNormalized JSON structure
-                jd_json = {
-                    "job": {
-                        "title": "Senior Backend Engineer",
-                        "client": "TechCorp Ltd",
-                        "department": "Engineering",
-                        "location_policy": "hybrid",
-                        "onsite_days_per_week": 2,
-                        "primary_location": {
-                            "city": "London",
-                            "country": "UK"
-                        },
-                        "salary_band": {
-                            "min": 85000,
-                            "max": 95000,
-                            "currency": "GBP",
-                            "period": "year"
-                        },
-                        "visa_sponsorship": "case_by_case",
-                        "hiring_urgency": "this_quarter"
-                    },
-                    "requirements": {
-                        "must_haves": [
-                            {"name": "Node.js & TypeScript", "weight": 0.3},
-                            {"name": "AWS (Lambda/ECS/RDS)", "weight": 0.25},
-                            {"name": "SQL & data modelling", "weight": 0.15}
-                        ],
-                        "nice_to_haves": [
-                            {"name": "Kafka/event-driven", "weight": 0.05},
-                            {"name": "Kubernetes", "weight": 0.05}
-                        ],
-                        "years_experience_min": 5,
-                        "education_required": None
-                    },
-                    "role_notes": "Extracted from free-text JD using LLM"
-                }
-                return DummyResp(json.dumps(jd_json))
-
-
-def test_normalize_jd_llm_monkeypatch(monkeypatch):
-    monkeypatch.setattr(jd_normalizer_llm, "get_openai", lambda: DummyClient())
-
+from app.tests._llm_stubs import make_client, make_resp
+
+
+# A valid JobDescriptionNormalized JSON structure, serialised once and returned by every call
+_JD_JSON = json.dumps({
+    "job": {
+        "title": "Senior Backend Engineer",
+        "client": "TechCorp Ltd",
+        "department": "Engineering",
+        "location_policy": "hybrid",
+        "onsite_days_per_week": 2,
+        "primary_location": {
+            "city": "London",
+            "country": "UK"
+        },
+        "salary_band": {
+            "min": 85000,
+            "max": 95000,
+            "currency": "GBP",
+            "period": "year"
+        },
+        "visa_sponsorship": "case_by_case",
+        "hiring_urgency": "this_quarter"
+    },
+    "requirements": {
+        "must_haves": [
+            {"name": "Node.js & TypeScript", "weight": 0.3},
+            {"name": "AWS (Lambda/ECS/RDS)", "weight": 0.25},
+            {"name": "SQL & data modelling", "weight": 0.15}
+        ],
+        "nice_to_haves": [
+            {"name": "Kafka/event-driven", "weight": 0.05},
+            {"name": "Kubernetes", "weight": 0.05}
+        ],
+        "years_experience_min": 5,
+        "education_required": None
+    },
+    "role_notes": "Extracted from free-text JD using LLM"
+})
+_JD_RESP = make_resp(_JD_JSON)
+_DUMMY_CLIENT = make_client(lambda model, messages, **kwargs: _JD_RESP)
+
+
+@pytest.fixture(autouse=True)
+def _patch_openai(monkeypatch):
+    """Route every test's OpenAI calls to the shared dummy client (tests may re-patch)."""
+    monkeypatch.setattr(jd_normalizer_llm, "get_openai", lambda: _DUMMY_CLIENT)
+
+
+def test_normalize_jd_llm_monkeypatch():
     # Test with free-text JD
     result = jd_normalizer_llm.normalize_jd_llm(
         text="We're looking for a Senior Backend Engineer to join our team. Must have Node.js, TypeScript, and AWS experience. Hybrid role in London. Salary: £85-95k."
@@ -85,9 +71,7 @@ def test_normalize_jd_llm_monkeypatch(monkeypatch):
     assert any("Node.js" in req.name for req in result.requirements.must_haves)
 
 
-def test_normalize_jd_llm_with_hints(monkeypatch):
-    monkeypatch.setattr(jd_normalizer_llm, "get_openai", lambda: DummyClient())
-
+def test_normalize_jd_llm_with_hints():
     # Test with structured hints (should be passed to LLM as overrides)
     result = jd_normalizer_llm.normalize_jd_llm(
         text="Looking for a backend engineer...",
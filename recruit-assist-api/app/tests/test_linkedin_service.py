@@ -0,0 +1,247 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import time
+import httpx
+import pytest
+from app.models import ToneProfile
+from app.routers import tone
+from app.services import linkedin_service as linkedin_module
+from app.services.linkedin_service import linkedin_service, LinkedInService, LinkedInAPIError, LinkedInEvent, TokenBucket, LINKEDIN_API_BASE_URL, MESSAGES_PATH
+
+
+def make_service(handler):
+    service = LinkedInService()
+    service.api_key = "key"
+    service.api_secret = "secret"
+    service.linkedin_api_enabled = True
+    service._client = httpx.AsyncClient(base_url=LINKEDIN_API_BASE_URL, transport=httpx.MockTransport(handler))
+    return service
+
+
+def test_send_message_posts_to_messaging_api():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(201, headers={"x-restli-id": "msg-123"})
+
+    service = make_service(handler)
+    result = asyncio.run(service.send_message("urn:li:person:abc", "Hello"))
+
+    assert result["message_id"] == "msg-123"
+    assert result["status"] == "sent"
+    assert requests[0].url.path == "/v2/messages"
+    assert json.loads(requests[0].content)["recipients"] == ["urn:li:person:abc"]
+
+
+def test_token_bucket_spaces_acquisitions():
+    async def run():
+        bucket = TokenBucket(rate=50.0, capacity=1.0)
+        start = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+        return time.monotonic() - start
+
+    # First token is immediate, the next two wait ~1/50s each
+    assert asyncio.run(run()) >= 0.035
+
+
+def test_retry_after_pauses_bucket():
+    service = make_service(lambda request: httpx.Response(429, headers={"Retry-After": "2"}))
+    service.max_send_attempts = 1
+    bucket = service._buckets[MESSAGES_PATH]
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(service.send_message("urn:li:person:abc", "Hello"))
+
+    assert bucket.tokens <= -2 * bucket.rate
+
+
+def test_webhook_events_are_queued_and_processed():
+    service = LinkedInService()
+    handled = []
+
+    async def handle_webhook(webhook_data):
+        handled.append(webhook_data)
+
+    service.handle_webhook = handle_webhook
+
+    async def run():
+        service.start_webhook_workers()
+        queued = service.enqueue_webhook({"event_type": "MESSAGE_READ", "message_id": "m1"})
+        await service.stop_webhook_workers()
+        return queued
+
+    assert asyncio.run(run()) is True
+    assert handled == [LinkedInEvent(event_type="MESSAGE_READ", message_id="m1")]
+    assert service.enqueue_webhook({"event_type": "MESSAGE_READ"}) is False
+
+
+def test_get_profile_data_caches_and_single_flights():
+    service = LinkedInService()
+    calls = []
+
+    async def fetch(profile_url):
+        calls.append(profile_url)
+        await asyncio.sleep(0.01)
+        return {"url": profile_url}
+
+    service._fetch_profile_data = fetch
+
+    async def run():
+        first = await asyncio.gather(*(service.get_profile_data("https://linkedin.com/in/a") for _ in range(5)))
+        second = await service.get_profile_data("https://linkedin.com/in/a")
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert calls == ["https://linkedin.com/in/a"]
+    assert all(result == {"url": "https://linkedin.com/in/a"} for result in first)
+    assert second == first[0]
+
+
+def test_concurrent_messages_are_sent_as_one_batch():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        elements = json.loads(request.content)["elements"]
+        return httpx.Response(200, json={"elements": [
+            {"status": 201, "id": f"msg-{i}"} if i != 1 else {"status": 403, "error": "not connected"}
+            for i in range(len(elements))
+        ]})
+
+    service = make_service(handler)
+
+    async def run():
+        return await asyncio.gather(
+            *(service.send_message(f"urn:li:person:{i}", "Hello") for i in range(3)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+    assert len(requests) == 1
+    assert requests[0].headers["X-RestLi-Method"] == "BATCH_CREATE"
+    assert results[0]["message_id"] == "msg-0"
+    assert isinstance(results[1], LinkedInAPIError)
+    assert results[2]["message_id"] == "msg-2"
+
+
+def test_incoming_message_uses_sender_profile_name():
+    service = LinkedInService()
+
+    async def fetch(member_urn):
+        return {"first_name": "Priya"}
+
+    service._fetch_profile_data = fetch
+    result = asyncio.run(service.handle_webhook({
+        "event_type": "MESSAGE_RECEIVED",
+        "sender_urn": "urn:li:person:abc",
+        "message_text": "Yes, interested - please share the JD",
+    }))
+
+    assert result["status"] == "processed"
+    assert result["intent"] == "request_jd"
+    assert "Priya" in result["response"]
+
+
+def test_tone_snapshot_reloads_after_update():
+    service = LinkedInService()
+    original = service._current_tone()
+    assert service._current_tone() is original
+
+    updated = ToneProfile(persona_name="Sam from Bershaw")
+    asyncio.run(tone.set_tone(updated))
+    try:
+        assert service._current_tone() is updated
+    finally:
+        asyncio.run(tone.set_tone(original))
+
+
+def test_verify_webhook_signature():
+    service = LinkedInService()
+    service._webhook_hmac = hmac.new(b"webhook-secret", digestmod=hashlib.sha256)
+    body = b'{"event_type": "MESSAGE_READ"}'
+    signature = hmac.new(b"webhook-secret", body, hashlib.sha256).hexdigest()
+
+    assert service.verify_webhook_signature(body, signature) is True
+    assert service.verify_webhook_signature(body + b" ", signature) is False
+    assert service.verify_webhook_signature(body, "not-hex") is False
+    assert service.verify_webhook_signature(body, None) is False
+
+
+WEBHOOK_BODY = json.dumps({"event_type": "MESSAGE_READ", "data": {"event_type": "MESSAGE_READ", "message_id": "m1"}}).encode()
+
+
+def post_webhook(client, signature):
+    headers = {"Content-Type": "application/json", "X-LI-Signature": signature}
+    return client.post("/linkedin/webhook", content=WEBHOOK_BODY, headers=headers)
+
+
+@pytest.fixture
+def signed_webhooks(monkeypatch):
+    """Require X-LI-Signature on the app's LinkedIn service; yields a valid signature for WEBHOOK_BODY."""
+    monkeypatch.setattr(linkedin_service, "_webhook_hmac", hmac.new(b"webhook-secret", digestmod=hashlib.sha256))
+    return hmac.new(b"webhook-secret", WEBHOOK_BODY, hashlib.sha256).hexdigest()
+
+
+def test_webhook_route_queues_signed_event(client, signed_webhooks, monkeypatch):
+    # A queue without workers, so the event stays put for inspection
+    queue = asyncio.Queue()
+    monkeypatch.setattr(linkedin_service, "_event_queue", queue)
+
+    r = post_webhook(client, signed_webhooks)
+
+    assert r.status_code == 202
+    assert r.json()["result"] == {"status": "queued"}
+    assert queue.get_nowait() == LinkedInEvent(event_type="MESSAGE_READ", message_id="m1")
+
+
+@pytest.mark.parametrize("queue_size", [None, 1], ids=["not_started", "full"])
+def test_webhook_route_returns_503_when_queue_unavailable(client, signed_webhooks, monkeypatch, queue_size):
+    queue = None
+    if queue_size is not None:
+        queue = asyncio.Queue(maxsize=queue_size)
+        queue.put_nowait(LinkedInEvent(event_type="MESSAGE_READ"))
+    monkeypatch.setattr(linkedin_service, "_event_queue", queue)
+
+    r = post_webhook(client, signed_webhooks)
+
+    assert r.status_code == 503
+
+
+def test_webhook_route_rejects_bad_signature(client, signed_webhooks, monkeypatch):
+    queue = asyncio.Queue()
+    monkeypatch.setattr(linkedin_service, "_event_queue", queue)
+
+    r = post_webhook(client, "00" * 32)
+
+    assert r.status_code == 401
+    assert queue.empty()
+
+
+def test_transient_errors_are_retried(monkeypatch):
+    monkeypatch.setattr(linkedin_module, "RETRY_BACKOFF_INITIAL_SECONDS", 0.001)
+    responses = iter([
+        httpx.Response(503),
+        httpx.Response(502),
+        httpx.Response(201, headers={"x-restli-id": "msg-ok"}),
+    ])
+    service = make_service(lambda request: next(responses))
+
+    result = asyncio.run(service.send_message("urn:li:person:abc", "Hello"))
+    assert result["message_id"] == "msg-ok"
+
+
+def test_client_errors_are_not_retried():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(400)
+
+    service = make_service(handler)
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(service.send_message("urn:li:person:abc", "Hello"))
+    assert len(calls) == 1
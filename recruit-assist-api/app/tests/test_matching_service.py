@@ -0,0 +1,259 @@
+import asyncio
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+from app.database import Base
+from app.db_models import Candidate, CandidateProfile, JobPosting
+from app.routers.matching import BulkMatchRequest, create_bulk_match
+from app.services import matching_service
+from app.services.matching_service import (
+    _check_skill_match,
+    _rank_candidates,
+    _top_matches,
+    calculate_experience_score,
+    calculate_match_score,
+    compile_scorer,
+    prepare_job_ctx,
+    score_candidate_with_ctx,
+)
+from app.settings import get_settings
+from app.services.skill_index import build_skill_vocab, normalize_skill_name, skill_bits
+
+
+def make_candidate(**overrides):
+    data = dict(
+        id="cand-1",
+        full_name="Alex Smith",
+        skills=[{"name": "Python"}, {"name": "PostgreSQL"}, {"name": "Amazon Web Services"}],
+        experience=[
+            {"start_date": "2015-01", "end_date": "2019-01", "technologies": ["Django", "Docker"]},
+            {"start_date": "2019-01", "end_date": "2023-07", "technologies": ["FastAPI", "Kubernetes"]},
+        ],
+        location_country="UK",
+        location_city="Manchester",
+        remote_preference="hybrid",
+        right_to_work=["UK"],
+        target_compensation={"base_min": 80000, "base_max": 90000, "currency": "GBP"},
+    )
+    data.update(overrides)
+    return SimpleNamespace(**data)
+
+
+def make_job(**overrides):
+    data = dict(
+        id="job-1",
+        title="Senior Backend Engineer",
+        client="RetailTech Ltd",
+        requirements={
+            "must_haves": [
+                {"name": "Python", "weight": 0.3},
+                {"name": "Postgres", "weight": 0.2},
+                {"name": "AWS Lambda", "weight": 0.2},
+            ],
+            "nice_to_haves": [{"name": "Kubernetes", "weight": 0.1}, {"name": "Kafka", "weight": 0.1}],
+            "years_experience_min": 5,
+        },
+        primary_location_country="UK",
+        primary_location_city="Manchester",
+        location_policy="hybrid",
+        salary_band_min=85000,
+        salary_band_max=95000,
+        salary_currency="GBP",
+    )
+    data.update(overrides)
+    return SimpleNamespace(**data)
+
+
+def test_check_skill_match_exact_partial_and_technology():
+    skills = ["Python", "Amazon Web Services", "Data Science"]
+    technologies = ["Kubernetes"]
+
+    assert _check_skill_match("python", skills, technologies) == (1.0, "Python")
+    assert _check_skill_match("AWS Lambda", skills, technologies) == (1.0, "Amazon Web Services")
+    assert _check_skill_match("Data Engineering", skills, technologies) == (0.5, "Data Science")
+    assert _check_skill_match("Kubernetes", skills, technologies) == (1.0, "Kubernetes")
+    assert _check_skill_match("Rust", skills, technologies) == (0.0, "")
+
+
+def test_calculate_match_score_breakdown():
+    score, details = calculate_match_score(make_candidate(), make_job())
+
+    assert details["skills"]["must_have_score"] == pytest.approx(1.0)
+    assert details["skills"]["nice_have_score"] == pytest.approx(0.5)
+    assert details["experience"]["years_actual"] == 8.5
+    assert details["location"] == {"location_match": True, "remote_compatibility": True, "right_to_work": True}
+    assert details["salary"]["reason"] == "Partial overlap"
+    assert score == pytest.approx(details["overall_score"], abs=1e-3)
+    assert score == pytest.approx(0.35 + 0.10 * 0.5 + 0.20 + 0.15 + 0.10 * 0.75 + 0.10)
+
+
+def test_calculate_match_score_handles_missing_data():
+    candidate = make_candidate(skills=[], experience=[], right_to_work=None, target_compensation=None)
+    job = make_job(requirements={"must_haves": [{"name": "Go"}], "nice_to_haves": []}, salary_band_min=None)
+
+    score, details = calculate_match_score(candidate, job)
+
+    assert details["skills"]["must_have_score"] == 0.0
+    assert details["experience"]["score"] == 1.0
+    assert details["salary"]["reason"] == "Insufficient salary data"
+    assert details["location"]["right_to_work"] is False
+    assert 0.0 <= score <= 1.0
+
+
+def test_top_matches_ranks_filters_and_skips_errors():
+    items = [SimpleNamespace(id=i, score=score) for i, score in enumerate([0.2, 0.9, None, 0.5, 0.9, 0.1])]
+
+    top = _top_matches(items, lambda item: item.score + 0.0, min_score=0.15, limit=3, kind="candidate")
+
+    assert [(score, item.id) for score, item in top] == [(0.9, 1), (0.9, 4), (0.5, 3)]
+
+
+def test_build_skill_vocab_gives_one_bit_per_canonical_name():
+    vocab = build_skill_vocab(["Python", " python ", "nodejs", "Node.js", "Kafka"])
+
+    assert vocab == {"python": 0, "node.js": 1, "kafka": 2}
+
+
+def test_experience_score_counts_current_role_up_to_now_month():
+    experience = [{"start_date": "2020-03", "end_date": None}, {"start_date": "2018", "end_date": "2019-01"}]
+    now_month = 2024 * 12 + 3
+
+    score, details = calculate_experience_score(5, experience, now_month=now_month)
+
+    assert details["years_actual"] == 5.0
+    assert score == 1.0
+
+
+def test_normalize_skill_name_rewrites_whole_word_aliases_only():
+    assert normalize_skill_name("Node") == "node.js"
+    assert normalize_skill_name("Node.js") == "node.js"
+    assert normalize_skill_name("Postgres") == normalize_skill_name("PostgreSQL") == "postgresql"
+    assert normalize_skill_name("AWS Lambda") == "amazon web services lambda"
+    assert normalize_skill_name("JSON") == "json"
+
+
+def test_rank_candidates_in_parallel_chunks_matches_in_process(monkeypatch):
+    ctx = prepare_job_ctx(make_job())
+    rows = [
+        make_candidate(id=i, location_country=country, skills=[{"name": skill}])
+        for i, (country, skill) in enumerate(
+            [("UK", "Python"), ("US", "Go"), ("UK", "Kafka"), ("US", "Python"), ("UK", "Python"), ("FR", "Java")]
+        )
+    ]
+    in_process = _rank_candidates(rows, ctx, min_score=0.0, limit=4)
+    assert matching_service._process_pool is None  # in-process unless PARALLEL_MATCH_WORKERS is set
+
+    parallel_settings = get_settings().model_copy(update={"parallel_match_workers": 2, "parallel_match_min_rows": 4})
+    monkeypatch.setattr(matching_service, "get_settings", lambda: parallel_settings)
+    monkeypatch.setattr(matching_service, "PARALLEL_MATCH_CHUNK_SIZE", 2)
+    try:
+        parallel = _rank_candidates(rows, ctx, min_score=0.0, limit=4)
+        assert matching_service._process_pool is not None
+    finally:
+        matching_service.shutdown_process_pool()
+
+    assert [(score, row.id) for score, row in parallel] == [(score, row.id) for score, row in in_process]
+
+
+@pytest.mark.parametrize("job_overrides", [
+    {},
+    {"requirements": {"must_haves": [], "nice_to_haves": []}},
+    {"salary_band_min": None, "location_policy": "remote"},
+])
+def test_compiled_scorer_matches_full_score(job_overrides):
+    ctx = prepare_job_ctx(make_job(**job_overrides))
+    scorer = compile_scorer(ctx)
+
+    for candidate in (make_candidate(), make_candidate(skills=[], target_compensation=None, right_to_work=["FR"])):
+        assert scorer(candidate) == score_candidate_with_ctx(candidate, ctx)[0]
+
+
+def test_match_score_cache_is_keyed_on_record_versions(monkeypatch):
+    calls = []
+
+    def score(candidate, job):
+        calls.append((candidate.id, job.id))
+        return 0.5, {}
+
+    monkeypatch.setattr(matching_service, "calculate_match_score", score)
+    monkeypatch.setattr(matching_service, "_match_cache", matching_service.TTLCache(maxsize=10, ttl=60))
+    candidate = make_candidate(updated_at=datetime(2024, 1, 1))
+    job = make_job(updated_at=datetime(2024, 1, 1))
+
+    matching_service._cached_match_score(candidate, job)
+    matching_service._cached_match_score(candidate, job)
+    assert len(calls) == 1
+
+    candidate.updated_at = datetime(2024, 2, 1)
+    matching_service._cached_match_score(candidate, job)
+    assert len(calls) == 2
+
+
+def test_coarse_candidate_score_only_when_job_has_location_fields():
+    assert matching_service._coarse_candidate_score(prepare_job_ctx(make_job())) is not None
+    job = make_job(primary_location_country=None, location_policy=None)
+    assert matching_service._coarse_candidate_score(prepare_job_ctx(job)) is None
+
+
+def test_coarse_candidate_score_escapes_like_wildcards():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        db.add(Candidate(full_name="Alex Smith", right_to_work=["UK"], location_country="UK"))
+        db.commit()
+
+        def coarse_score(country):
+            job = make_job(primary_location_country=country, location_policy=None)
+            return db.scalar(select(matching_service._coarse_candidate_score(prepare_job_ctx(job))))
+
+        assert coarse_score("UK") > 0
+        assert coarse_score("U_") == 0  # "_" is literal, not a one-character wildcard
+        assert coarse_score("%") == 0
+
+
+def test_skill_bits_set_one_bit_per_canonical_skill_in_vocab():
+    vocab = build_skill_vocab(["PostgreSQL", "Kafka"])
+    bits = skill_bits(["Postgres", "PostgreSQL", "Python"], vocab)
+
+    assert bits == 1 << vocab["postgresql"]
+    assert len(vocab) == 2  # names outside the vocab don't grow it
+
+
+@pytest.mark.parametrize("job_band", [(85000, 95000, "GBP"), (85000, 85000, None), (85000, 0, "gbp"), (85000, None, "GBP")])
+def test_salary_scorer_matches_calculate_salary_score(job_band):
+    scorer = matching_service._salary_scorer(*job_band)
+    targets = [
+        (None, None, None), (90000, None, "GBP"), (90000, 92000, "usd"), (80000, 90000, "GBP"),
+        (70000, 80000, None), (120000, 150000, "GBP"), (80000, None, "GBP"), (86000, 99000, "gbp"),
+    ]
+
+    for target in targets:
+        try:
+            expected = matching_service.calculate_salary_score(*job_band, *target)[0]
+        except TypeError:
+            continue
+        assert scorer(*target) == expected
+
+
+def test_bulk_match_route_upserts_one_profile_per_candidate():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        job = JobPosting(title="Senior Backend Engineer", client="RetailTech Ltd", requirements=make_job().requirements)
+        candidates = [
+            Candidate(full_name="Alex Smith", skills=[{"name": "Python"}], experience=[], education=[]),
+            Candidate(full_name="Sam Jones", skills=[{"name": "Kafka"}], experience=[], education=[]),
+        ]
+        db.add_all([job, *candidates])
+        db.commit()
+        request = BulkMatchRequest(candidate_ids=[c.id for c in candidates] + [uuid.uuid4()])
+
+        first = asyncio.run(create_bulk_match(job_id=job.id, request=request, db=db))
+        second = asyncio.run(create_bulk_match(job_id=job.id, request=request, db=db))
+
+        assert first["matched"] == second["matched"] == 2
+        assert [m["candidate_id"] for m in first["matches"]] == [str(c.id) for c in candidates]
+        assert db.scalar(select(func.count()).select_from(CandidateProfile)) == 2
@@ -1,5 +1,5 @@
 from app.models import (
-    CandidateCVNormalized, JobDescriptionNormalized, InterviewSnapshot
+    CandidateCVNormalized, JobDescriptionNormalized, InterviewSnapshot, compile_template
 )
 
 def test_candidate_model_validation():
@@ -54,3 +54,9 @@ def test_interview_snapshot_validation():
     assert "architecture" in iv.motivation
 
 
+
+
+def test_compiled_template_matches_str_format():
+    for template in ("Hi {first_name}, {{literal}} from {company}.", "No fields", "{score:.2f} {name!r}"):
+        values = {"first_name": "Peter", "company": "Bershaw", "score": 0.5, "name": "x", "unused": 1}
+        assert compile_template(template)(**values) == template.format(**values)
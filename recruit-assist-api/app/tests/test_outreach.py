@@ -1,18 +1,12 @@
-from fastapi.testclient import TestClient
-from app.main import create_app
+from app.models import ToneProfile
+from app.services.outreach_writer import connection_note, followup_after_accept
 
-client = TestClient(create_app())
 
+# The exact-text checks call the template writers directly; the route-reply tests go through HTTP.
 def test_draft_connect_exact_text():
-    payload = {
-        "first_name": "Peter",
-        "role_title": "Country Manager",
-        "location": "Davao",
-        "work_mode": "hybrid",
-    }
-    r = client.post("/outreach/draft/connect", json=payload)
-    assert r.status_code == 200
-    text = r.json()["text"]
+    text = connection_note(
+        ToneProfile(), first_name="Peter", role_title="Country Manager", location="Davao", work_mode="hybrid"
+    )
 
     # This must exactly match your stored template with variables filled.
     expected = (
@@ -24,16 +18,14 @@ def test_draft_connect_exact_text():
     assert text == expected
 
 def test_draft_after_accept_exact_text():
-    r = client.post("/outreach/draft/after-accept", json={"first_name": "Peter"})
-    assert r.status_code == 200
-    text = r.json()["text"]
+    text = followup_after_accept(ToneProfile(), first_name="Peter")
     expected = (
         "Sure, Peter. Please see the attached JD. I'll wait for your CV. "
         "How much is your current and expected salary? How long is your notice period?"
     )
     assert text == expected
 
-def test_route_reply_positive_reply_triggers_salary_notice_jd():
+def test_route_reply_positive_reply_triggers_salary_notice_jd(client):
     payload = {
         "first_name": "Peter",
         "message_text": "Hi Jean thank you for the message, sure Jean kindly share my CV and again thanks indeed",
@@ -48,7 +40,7 @@ def test_route_reply_positive_reply_triggers_salary_notice_jd():
         "How much is your current and expected salary? How long is your notice period?"
     )
 
-def test_route_reply_cv_attached_path():
+def test_route_reply_cv_attached_path(client):
     payload = {
         "first_name": "Peter",
         "message_text": "Please find my CV attached. Thanks!",
@@ -61,7 +53,7 @@ def test_route_reply_cv_attached_path():
     assert "current and expected salary" in body["reply"].lower()
     assert "notice period" in body["reply"].lower()
 
-def test_route_reply_decline_path():
+def test_route_reply_decline_path(client):
     payload = {
         "first_name": "Peter",
         "message_text": "Thanks, but not interested at the moment.",
@@ -73,7 +65,7 @@ def test_route_reply_decline_path():
     assert body["intent"] == "decline"
     assert "appreciate the reply" in body["reply"].lower()
 
-def test_route_reply_unknown_fallback():
+def test_route_reply_unknown_fallback(client):
     payload = {
         "first_name": "Peter",
         "message_text": "👋",
@@ -1,34 +1,95 @@
-import pytest
+import asyncio
+from types import SimpleNamespace
 from app.models import ToneProfile
-from app.services import outreach_llm
+from app.services import llm, outreach_llm, outreach_writer
+from app.tests._llm_stubs import make_client, make_resp
 
 
-class DummyMessage:
-    def __init__(self, text):
-        self.content = text
+_CONNECT_RESP = make_resp("Hi Peter, I'm Jean from Bershaw. They're hiring a Country Manager in Davao (hybrid). Are you currently exploring? If so, can you please send your updated CV?")
+_DUMMY_CLIENT = make_client(lambda model, messages, **kwargs: _CONNECT_RESP)
 
 
-class DummyChoice:
-    def __init__(self, text):
-        self.message = DummyMessage(text)
+def test_draft_connect_llm_monkeypatch(monkeypatch):
+    monkeypatch.setattr(outreach_llm, "get_openai", lambda: _DUMMY_CLIENT)
+    tp = ToneProfile()
+    text = outreach_llm.draft_connect_llm(tp, first_name="Peter", role_title="Country Manager", location="Davao", work_mode="hybrid")
+    assert "Are you currently exploring?" in text
+    assert "updated CV" in text
 
 
-class DummyResp:
-    def __init__(self, text):
-        self.choices = [DummyChoice(text)]
+def test_draft_connect_llm_batch_keeps_order_and_concurrency_limit(monkeypatch):
+    in_flight = 0
+    peak = 0
 
+    async def create(model, messages, **kwargs):
+        nonlocal in_flight, peak
+        first_name = messages[1]["content"].split("first_name=")[1].split("\n")[0]
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Earlier recipients finish last, so gather order is what keeps the output aligned
+        await asyncio.sleep(0.01 if first_name.endswith("0") else 0)
+        in_flight -= 1
+        return make_resp(f"Hi {first_name}, are you currently exploring?")
 
-class DummyClient:
-    class chat:
-        class completions:
-            @staticmethod
-            def create(model, messages, **kwargs):
-                return DummyResp("Hi Peter, I'm Jean from Bershaw. They're hiring a Country Manager in Davao (hybrid). Are you currently exploring? If so, can you please send your updated CV?")
+    client = make_client(create)
+    monkeypatch.setattr(outreach_llm, "get_async_openai", lambda: client)
+    monkeypatch.setattr(outreach_llm, "BATCH_MAX_CONCURRENCY", 3)
+    names = [f"Candidate{i}" for i in range(10)]
+    specs = [
+        {"first_name": name, "role_title": "Country Manager", "location": "Davao", "work_mode": "hybrid"}
+        for name in names
+    ]
 
+    texts = asyncio.run(outreach_llm.draft_connect_llm_batch(ToneProfile(), specs))
 
-def test_draft_connect_llm_monkeypatch(monkeypatch):
-    monkeypatch.setattr(outreach_llm, "get_openai", lambda: DummyClient())
-    tp = ToneProfile()
-    text = outreach_llm.draft_connect_llm(tp, first_name="Peter", role_title="Country Manager", location="Davao", work_mode="hybrid")
-    assert "Are you currently exploring?" in text
-    assert "updated CV" in text
+    assert texts == [f"Hi {name}, are you currently exploring?" for name in names]
+    assert peak == 3
+
+
+def test_local_llm_client_targets_local_server(monkeypatch):
+    monkeypatch.setattr(llm.settings, "use_local_llm", True)
+    monkeypatch.setattr(llm.settings, "openai_api_key", "")
+    llm.get_openai.cache_clear()
+    try:
+        client = llm.get_openai()
+        assert str(client.base_url).startswith(llm.settings.local_llm_base_url)
+    finally:
+        llm.get_openai.cache_clear()
+
+
+def test_connection_note_llm_joins_streamed_chunks(monkeypatch):
+    def chunk(text):
+        return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+    def create(model, messages, stream=False, **kwargs):
+        assert stream is True
+        return iter([chunk("Hi Peter, "), chunk(None), SimpleNamespace(choices=[]), chunk("are you exploring? ")])
+
+    client = make_client(create)
+    monkeypatch.setattr(outreach_writer, "get_openai", lambda: client)
+    monkeypatch.setattr(outreach_writer, "_note_cache", outreach_writer.TTLCache(maxsize=10, ttl=60))
+    text = outreach_writer.connection_note_llm(
+        ToneProfile(), first_name="Peter", role_title="Country Manager", location="Davao", work_mode="hybrid"
+    )
+    assert text == "Hi Peter, are you exploring?"
+
+
+def test_connection_note_llm_reuses_draft_across_first_names(monkeypatch):
+    calls = []
+
+    def create(model, messages, **kwargs):
+        calls.append(messages[1]["content"])
+        return iter([SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(
+            content=f"Hi {outreach_writer.NAME_PLACEHOLDER}, are you currently exploring?"
+        ))])])
+
+    client = make_client(create)
+    monkeypatch.setattr(outreach_writer, "get_openai", lambda: client)
+    monkeypatch.setattr(outreach_writer, "_note_cache", outreach_writer.TTLCache(maxsize=10, ttl=60))
+    kwargs = dict(role_title="Country Manager", location="Davao", work_mode="hybrid")
+
+    first = outreach_writer.connection_note_llm(ToneProfile(), first_name="Peter", **kwargs)
+    second = outreach_writer.connection_note_llm(ToneProfile(), first_name="Maria", **kwargs)
+
+    assert (first, second) == ("Hi Peter, are you currently exploring?", "Hi Maria, are you currently exploring?")
+    assert len(calls) == 1
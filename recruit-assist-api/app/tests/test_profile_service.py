@@ -0,0 +1,92 @@
+import asyncio
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from app.database import Base
+from app.db_models import Candidate, JobPosting, ProfileStatus
+from app.db_schemas import CandidateProfileCreate, CandidateProfileUpdate
+from app.routers.profiles import create_profile_endpoint
+from app.services import profile_service
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def profile(db):
+    candidate = Candidate(full_name="Alex Smith")
+    db.add(candidate)
+    db.commit()
+    return profile_service.create_profile(db, CandidateProfileCreate(
+        candidate_id=candidate.id, profile_name="Backend - RetailTech", interview_notes="Strong on Python"
+    ))
+
+
+def test_update_profile_applies_only_set_fields_and_explicit_none_clears(db, profile):
+    updated = profile_service.update_profile(
+        db, profile.id, CandidateProfileUpdate(interview_notes=None, status=ProfileStatus.SHORTLISTED)
+    )
+
+    assert updated.interview_notes is None
+    assert updated.profile_name == "Backend - RetailTech"
+    assert updated.status == ProfileStatus.SHORTLISTED
+
+
+def test_update_profile_keeps_status_on_explicit_none(db, profile):
+    updated = profile_service.update_profile(db, profile.id, CandidateProfileUpdate(status=None))
+
+    assert updated.status == ProfileStatus.ACTIVE
+
+
+def test_create_profile_endpoint_returns_409_for_duplicate_candidate_and_job(db):
+    candidate = Candidate(full_name="Alex Smith")
+    job = JobPosting(title="Backend Engineer", client="RetailTech", requirements={})
+    db.add_all([candidate, job])
+    db.commit()
+    data = CandidateProfileCreate(candidate_id=candidate.id, job_posting_id=job.id)
+    asyncio.run(create_profile_endpoint(profile_data=data, db=db))
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(create_profile_endpoint(profile_data=data, db=db))
+
+    assert exc_info.value.status_code == 409
+    assert "IntegrityError" not in str(exc_info.value.detail)
+
+
+def count_statements(db, fn):
+    statements = []
+    engine = db.get_bind()
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    return len(statements)
+
+
+@pytest.mark.parametrize("n_profiles", [2, 6])
+def test_get_profiles_by_job_load_related_uses_fixed_number_of_queries(db, n_profiles):
+    job = JobPosting(title="Backend Engineer", client="RetailTech", requirements={})
+    candidates = [Candidate(full_name=f"Candidate {i}") for i in range(n_profiles)]
+    db.add_all([job, *candidates])
+    db.commit()
+    for candidate in candidates:
+        profile_service.create_profile(db, CandidateProfileCreate(candidate_id=candidate.id, job_posting_id=job.id))
+    job_id = job.id
+
+    def list_and_touch(load_related):
+        db.expunge_all()  # start cold so relationships can't come from the identity map
+        profiles = profile_service.get_profiles_by_job(db, job_id, load_related=load_related)
+        assert len(profiles) == n_profiles
+        return [(p.candidate.full_name, p.job_posting.title) for p in profiles]
+
+    # Profiles, then one query each for their candidates and job postings
+    assert count_statements(db, lambda: list_and_touch(True)) == 3
+    assert count_statements(db, lambda: list_and_touch(False)) == 1 + n_profiles + 1
@@ -0,0 +1,28 @@
+import pytest
+from app.models import ToneProfile
+from app.services.reply_router import classify, next_message
+
+
+@pytest.mark.parametrize("text, intent", [
+    ("Yes, sounds good", "positive_reply"),
+    ("Sure - can you share the JD?", "request_jd"),
+    ("Yes! Here is my CV", "cv_attached"),
+    ("Interesting, but not interested right now", "decline"),
+    ("Thanks for reaching out", "unknown"),
+    ("My passport is ready", "unknown"),
+])
+def test_classify_picks_highest_priority_intent(text, intent):
+    assert classify(text) == intent
+
+
+def test_long_replies_are_classified_in_full():
+    assert classify("Thanks for the message. " * 40 + "Not interested.") == "decline"
+
+
+def test_next_message_follows_edited_templates():
+    tone = ToneProfile()
+    first = next_message("positive_reply", "Sam", jd_link_available=True, tone=tone)
+    assert first == tone.templates["after_accept_send_jd"].format(first_name="Sam")
+
+    tone.templates["after_accept_send_jd"] = "Thanks {first_name}, JD below."
+    assert next_message("positive_reply", "Sam", jd_link_available=True, tone=tone) == "Thanks Sam, JD below."
@@ -0,0 +1,11 @@
+from app.settings import Settings, get_settings, settings
+
+
+def test_get_settings_returns_shared_instance():
+    assert isinstance(settings, Settings)
+    assert get_settings() is get_settings() is settings
+
+
+def test_settings_include_full_configuration():
+    for field in ("openai_api_key", "database_url", "calendly_api_key", "hirevue_api_key", "linkedin_api_key"):
+        assert hasattr(settings, field)
@@ -1,9 +1,4 @@
-from fastapi.testclient import TestClient
-from app.main import create_app
-
-client = TestClient(create_app())
-
-def test_default_tone_templates_snapshot():
+def test_default_tone_templates_snapshot(client):
     r = client.get("/tone/profile")
     assert r.status_code == 200
     tp = r.json()
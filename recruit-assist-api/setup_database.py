@@ -12,8 +12,27 @@ import sys
 import os
 from pathlib import Path
 
+# Project directory (holds alembic.ini and the alembic/ scripts)
+_HERE = Path(__file__).resolve().parent
+_VERSIONS = _HERE / "alembic" / "versions"
+
+# Tables the app's models define
+EXPECTED_TABLES = ("candidates", "job_postings", "candidate_profiles")
+
 # Add current directory to path
-sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(_HERE))
+
+try:
+    from alembic import command
+    from alembic.config import Config
+    from alembic.runtime.migration import MigrationContext
+    from alembic.script import ScriptDirectory
+    from sqlalchemy import inspect
+    from app.settings import settings
+    from app.database import check_db_connection, ensure_schema, get_engine, init_db
+except ImportError:
+    # Missing packages are reported by check_dependencies() before any of these are used
+    pass
 
 def check_dependencies():
     """Check if required dependencies are installed."""
@@ -44,9 +63,6 @@ def check_dependencies():
 def check_database_connection():
     """Check if we can connect to the database."""
     try:
-        from app.settings import settings
-        from app.database import get_engine, check_db_connection
-        
         print(f"\nDatabase Configuration:")
         print(f"   URL: {settings.database_url.split('@')[-1] if '@' in settings.database_url else 'Not set'}")
         
@@ -70,98 +86,89 @@ def check_database_connection():
 
 def check_migrations():
     """Check if migrations exist."""
-    versions_dir = Path(__file__).parent / "alembic" / "versions"
-    if versions_dir.exists():
-        migrations = list(versions_dir.glob("*.py"))
-        # Filter out __pycache__ and __init__
-        migrations = [m for m in migrations if m.stem not in ["__init__", "__pycache__"]]
-        return len(migrations)
+    if _VERSIONS.exists():
+        # Migration modules, excluding __init__.py (__pycache__ has no .py suffix)
+        return sum(1 for m in _VERSIONS.iterdir() if m.suffix == ".py" and m.stem != "__init__")
     return 0
 
+def _alembic_config():
+    """Alembic config for this project, usable from any working directory."""
+    cfg = Config(str(_HERE / "alembic.ini"))
+    cfg.set_main_option("script_location", str(_HERE / "alembic"))
+    return cfg
+
 def create_initial_migration():
     """Create initial migration using Alembic."""
-    import subprocess
-    
     print(f"\nCreating initial migration...")
     
     try:
-        # Run alembic revision --autogenerate
-        result = subprocess.run(
-            ["alembic", "revision", "--autogenerate", "-m", "Initial migration - create candidates, job_postings, candidate_profiles tables"],
-            cwd=Path(__file__).parent,
-            capture_output=True,
-            text=True
+        # Same as: alembic revision --autogenerate, run in-process
+        script = command.revision(
+            _alembic_config(),
+            message="Initial migration - create candidates, job_postings, candidate_profiles tables",
+            autogenerate=True,
         )
-        
-        if result.returncode == 0:
-            print("[OK] Initial migration created successfully")
-            # Show the migration file
-            versions_dir = Path(__file__).parent / "alembic" / "versions"
-            if versions_dir.exists():
-                migrations = sorted(versions_dir.glob("*.py"), key=lambda x: x.stat().st_mtime, reverse=True)
-                migrations = [m for m in migrations if m.stem not in ["__init__", "__pycache__"]]
-                if migrations:
-                    print(f"   Migration file: {migrations[0].name}")
-            return True
-        else:
-            print(f"[ERROR] Failed to create migration")
-            print(f"Error: {result.stderr}")
-            return False
+        print("[OK] Initial migration created successfully")
+        # Show the migration file
+        if script is not None and not isinstance(script, list):
+            print(f"   Migration file: {Path(script.path).name}")
+        return True
     except Exception as e:
         print(f"[ERROR] Error creating migration: {e}")
         return False
 
+def _migrations_up_to_date(cfg):
+    """Whether the database is already at the migration head.
+
+    Uses the app's pooled engine, so the connection opened by the earlier
+    connection check is reused instead of Alembic opening a fresh one.
+    """
+    head = ScriptDirectory.from_config(cfg).get_current_head()
+    with get_engine().connect() as conn:
+        return head is not None and MigrationContext.configure(conn).get_current_revision() == head
+
 def run_migrations():
     """Run Alembic migrations."""
-    import subprocess
-    
     print(f"\nRunning migrations...")
     
     try:
-        result = subprocess.run(
-            ["alembic", "upgrade", "head"],
-            cwd=Path(__file__).parent,
-            capture_output=True,
-            text=True
-        )
-        
-        if result.returncode == 0:
-            print("[OK] Migrations applied successfully")
-            if result.stdout:
-                print(result.stdout)
-            return True
+        cfg = _alembic_config()
+        if _migrations_up_to_date(cfg):
+            print("[OK] Database is already at the latest migration")
         else:
-            print(f"[ERROR] Failed to run migrations")
-            print(f"Error: {result.stderr}")
-            return False
+            # Same as: alembic upgrade head, run in-process (progress is logged by alembic)
+            command.upgrade(cfg, "head")
+            print("[OK] Migrations applied successfully")
+        # Indexes added to the models after the initial migration, and PostgreSQL-only ones
+        # autogenerate can't see, are created here (also on databases already at head)
+        with get_engine().begin() as conn:
+            ensure_schema(conn)
+        print("[OK] Indexes up to date")
+        return True
     except Exception as e:
-        print(f"[ERROR] Error running migrations: {e}")
+        print(f"[ERROR] Failed to run migrations")
+        print(f"Error: {e}")
         return False
 
 def verify_tables():
     """Verify that tables were created."""
     try:
-        from sqlalchemy import inspect
-        from app.database import get_engine
-        
         engine = get_engine()
         inspector = inspect(engine)
-        tables = inspector.get_table_names()
+        tables = set(inspector.get_table_names())
         
-        expected_tables = ["candidates", "job_postings", "candidate_profiles"]
         alembic_version = "alembic_version"
         
-        print(f"\nDatabase Tables:")
-        for table in expected_tables:
-            if table in tables:
-                print(f"   [OK] {table}")
-            else:
-                print(f"   [ERROR] {table} - NOT FOUND")
-        
+        lines = ["\nDatabase Tables:"]
+        lines.extend(
+            f"   [OK] {table}" if table in tables else f"   [ERROR] {table} - NOT FOUND"
+            for table in EXPECTED_TABLES
+        )
         if alembic_version in tables:
-            print(f"   [OK] {alembic_version} (migration tracking)")
+            lines.append(f"   [OK] {alembic_version} (migration tracking)")
+        print("\n".join(lines))
         
-        all_found = all(table in tables for table in expected_tables)
+        all_found = all(table in tables for table in EXPECTED_TABLES)
         return all_found
     except Exception as e:
         print(f"[ERROR] Error verifying tables: {e}")
@@ -171,8 +178,6 @@ def create_tables_directly():
     """Fallback: Create tables directly without migrations."""
     try:
         print(f"\nAttempting direct table creation (fallback)...")
-        from app.database import init_db
-        
         init_db()
         print("[OK] Tables created directly")
         return True
@@ -10,6 +10,9 @@ from pathlib import Path
 # Add current directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+# Tables the app's models define
+EXPECTED_TABLES = ("candidates", "job_postings", "candidate_profiles")
+
 def setup_sqlite_database():
     """Set up SQLite database and create tables."""
     try:
@@ -38,18 +41,15 @@ def setup_sqlite_database():
         from sqlalchemy import inspect
         engine = get_engine()
         inspector = inspect(engine)
-        tables = inspector.get_table_names()
-        
-        expected_tables = ["candidates", "job_postings", "candidate_profiles"]
+        tables = set(inspector.get_table_names())
         
-        print("Database Tables:")
-        all_found = True
-        for table in expected_tables:
-            if table in tables:
-                print(f"  [OK] {table}")
-            else:
-                print(f"  [MISSING] {table}")
-                all_found = False
+        lines = ["Database Tables:"]
+        lines.extend(
+            f"  [OK] {table}" if table in tables else f"  [MISSING] {table}"
+            for table in EXPECTED_TABLES
+        )
+        print("\n".join(lines))
+        all_found = all(table in tables for table in EXPECTED_TABLES)
         
         if all_found:
             print()
@@ -6,42 +6,71 @@ This script:
 2. Extracts key fields (full name, phone, email, location, experience, skills, etc.)
 3. Validates against expected output structure
 4. Generates a comparison report
+
+Results are streamed to cv_test_results.jsonl, one JSON record per CV followed
+by a summary record. Pass --verbose to include each CV's full parser output.
+
+Parsed CVs are cached in .cv_cache/ by file content, so re-runs only parse new
+or changed files. Pass --no-cache to force a fresh parse (e.g. after changing
+the parser, prompt or API key).
 """
 
+import os
 import sys
 import json
+import argparse
+import hashlib
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
 # Add parent directory to path to import app modules
 sys.path.insert(0, str(Path(__file__).parent))
 
-from app.services.cv_parser_llm import parse_cv_bytes_to_normalized_llm
-from app.services.cv_parser import parse_cv_bytes_to_normalized
-from app.models import CandidateCVNormalized
+# The app modules (pydantic models, OpenAI SDK, PDF/DOCX readers) are imported
+# where they're first needed, so the script exits fast when there's nothing to parse
+if TYPE_CHECKING:
+    from app.models import CandidateCVNormalized
+
+# Parsing is dominated by LLM round-trips, so CVs are parsed on a thread pool
+MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+# Parsed CVs are cached here, keyed by parser and file content hash
+CACHE_DIR = Path(__file__).parent / ".cv_cache"
+
 
+def _cache_path(cv_bytes: bytes, use_llm: bool) -> Path:
+    """Cache file for a CV's parse; BLAKE2b is fast and no cryptographic guarantee is needed."""
+    key = hashlib.blake2b(cv_bytes, digest_size=16).hexdigest()
+    return CACHE_DIR / f"{'llm' if use_llm else 'stub'}-{key}.json"
 
-def extract_key_fields(cv: CandidateCVNormalized) -> Dict[str, Any]:
+
+def _year_month(value: str) -> Tuple[int, int]:
+    """Parse a 'YYYY' or 'YYYY-MM' date into (year, month); month defaults to 1."""
+    parts = value.split('-', 2)
+    return int(parts[0]), int(parts[1]) if len(parts) > 1 else 1
+
+
+def extract_key_fields(cv: "CandidateCVNormalized") -> Dict[str, Any]:
     """Extract key fields from parsed CV for comparison."""
     candidate = cv.candidate
     
     # Calculate total experience from experience items
     total_years = 0.0
     if cv.experience:
+        now = datetime.now()
         for exp in cv.experience:
             if exp.start_date:
                 try:
-                    start_year = int(exp.start_date.split('-')[0])
-                    start_month = int(exp.start_date.split('-')[1]) if len(exp.start_date.split('-')) > 1 else 1
+                    start_year, start_month = _year_month(exp.start_date)
                     
                     if exp.end_date:
-                        end_year = int(exp.end_date.split('-')[0])
-                        end_month = int(exp.end_date.split('-')[1]) if len(exp.end_date.split('-')) > 1 else 1
+                        end_year, end_month = _year_month(exp.end_date)
                     else:
                         # Current role
-                        end_year = datetime.now().year
-                        end_month = datetime.now().month
+                        end_year, end_month = now.year, now.month
                     
                     # Calculate months
                     months = (end_year - start_year) * 12 + (end_month - start_month)
@@ -104,65 +133,93 @@ def extract_key_fields(cv: CandidateCVNormalized) -> Dict[str, Any]:
     }
 
 
-def test_cv_file(cv_path: Path, use_llm: bool = True) -> Dict[str, Any]:
-    """Test parsing a single CV file."""
-    print(f"\n{'='*60}")
-    print(f"Testing: {cv_path.name}")
-    print(f"{'='*60}")
+def test_cv_file(cv_path: Path, use_llm: bool = True, verbose: bool = False, use_cache: bool = True) -> Dict[str, Any]:
+    """Test parsing a single CV file.
+
+    The report for the file is printed in one go at the end, so reports from
+    CVs parsed in parallel don't interleave.
+    """
+    from app.models import CandidateCVNormalized
+    from app.services.cv_parser import parse_cv_bytes_to_normalized
+    from app.services.cv_parser_llm import parse_cv_bytes_to_normalized_llm
+    
+    lines = [
+        f"\n{'='*60}",
+        f"Testing: {cv_path.name}",
+        f"{'='*60}",
+    ]
     
     try:
         # Read CV file
         with open(cv_path, 'rb') as f:
             cv_bytes = f.read()
         
-        print(f"File size: {len(cv_bytes)} bytes")
+        lines.append(f"File size: {len(cv_bytes)} bytes")
         
-        # Parse CV
-        if use_llm:
-            print("Using LLM parser...")
-            cv = parse_cv_bytes_to_normalized_llm(cv_bytes, filename=cv_path.name)
+        # Parse CV (or reuse the cached parse of identical bytes)
+        cache_file = _cache_path(cv_bytes, use_llm) if use_cache else None
+        if cache_file is not None and cache_file.exists():
+            lines.append("Using cached parse...")
+            cv = CandidateCVNormalized.model_validate_json(cache_file.read_text(encoding="utf-8"))
         else:
-            print("Using stub parser...")
-            cv = parse_cv_bytes_to_normalized(cv_bytes, filename=cv_path.name)
+            if use_llm:
+                lines.append("Using LLM parser...")
+                cv = parse_cv_bytes_to_normalized_llm(cv_bytes, filename=cv_path.name)
+            else:
+                lines.append("Using stub parser...")
+                cv = parse_cv_bytes_to_normalized(cv_bytes, filename=cv_path.name)
+            if cache_file is not None:
+                CACHE_DIR.mkdir(exist_ok=True)
+                cache_file.write_text(cv.model_dump_json(), encoding="utf-8")
         
         # Extract key fields
         extracted = extract_key_fields(cv)
         
-        # Print summary
-        print(f"\n✓ Parsed successfully!")
-        print(f"  Name: {extracted['full_name']}")
-        print(f"  Email: {extracted['email']}")
-        print(f"  Phone: {extracted['phone']}")
-        print(f"  Location: {extracted['location']['city']}, {extracted['location']['country']}")
-        print(f"  Experience: {extracted['total_experience_years']} years" if extracted['total_experience_years'] else "  Experience: Not calculated")
-        print(f"  Roles: {len(extracted['roles'])}")
-        print(f"  Skills: {len(extracted['skills'])}")
-        print(f"  Education: {len(extracted['education'])}")
-        print(f"  Certifications: {len(extracted['certifications'])}")
-        print(f"  Languages: {len(extracted['languages'])}")
-        print(f"  Notice Period: {extracted['notice_period_weeks']} weeks" if extracted['notice_period_weeks'] else "  Notice Period: Not specified")
-        print(f"  Right to Work: {', '.join(extracted['right_to_work']) if extracted['right_to_work'] else 'Not specified'}")
+        # Summary
+        lines += [
+            f"\n✓ Parsed successfully!",
+            f"  Name: {extracted['full_name']}",
+            f"  Email: {extracted['email']}",
+            f"  Phone: {extracted['phone']}",
+            f"  Location: {extracted['location']['city']}, {extracted['location']['country']}",
+            f"  Experience: {extracted['total_experience_years']} years" if extracted['total_experience_years'] else "  Experience: Not calculated",
+            f"  Roles: {len(extracted['roles'])}",
+            f"  Skills: {len(extracted['skills'])}",
+            f"  Education: {len(extracted['education'])}",
+            f"  Certifications: {len(extracted['certifications'])}",
+            f"  Languages: {len(extracted['languages'])}",
+            f"  Notice Period: {extracted['notice_period_weeks']} weeks" if extracted['notice_period_weeks'] else "  Notice Period: Not specified",
+            f"  Right to Work: {', '.join(extracted['right_to_work']) if extracted['right_to_work'] else 'Not specified'}",
+        ]
         
-        return {
+        result = {
             "file": cv_path.name,
             "success": True,
             "extracted": extracted,
-            "full_output": cv.model_dump_json(indent=2, exclude_none=True),
         }
+        if verbose:
+            result["full_output"] = cv.model_dump_json(indent=2, exclude_none=True)
+        return result
         
     except Exception as e:
-        print(f"\n✗ Error parsing CV: {e}")
-        import traceback
-        traceback.print_exc()
+        lines += [f"\n✗ Error parsing CV: {e}", traceback.format_exc()]
         return {
             "file": cv_path.name,
             "success": False,
             "error": str(e),
         }
+    
+    finally:
+        print("\n".join(lines), flush=True)
 
 
 def main():
     """Main function to test all CV files."""
+    parser = argparse.ArgumentParser(description="Parse the real CVs in the CV folder and report the extracted fields.")
+    parser.add_argument("--verbose", action="store_true", help="include each CV's full parser output in the results")
+    parser.add_argument("--no-cache", action="store_true", help="skip .cv_cache and parse every CV afresh")
+    args = parser.parse_args()
+    
     # Find CV folder (should be in parent directory)
     script_dir = Path(__file__).parent
     cv_folder = script_dir.parent / "CV"
@@ -180,29 +237,39 @@ def main():
     
     print(f"Found {len(cv_files)} CV files to test")
     
-    # Test each CV
-    results = []
-    for cv_file in sorted(cv_files):
-        result = test_cv_file(cv_file, use_llm=True)
-        results.append(result)
-    
-    # Save results to JSON
-    output_file = script_dir / "cv_test_results.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump({
-            "test_date": datetime.now().isoformat(),
-            "total_files": len(cv_files),
-            "successful": sum(1 for r in results if r.get("success")),
-            "failed": sum(1 for r in results if not r.get("success")),
-            "results": results,
-        }, f, indent=2, ensure_ascii=False)
+    # Test each CV and write each result as soon as it's ready; map() keeps file order
+    output_file = script_dir / "cv_test_results.jsonl"
+    n_ok = n_fail = 0
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor, \
+            open(output_file, 'w', encoding='utf-8') as f:
+        results = executor.map(
+            lambda cv_file: test_cv_file(cv_file, use_llm=True, verbose=args.verbose, use_cache=not args.no_cache), sorted(cv_files)
+        )
+        for result in results:
+            if result["success"]:
+                n_ok += 1
+            else:
+                n_fail += 1
+            f.write(json.dumps(result, ensure_ascii=False, default=str))
+            f.write("\n")
+            f.flush()
+        
+        f.write(json.dumps({
+            "summary": {
+                "test_date": datetime.now().isoformat(),
+                "total_files": len(cv_files),
+                "successful": n_ok,
+                "failed": n_fail,
+            },
+        }))
+        f.write("\n")
     
     print(f"\n{'='*60}")
     print(f"Test Summary")
     print(f"{'='*60}")
     print(f"Total files: {len(cv_files)}")
-    print(f"Successful: {sum(1 for r in results if r.get('success'))}")
-    print(f"Failed: {sum(1 for r in results if not r.get('success'))}")
+    print(f"Successful: {n_ok}")
+    print(f"Failed: {n_fail}")
     print(f"\nResults saved to: {output_file}")
 
 
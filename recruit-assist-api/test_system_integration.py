@@ -9,164 +9,224 @@ Tests the full workflow:
 5. Generate endorsement
 6. Update profile with endorsement
 
+Independent steps run concurrently; each test prints its report in one go
+when it finishes, so reports don't interleave.
+
 Run with: python test_system_integration.py
+Load test with: N_SCENARIOS=10 python test_system_integration.py
+(at most MAX_IN_FLIGHT requests, default 20, are sent at once;
+scenarios share the same sample JD and CV, so their lookups may return each
+other's rows; that is fine for measuring throughput)
 """
 
 import asyncio
 import httpx
 import json
+import os
+import time
 from typing import Optional, Dict, Any
 from uuid import UUID
 
 # Configuration
 API_BASE_URL = "http://localhost:8000"
 USE_LLM = True  # Set to False to use stub/rule-based parsers
+# Number of workflows to run at once; above 1 this becomes a throughput run
+N_SCENARIOS = int(os.getenv("N_SCENARIOS", "1"))
+# Cap on requests in flight, so a large N_SCENARIOS queues on the client
+# instead of overloading the server into 429/503s
+MAX_IN_FLIGHT = int(os.getenv("MAX_IN_FLIGHT", "20"))
+
+# Request bodies are built and encoded once, at import
+_JD_PAYLOAD = {
+    "text": """
+    We are looking for a Senior Backend Engineer to join our team.
+
+    Requirements:
+    - 5+ years of experience with Node.js and TypeScript
+    - Strong experience with AWS (Lambda, ECS, RDS)
+    - SQL and data modelling skills
+    - Experience with event-driven architectures (Kafka)
+
+    Location: Hybrid (2-3 days in office)
+    Location: London, UK
+    Salary: £85,000 - £95,000 per year
+
+    Visa sponsorship: Case by case
+    Hiring urgency: This quarter
+    """,
+    "title": "Senior Backend Engineer",
+    "client": "TechCorp",
+    "location_policy": "hybrid",
+    "city": "London",
+    "country": "UK",
+    "salary_min": 85000,
+    "salary_max": 95000,
+    "currency": "GBP"
+}
+_JD_BODY = json.dumps(_JD_PAYLOAD).encode("utf-8")
+
+# A simple text CV for testing
+_CV_TEXT_BYTES = """
+    John Doe
+    Email: john.doe@example.com
+    Phone: +44 7700 900000
+    Location: Manchester, UK
+    LinkedIn: https://www.linkedin.com/in/johndoe
+    
+    Experience:
+    Senior Backend Engineer at FintechCo (2022-01 to present)
+    - Design and implement REST APIs using Node.js and TypeScript
+    - Manage AWS infrastructure (ECS, RDS, Lambda)
+    - Optimize database queries and data models
+    - Reduced p95 latency by 40%
+    Technologies: Node.js, TypeScript, PostgreSQL, AWS ECS, Kafka
+    
+    Skills:
+    - Node.js (Expert)
+    - TypeScript (Expert)
+    - AWS (Advanced)
+    - SQL (Advanced)
+    - Kafka (Intermediate)
+    
+    Education:
+    BSc Computer Science, University of Manchester (2018-2021)
+    
+    Right to work: UK
+    Notice period: 4 weeks
+    Target compensation: £85,000 - £90,000 per year
+    """.encode("utf-8")
+_CV_FILES = {"file": ("test_cv.txt", _CV_TEXT_BYTES, "text/plain")}
+
+
+class _BoundedTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that allows at most `max_in_flight` requests at once.
+
+    A connection limit alone doesn't do this over HTTP/2, where one
+    connection carries any number of concurrent requests.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_in_flight: int):
+        self._transport = transport
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        async with self._semaphore:
+            return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
 
 
 async def test_health_check(client: httpx.AsyncClient) -> bool:
     """Test health check endpoint."""
-    print("\n=== Testing Health Check ===")
+    lines = ["\n=== Testing Health Check ==="]
     try:
-        response = await client.get(f"{API_BASE_URL}/healthz")
+        response = await client.get("/healthz")
         response.raise_for_status()
         data = response.json()
-        print(f"✓ Health check passed: {data}")
+        lines.append(f"✓ Health check passed: {data}")
         return data.get("ok", False) and data.get("database") == "connected"
     except Exception as e:
-        print(f"✗ Health check failed: {e}")
+        lines.append(f"✗ Health check failed: {e}")
         return False
+    
+    finally:
+        print("\n".join(lines), flush=True)
 
 
 async def test_normalize_jd(client: httpx.AsyncClient) -> Optional[UUID]:
     """Test JD normalization and save to database."""
-    print("\n=== Testing JD Normalization ===")
+    lines = ["\n=== Testing JD Normalization ==="]
     try:
-        payload = {
-            "text": """
-            We are looking for a Senior Backend Engineer to join our team.
-            
-            Requirements:
-            - 5+ years of experience with Node.js and TypeScript
-            - Strong experience with AWS (Lambda, ECS, RDS)
-            - SQL and data modelling skills
-            - Experience with event-driven architectures (Kafka)
-            
-            Location: Hybrid (2-3 days in office)
-            Location: London, UK
-            Salary: £85,000 - £95,000 per year
-            
-            Visa sponsorship: Case by case
-            Hiring urgency: This quarter
-            """,
-            "title": "Senior Backend Engineer",
-            "client": "TechCorp",
-            "location_policy": "hybrid",
-            "city": "London",
-            "country": "UK",
-            "salary_min": 85000,
-            "salary_max": 95000,
-            "currency": "GBP"
-        }
-        
         response = await client.post(
-            f"{API_BASE_URL}/normalize/jd",
-            json=payload,
+            "/normalize/jd",
+            content=_JD_BODY,
+            headers={"Content-Type": "application/json"},
             params={"use_llm": USE_LLM, "save_to_db": True}
         )
         response.raise_for_status()
         jd_data = response.json()
         
-        print(f"✓ JD normalized successfully")
-        print(f"  Title: {jd_data.get('job', {}).get('title')}")
-        print(f"  Client: {jd_data.get('job', {}).get('client')}")
+        job = jd_data.get('job') or {}
+        lines.append(f"✓ JD normalized successfully")
+        lines.append(f"  Title: {job.get('title')}")
+        lines.append(f"  Client: {job.get('client')}")
+        
+        # The saved job's ID comes back in a header
+        job_id = response.headers.get("X-Job-Id")
+        if job_id:
+            lines.append(f"✓ Job saved to database: {job_id}")
+            return UUID(job_id)
         
-        # Get job ID from database
-        jobs_response = await client.get(f"{API_BASE_URL}/jobs/?client=TechCorp&limit=1")
+        # No ID when the save failed; look the job up
+        jobs_response = await client.get("/jobs/?client=TechCorp&limit=1")
         if jobs_response.status_code == 200:
             jobs = jobs_response.json()
             if jobs:
                 job_id = jobs[0]["id"]
-                print(f"✓ Job saved to database: {job_id}")
+                lines.append(f"✓ Job saved to database: {job_id}")
                 return UUID(job_id)
         
-        print("⚠ Job normalized but not found in database")
+        lines.append("⚠ Job normalized but not found in database")
         return None
         
+    except httpx.HTTPStatusError as e:
+        lines.append(f"✗ JD normalization failed: {e}")
+        lines.append(f"  Response: {e.response.text}")
+        return None
     except Exception as e:
-        print(f"✗ JD normalization failed: {e}")
-        if hasattr(e, 'response'):
-            print(f"  Response: {e.response.text}")
+        lines.append(f"✗ JD normalization failed: {e}")
         return None
+    
+    finally:
+        print("\n".join(lines), flush=True)
 
 
 async def test_upload_cv(client: httpx.AsyncClient) -> Optional[UUID]:
     """Test CV upload and save to database."""
-    print("\n=== Testing CV Upload ===")
+    lines = ["\n=== Testing CV Upload ==="]
     try:
-        # Create a simple text CV for testing
-        cv_text = """
-        John Doe
-        Email: john.doe@example.com
-        Phone: +44 7700 900000
-        Location: Manchester, UK
-        LinkedIn: https://www.linkedin.com/in/johndoe
-        
-        Experience:
-        Senior Backend Engineer at FintechCo (2022-01 to present)
-        - Design and implement REST APIs using Node.js and TypeScript
-        - Manage AWS infrastructure (ECS, RDS, Lambda)
-        - Optimize database queries and data models
-        - Reduced p95 latency by 40%
-        Technologies: Node.js, TypeScript, PostgreSQL, AWS ECS, Kafka
-        
-        Skills:
-        - Node.js (Expert)
-        - TypeScript (Expert)
-        - AWS (Advanced)
-        - SQL (Advanced)
-        - Kafka (Intermediate)
-        
-        Education:
-        BSc Computer Science, University of Manchester (2018-2021)
-        
-        Right to work: UK
-        Notice period: 4 weeks
-        Target compensation: £85,000 - £90,000 per year
-        """
-        
-        files = {
-            "file": ("test_cv.txt", cv_text.encode('utf-8'), "text/plain")
-        }
-        
         response = await client.post(
-            f"{API_BASE_URL}/ingest/cv",
-            files=files,
+            "/ingest/cv",
+            files=_CV_FILES,
             params={"use_llm": USE_LLM, "save_to_db": True, "consent_granted": True}
         )
         response.raise_for_status()
         cv_data = response.json()
         
-        print(f"✓ CV parsed successfully")
-        print(f"  Name: {cv_data.get('candidate', {}).get('full_name')}")
-        print(f"  Email: {cv_data.get('candidate', {}).get('email')}")
+        candidate = cv_data.get('candidate') or {}
+        lines.append(f"✓ CV parsed successfully")
+        lines.append(f"  Name: {candidate.get('full_name')}")
+        lines.append(f"  Email: {candidate.get('email')}")
         
-        # Get candidate ID from database
-        candidates_response = await client.get(f"{API_BASE_URL}/candidates/?search=John&limit=1")
+        # The saved candidate's ID comes back in a header
+        candidate_id = response.headers.get("X-Candidate-Id")
+        if candidate_id:
+            lines.append(f"✓ Candidate saved to database: {candidate_id}")
+            return UUID(candidate_id)
+        
+        # No ID when the save failed; look the candidate up
+        candidates_response = await client.get("/candidates/?search=John&limit=1")
         if candidates_response.status_code == 200:
             candidates = candidates_response.json()
             if candidates:
                 candidate_id = candidates[0]["id"]
-                print(f"✓ Candidate saved to database: {candidate_id}")
+                lines.append(f"✓ Candidate saved to database: {candidate_id}")
                 return UUID(candidate_id)
         
-        print("⚠ CV parsed but candidate not found in database")
+        lines.append("⚠ CV parsed but candidate not found in database")
         return None
         
+    except httpx.HTTPStatusError as e:
+        lines.append(f"✗ CV upload failed: {e}")
+        lines.append(f"  Response: {e.response.text}")
+        return None
     except Exception as e:
-        print(f"✗ CV upload failed: {e}")
-        if hasattr(e, 'response'):
-            print(f"  Response: {e.response.text}")
+        lines.append(f"✗ CV upload failed: {e}")
         return None
+    
+    finally:
+        print("\n".join(lines), flush=True)
 
 
 async def test_match_candidate_to_job(
@@ -175,7 +235,7 @@ async def test_match_candidate_to_job(
     job_id: UUID
 ) -> Optional[Dict[str, Any]]:
     """Test matching candidate to job."""
-    print("\n=== Testing Candidate Matching ===")
+    lines = ["\n=== Testing Candidate Matching ==="]
     try:
         payload = {
             "candidate_id": str(candidate_id),
@@ -184,52 +244,60 @@ async def test_match_candidate_to_job(
         }
         
         response = await client.post(
-            f"{API_BASE_URL}/matching/match",
+            "/matching/match",
             json=payload
         )
         response.raise_for_status()
         match_data = response.json()
         
-        print(f"✓ Match successful")
-        print(f"  Match score: {match_data.get('match_score', 0):.3f} ({match_data.get('match_percentage', 0):.1f}%)")
-        print(f"  Profile ID: {match_data.get('profile_id')}")
+        lines.append(f"✓ Match successful")
+        lines.append(f"  Match score: {match_data.get('match_score', 0):.3f} ({match_data.get('match_percentage', 0):.1f}%)")
+        lines.append(f"  Profile ID: {match_data.get('profile_id')}")
         
         # Show breakdown
-        breakdown = match_data.get('match_details', {}).get('breakdown', {})
+        breakdown = (match_data.get('match_details') or {}).get('breakdown')
         if breakdown:
-            print(f"  Breakdown:")
+            lines.append(f"  Breakdown:")
             for key, value in breakdown.items():
-                print(f"    {key}: {value:.3f}")
+                lines.append(f"    {key}: {value:.3f}")
         
         return match_data
         
+    except httpx.HTTPStatusError as e:
+        lines.append(f"✗ Matching failed: {e}")
+        lines.append(f"  Response: {e.response.text}")
+        return None
     except Exception as e:
-        print(f"✗ Matching failed: {e}")
-        if hasattr(e, 'response'):
-            print(f"  Response: {e.response.text}")
+        lines.append(f"✗ Matching failed: {e}")
         return None
+    
+    finally:
+        print("\n".join(lines), flush=True)
 
 
 async def test_get_job_candidates(client: httpx.AsyncClient, job_id: UUID) -> bool:
     """Test getting candidates for a job."""
-    print("\n=== Testing Get Job Candidates ===")
+    lines = ["\n=== Testing Get Job Candidates ==="]
     try:
         response = await client.get(
-            f"{API_BASE_URL}/matching/jobs/{job_id}/candidates/top",
+            f"/matching/jobs/{job_id}/candidates/top",
             params={"top_n": 10, "min_score": 0.5}
         )
         response.raise_for_status()
         candidates = response.json()
         
-        print(f"✓ Found {len(candidates)} candidates")
+        lines.append(f"✓ Found {len(candidates)} candidates")
         for i, candidate in enumerate(candidates[:3], 1):  # Show top 3
-            print(f"  {i}. {candidate.get('candidate_name')}: {candidate.get('match_score', 0):.3f}")
+            lines.append(f"  {i}. {candidate.get('candidate_name')}: {candidate.get('match_score', 0):.3f}")
         
         return True
         
     except Exception as e:
-        print(f"✗ Get job candidates failed: {e}")
+        lines.append(f"✗ Get job candidates failed: {e}")
         return False
+    
+    finally:
+        print("\n".join(lines), flush=True)
 
 
 async def test_profile_operations(
@@ -237,13 +305,13 @@ async def test_profile_operations(
     profile_id: str
 ) -> bool:
     """Test profile CRUD operations."""
-    print("\n=== Testing Profile Operations ===")
+    lines = ["\n=== Testing Profile Operations ==="]
     try:
         # Get profile
-        response = await client.get(f"{API_BASE_URL}/profiles/{profile_id}")
+        response = await client.get(f"/profiles/{profile_id}")
         response.raise_for_status()
         profile = response.json()
-        print(f"✓ Profile retrieved: {profile.get('profile_name')}")
+        lines.append(f"✓ Profile retrieved: {profile.get('profile_name')}")
         
         # Update interview data
         interview_update = {
@@ -257,28 +325,33 @@ async def test_profile_operations(
         }
         
         response = await client.patch(
-            f"{API_BASE_URL}/profiles/{profile_id}/interview",
+            f"/profiles/{profile_id}/interview",
             json=interview_update
         )
         response.raise_for_status()
-        print(f"✓ Interview data updated")
+        lines.append(f"✓ Interview data updated")
         
         # Update status
         status_update = {"status": "shortlisted"}
         response = await client.patch(
-            f"{API_BASE_URL}/profiles/{profile_id}",
+            f"/profiles/{profile_id}",
             json=status_update
         )
         response.raise_for_status()
-        print(f"✓ Status updated to: shortlisted")
+        lines.append(f"✓ Status updated to: shortlisted")
         
         return True
         
+    except httpx.HTTPStatusError as e:
+        lines.append(f"✗ Profile operations failed: {e}")
+        lines.append(f"  Response: {e.response.text}")
+        return False
     except Exception as e:
-        print(f"✗ Profile operations failed: {e}")
-        if hasattr(e, 'response'):
-            print(f"  Response: {e.response.text}")
+        lines.append(f"✗ Profile operations failed: {e}")
         return False
+    
+    finally:
+        print("\n".join(lines), flush=True)
 
 
 async def test_endorsement_generation(
@@ -287,14 +360,16 @@ async def test_endorsement_generation(
     job_id: UUID
 ) -> bool:
     """Test endorsement generation."""
-    print("\n=== Testing Endorsement Generation ===")
+    lines = ["\n=== Testing Endorsement Generation ==="]
     try:
-        # Get candidate and job data
-        candidate_response = await client.get(f"{API_BASE_URL}/candidates/{candidate_id}")
-        job_response = await client.get(f"{API_BASE_URL}/jobs/{job_id}")
+        # Get candidate and job data (independent lookups, fetched together)
+        candidate_response, job_response = await asyncio.gather(
+            client.get(f"/candidates/{candidate_id}"),
+            client.get(f"/jobs/{job_id}"),
+        )
         
         if candidate_response.status_code != 200 or job_response.status_code != 200:
-            print("⚠ Could not fetch candidate or job data")
+            lines.append("⚠ Could not fetch candidate or job data")
             return False
         
         # For now, use a simplified payload
@@ -313,23 +388,69 @@ async def test_endorsement_generation(
         }
         
         response = await client.post(
-            f"{API_BASE_URL}/endorsement/generate",
+            "/endorsement/generate",
             json=payload,
             params={"use_llm": USE_LLM}
         )
         response.raise_for_status()
         endorsement = response.json()
         
-        print(f"✓ Endorsement generated")
-        print(f"  Text preview: {endorsement.get('endorsement_text', '')[:100]}...")
+        lines.append(f"✓ Endorsement generated")
+        lines.append(f"  Text preview: {endorsement.get('endorsement_text', '')[:100]}...")
         
         return True
         
+    except httpx.HTTPStatusError as e:
+        lines.append(f"✗ Endorsement generation failed: {e}")
+        lines.append(f"  Response: {e.response.text}")
+        return False
     except Exception as e:
-        print(f"✗ Endorsement generation failed: {e}")
-        if hasattr(e, 'response'):
-            print(f"  Response: {e.response.text}")
+        lines.append(f"✗ Endorsement generation failed: {e}")
         return False
+    
+    finally:
+        print("\n".join(lines), flush=True)
+
+
+async def run_scenario(client: httpx.AsyncClient) -> Optional[Dict[str, Any]]:
+    """Run the workflow after the health check (tests 2-7) once.
+
+    Returns:
+        The job ID, candidate ID and match result, or None if a step the
+        rest depend on failed
+    """
+    # Tests 2-3 (normalize JD, upload CV) are independent, so each one's
+    # POST and database lookup overlap with the other's
+    job_id, candidate_id = await asyncio.gather(
+        test_normalize_jd(client),
+        test_upload_cv(client),
+    )
+    if not job_id:
+        print("\n✗ JD normalization failed. Cannot continue.")
+        return None
+    if not candidate_id:
+        print("\n✗ CV upload failed. Cannot continue.")
+        return None
+    
+    # Test 4: Match candidate to job
+    match_result = await test_match_candidate_to_job(client, candidate_id, job_id)
+    if not match_result:
+        print("\n✗ Matching failed. Cannot continue.")
+        return None
+    
+    profile_id = match_result.get("profile_id")
+    
+    # Tests 5-7 only need the IDs above, so they run concurrently
+    await asyncio.gather(
+        # Test 5: Get job candidates
+        test_get_job_candidates(client, job_id),
+        # Test 6: Profile operations
+        test_profile_operations(client, profile_id) if profile_id else asyncio.sleep(0),
+        # Test 7: Endorsement generation
+        test_endorsement_generation(client, candidate_id, job_id),
+    )
+    
+    return {"job_id": job_id, "candidate_id": candidate_id, "match_result": match_result}
 
 
 async def main():
@@ -339,57 +460,65 @@ async def main():
     print("=" * 60)
     print(f"API Base URL: {API_BASE_URL}")
     print(f"Using LLM: {USE_LLM}")
+    if N_SCENARIOS > 1:
+        print(f"Concurrent scenarios: {N_SCENARIOS}")
     print("=" * 60)
     
-    async with httpx.AsyncClient(timeout=120.0) as client:
+    # HTTP/2 multiplexes the concurrent tests over one connection when API_BASE_URL
+    # is https (plain http stays on HTTP/1.1 keep-alive); one retry covers a
+    # dropped connection. The client ignores http2/limits when given a transport,
+    # so they are set on the transport itself.
+    transport = _BoundedTransport(
+        httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_connections=MAX_IN_FLIGHT, max_keepalive_connections=MAX_IN_FLIGHT),
+            retries=1,
+        ),
+        MAX_IN_FLIGHT,
+    )
+    # Requests use paths relative to the API base URL
+    async with httpx.AsyncClient(base_url=API_BASE_URL, timeout=120.0, transport=transport) as client:
         # Test 1: Health check
         if not await test_health_check(client):
             print("\n✗ Health check failed. Is the server running?")
             return
         
-        # Test 2: Normalize JD
-        job_id = await test_normalize_jd(client)
-        if not job_id:
-            print("\n✗ JD normalization failed. Cannot continue.")
-            return
-        
-        # Test 3: Upload CV
-        candidate_id = await test_upload_cv(client)
-        if not candidate_id:
-            print("\n✗ CV upload failed. Cannot continue.")
-            return
-        
-        # Test 4: Match candidate to job
-        match_result = await test_match_candidate_to_job(client, candidate_id, job_id)
-        if not match_result:
-            print("\n✗ Matching failed. Cannot continue.")
-            return
-        
-        profile_id = match_result.get("profile_id")
-        
-        # Test 5: Get job candidates
-        await test_get_job_candidates(client, job_id)
-        
-        # Test 6: Profile operations
-        if profile_id:
-            await test_profile_operations(client, profile_id)
-        
-        # Test 7: Endorsement generation
-        await test_endorsement_generation(client, candidate_id, job_id)
-        
+        started = time.perf_counter()
+        results = await asyncio.gather(*(run_scenario(client) for _ in range(N_SCENARIOS)))
+        elapsed = time.perf_counter() - started
+    
+    if N_SCENARIOS > 1:
+        n_ok = sum(1 for r in results if r)
         print("\n" + "=" * 60)
-        print("INTEGRATION TEST COMPLETE")
+        print("LOAD RUN COMPLETE")
         print("=" * 60)
-        print("\nSummary:")
-        print(f"  ✓ Health check: PASSED")
-        print(f"  ✓ JD normalization: PASSED (Job ID: {job_id})")
-        print(f"  ✓ CV upload: PASSED (Candidate ID: {candidate_id})")
-        print(f"  ✓ Matching: PASSED (Match score: {match_result.get('match_score', 0):.3f})")
-        print(f"  ✓ Profile operations: PASSED")
-        print(f"  ✓ Endorsement generation: PASSED")
-        print("\nAll core features are working!")
-
+        print(f"  Scenarios completed: {n_ok}/{N_SCENARIOS}")
+        print(f"  Elapsed: {elapsed:.1f}s ({N_SCENARIOS / elapsed:.2f} scenarios/s)")
+        return
+    
+    result = results[0]
+    if not result:
+        return
+    
+    print("\n" + "=" * 60)
+    print("INTEGRATION TEST COMPLETE")
+    print("=" * 60)
+    print("\nSummary:")
+    print(f"  ✓ Health check: PASSED")
+    print(f"  ✓ JD normalization: PASSED (Job ID: {result['job_id']})")
+    print(f"  ✓ CV upload: PASSED (Candidate ID: {result['candidate_id']})")
+    print(f"  ✓ Matching: PASSED (Match score: {result['match_result'].get('match_score', 0):.3f})")
+    print(f"  ✓ Profile operations: PASSED")
+    print(f"  ✓ Endorsement generation: PASSED")
+    print("\nAll core features are working!")
 
 if __name__ == "__main__":
+    # uvloop (installed with uvicorn[standard], except on Windows) schedules the
+    # concurrent tests with less overhead; fall back to the default loop without it
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
 